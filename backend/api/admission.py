@@ -0,0 +1,134 @@
+"""Admission control - per-endpoint concurrency limits with a bounded wait queue."""
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Callable, Deque, Dict
+
+from fastapi import Depends, HTTPException
+
+from config import settings
+from domain.models import Job
+
+
+def overloaded(status_code: int, detail: str) -> HTTPException:
+    """A 429 or 503 error telling the client when to retry."""
+    return HTTPException(
+        status_code=status_code,
+        detail=detail,
+        headers={"Retry-After": str(settings.admission_retry_after)},
+    )
+
+
+class AdmissionGate:
+    """
+    Concurrency limit for one endpoint, with a bounded FIFO wait queue.
+
+    Up to `limit` requests run at once. Up to `queue_size` more wait for a
+    slot, each for at most `timeout` seconds; a freed slot is handed to the
+    oldest waiter. A request finding the queue full is rejected with 429,
+    one that waited too long with 503, both with Retry-After.
+
+    Waiters are plain futures of the running loop, so a gate is not bound
+    to one event loop.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.rejected = 0  # Queue was full
+        self.timed_out = 0  # Waited longer than `timeout`
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        """Requests waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Take a slot, waiting in the queue if none is free; pair with `release`."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise overloaded(429, f"Too many concurrent {self.name} requests")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.timeout)
+        except BaseException as e:
+            # Timed out or cancelled after being handed a slot: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            if not isinstance(e, asyncio.TimeoutError):
+                raise
+            self.timed_out += 1
+            raise overloaded(503, f"Timed out waiting to admit a {self.name} request")
+        finally:
+            with suppress(ValueError):
+                self._waiters.remove(waiter)
+
+    def release(self) -> None:
+        """Give back a slot taken by `acquire`."""
+        # Hand the slot over without freeing it, so newcomers cannot jump the queue
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, waiting for one if needed."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+def _gate(name: str, limit: int) -> AdmissionGate:
+    return AdmissionGate(
+        name, limit, settings.admission_queue_size, settings.admission_timeout
+    )
+
+
+# One gate per geocoding endpoint; reads are never gated
+admission_gates: Dict[str, AdmissionGate] = {
+    "create": _gate("create", settings.admission_create_limit),
+    "update": _gate("update", settings.admission_update_limit),
+    "batch": _gate("batch", settings.admission_bulk_limit),
+    "import": _gate("import", settings.admission_bulk_limit),
+}
+
+
+def admit(name: str) -> Callable:
+    """Route dependency holding a slot of gate `name` while the request is handled."""
+    async def dependency() -> AsyncIterator[None]:
+        async with admission_gates[name].slot():
+            yield
+
+    return Depends(dependency)
+
+
+_job_admission_lock = threading.Lock()
+
+
+def admit_job(engine, kind: str, limit: int, params: dict) -> Job:
+    """
+    Submit a job of `kind` unless `limit` of them are already queued or running.
+
+    Jobs wait in the job queue rather than here, so there is no wait
+    queue: over the limit, the request is rejected with 429.
+    """
+    with _job_admission_lock:
+        if engine.count_active(kind) >= limit:
+            raise overloaded(429, f"Too many {kind} jobs in progress")
+        return engine.submit(kind, params)
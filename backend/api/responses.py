@@ -0,0 +1,65 @@
+"""Custom response classes and conditional request helpers."""
+
+from typing import Optional
+
+from starlette.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+# Clients may store responses but must revalidate them with If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def set_validators(response: Response, etag: str) -> None:
+    """Attach the ETag and Cache-Control headers to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """An empty 304 response carrying the current validators."""
+    response = Response(status_code=304)
+    set_validators(response, etag)
+    return response
+
+
+class RawJSONResponse(Response):
+    """
+    JSON response whose body is already serialized.
+
+    Used for bodies stored pre-serialized in the cache or dumped straight
+    from a model, skipping the validation and encoding FastAPI applies to
+    returned objects through `response_model`.
+    """
+
+    media_type = "application/json"
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body generator may still be reading the request.
+
+    `StreamingResponse` listens for client disconnects by calling `receive`,
+    which would swallow request body chunks the generator has not read yet.
+    This variant only streams; a disconnect surfaces as a failed send. The
+    background task runs even then, so it can release what the stream held.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        finally:
+            if self.background is not None:
+                await self.background()
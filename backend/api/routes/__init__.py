@@ -1,5 +1,8 @@
 """API route modules."""
 
 from .addresses import router as addresses_router
+from .jobs import router as jobs_router
+from .metrics import router as metrics_router
+from .health import router as health_router
 
-__all__ = ["addresses_router"]
\ No newline at end of file
+__all__ = ["addresses_router", "jobs_router", "metrics_router", "health_router"]
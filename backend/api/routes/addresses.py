@@ -1,24 +1,63 @@
 """Address API endpoints."""
 
-from fastapi import APIRouter, Query
+import json
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from config import settings
 from domain.models import (
     Address,
+    AddressBatch,
+    AddressBatchResponse,
     AddressCreate,
     AddressUpdate,
     AddressesRefresh,
+    AddressesRescore,
+    Job,
+    MethodScore,
     PaginatedAddresses,
+    RefreshPlan,
+)
+from api.admission import admission_gates, admit, admit_job
+from api.responses import (
+    DuplexStreamingResponse,
+    RawJSONResponse,
+    etag_matches,
+    not_modified,
+    set_validators,
+)
+from application.jobs import REFRESH_JOB, RESCORE_JOB, job_engine
+from application.services import (
+    AddressExporter,
+    AddressImporter,
+    AddressService,
+    AsyncAddressService,
+    ExportFormat,
+    ExportFormatUnavailable,
+    InvalidCursor,
+    acurrent_revision,
+    aiter_lines,
+    parse_csv,
+    parse_ndjson,
 )
-from application.services.address_service import AddressService
 
 router = APIRouter(prefix="/addresses", tags=["addresses"])
 
-address_service = AddressService()
+address_service = AddressService()  # Dry runs and import inserts, on worker threads
+async_address_service = AsyncAddressService()  # Request handlers, on the event loop
+
+
+def _etag(address_id: int, version: int) -> str:
+    """Strong ETag of one address row."""
+    return f'"{address_id}.{version}"'
 
 
 @router.get("", response_model=PaginatedAddresses)
-def get_addresses(
+async def get_addresses(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(
         default=settings.default_page_size,
@@ -26,30 +65,237 @@ def get_addresses(
         le=settings.max_page_size,
         description="Items per page"
     ),
-) -> PaginatedAddresses:
-    """Get paginated addresses."""
-    return address_service.get_all(page=page, per_page=per_page)
+    after: Optional[str] = Query(None, description="Cursor: page after this one (older)"),
+    before: Optional[str] = Query(None, description="Cursor: page before this one (newer)"),
+    with_total: bool = Query(True, description="Include total and pages"),
+    ids: Optional[List[str]] = Query(
+        None, description="Fetch these ids instead of a page (comma-separated or repeated)"
+    ),
+) -> Response:
+    """
+    Get paginated addresses, newest first, or the addresses with given `ids`.
+
+    Prefer the `next_cursor`/`prev_cursor` of a response over deep `page`
+    numbers: cursor pages cost the same regardless of depth. With `ids`,
+    items come back in the requested order and unknown ids are left out.
+
+    The ETag is the table revision, so polling with If-None-Match gets a
+    304 without a database query until something is written. Pages are
+    cached under the same revision.
+    """
+    # Read before the data: a concurrent write then only costs a spare full response
+    revision = await acurrent_revision()
+    etag = f'"{revision}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    if ids:
+        body = await _get_addresses_by_ids(ids)
+    elif after is not None and before is not None:
+        raise HTTPException(status_code=400, detail="Pass either after or before, not both")
+    else:
+        try:
+            body = await async_address_service.get_all_json(
+                page=page, per_page=per_page, after=after, before=before,
+                with_total=with_total, revision=revision,
+            )
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    response = RawJSONResponse(body)
+    set_validators(response, etag)
+    return response
+
+
+async def _get_addresses_by_ids(raw_ids: List[str]) -> str:
+    """Serialized PaginatedAddresses of the given ids, built around cached item bodies."""
+    try:
+        ids = [int(part) for value in raw_ids for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be integers")
+    if not ids:
+        raise HTTPException(status_code=400, detail="ids must list at least one id")
+    if len(ids) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.batch_max_items} ids per request"
+        )
+
+    items = await async_address_service.get_json_by_ids(ids)
+    # The fields of PaginatedAddresses in order; besides the items, only ints and nulls
+    return (
+        f'{{"items":[{",".join(items)}],"total":{len(items)},"page":null,'
+        f'"per_page":{len(ids)},"pages":null,"next_cursor":null,"prev_cursor":null}}'
+    )
+
+
+@router.get("/export")
+def export_addresses(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Output encoding"),
+) -> StreamingResponse:
+    """
+    Stream the whole addresses table as CSV, NDJSON, Arrow IPC or Parquet.
+
+    Rows are read in keyset batches and encoded chunk by chunk, so memory
+    stays constant and no connection is held while the client reads.
+    """
+    exporter = AddressExporter(batch_size=settings.export_batch_size)
+    try:
+        exporter.check_available(format)
+    except ExportFormatUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    return StreamingResponse(
+        exporter.export(format),
+        media_type=format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="addresses.{format.extension}"'
+        },
+    )
 
 
 @router.get("/{address_id}", response_model=Address)
-def get_address(address_id: int) -> Address:
-    """Get a single address by ID."""
-    return address_service.get_by_id(address_id)
+async def get_address(address_id: int, request: Request) -> Response:
+    """
+    Get a single address by ID.
+
+    The ETag is the row's id and version. A matching If-None-Match is
+    answered with 304 from the cache alone when the row is cached; other
+    cache hits return the stored body as is.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        version = await async_address_service.cached_version(address_id)
+        if version is not None and etag_matches(if_none_match, _etag(address_id, version)):
+            return not_modified(_etag(address_id, version))
+
+    found = await async_address_service.get_json_by_id(address_id)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Address not found")
+
+    body, version = found
+    etag = _etag(address_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response = RawJSONResponse(body)
+    set_validators(response, etag)
+    return response
 
 
-@router.post("", response_model=Address, status_code=201)
-def create_address(payload: AddressCreate) -> Address:
-    """Create a new address with Mapbox lookup and similarity scoring."""
-    return address_service.create(payload.address)
+@router.get("/{address_id}/scores", response_model=List[MethodScore])
+async def get_address_scores(address_id: int) -> List[MethodScore]:
+    """Get the per-method scores stored for an address by requests with `methods`."""
+    scores = await async_address_service.get_scores(address_id)
+    if scores is None:
+        raise HTTPException(status_code=404, detail="Address not found")
+    return scores
 
 
-@router.post("/{address_id}", response_model=Address, status_code=201)
-def update_address(address_id: int, payload: AddressUpdate) -> Address:
-    """Update an existing address."""
-    return address_service.update(address_id, payload.address)
+@router.post("", response_model=Address, status_code=201, dependencies=[admit("create")])
+async def create_address(payload: AddressCreate) -> Address:
+    """
+    Create a new address with Mapbox lookup and similarity scoring.
 
+    The configured method sets the match. `methods` are scored in the
+    same pass and kept, with it, in the score table.
+    """
+    return await async_address_service.create(payload.address, payload.methods)
 
-@router.post("/refresh", status_code=200)
-def refresh_addresses(payload: AddressesRefresh):
-    """Refresh matched addresses and scores for selected or all addresses."""
-    address_service.refresh(payload.ids)
\ No newline at end of file
+
+@router.post("/batch", response_model=AddressBatchResponse, dependencies=[admit("batch")])
+async def batch_addresses(payload: AddressBatch) -> AddressBatchResponse:
+    """
+    Create and update up to BATCH_MAX_ITEMS addresses in one request.
+
+    Items with an `id` update that address, the others are created. All
+    items are geocoded in one pass, scored together and written in one
+    transaction; results come back per item, in request order.
+    """
+    if len(payload.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.batch_max_items} items per batch",
+        )
+    return await async_address_service.batch(payload.items)
+
+
+@router.post("/refresh", response_model=Job, status_code=202)
+def refresh_addresses(payload: AddressesRefresh) -> Job:
+    """
+    Start a background job refreshing stale matched addresses and scores.
+
+    Rows are stale when never geocoded (or the last lookup failed), edited
+    since, geocoded by another geocoder version, older than
+    REFRESH_MAX_AGE_DAYS, scored below REFRESH_MIN_SCORE or scored by
+    another method; the last only needs a rescore. Rows listed in `ids`
+    are refreshed whether stale or not, and so is every row with `force`.
+    The job's total and progress count the refreshed rows. `methods` are
+    scored for every scanned row into the score table.
+    Track it with `GET /jobs/{id}` or `GET /jobs/{id}/events`. With
+    ADMISSION_REFRESH_LIMIT refresh jobs already queued or running, answers 429.
+    """
+    params = {
+        "ids": payload.ids,
+        "force": payload.force,
+        "methods": [method.value for method in payload.methods],
+    }
+    return admit_job(job_engine, REFRESH_JOB, settings.admission_refresh_limit, params)
+
+
+@router.post("/refresh/dry-run", response_model=RefreshPlan)
+def plan_refresh(payload: AddressesRefresh) -> RefreshPlan:
+    """Report how many addresses a refresh would touch, by reason, without changing any."""
+    return address_service.plan_refresh(payload.ids, force=payload.force)
+
+
+@router.post("/rescore", response_model=Job, status_code=202)
+def rescore_addresses(payload: AddressesRescore) -> Job:
+    """
+    Start a background job re-scoring addresses from their stored candidates.
+
+    Makes no geocoding calls. Rows already scored by the current version
+    of `method` are skipped. Track it with `GET /jobs/{id}`.
+    """
+    params = {"ids": payload.ids, "method": payload.method.value if payload.method else None}
+    return job_engine.submit(RESCORE_JOB, params)
+
+
+@router.post("/import")
+async def import_addresses(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, description="Input format; defaults from Content-Type, then CSV"
+    ),
+) -> DuplexStreamingResponse:
+    """
+    Stream-import addresses from a CSV (shaped like data/addresses.csv) or NDJSON body.
+
+    Rows are parsed as the upload arrives, geocoded concurrently, scored and
+    inserted in batches. One NDJSON result per row is streamed back, in input
+    order, followed by a summary line. The import holds its admission slot
+    until the stream ends.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+
+    parse = parse_ndjson if format == "ndjson" else parse_csv
+    rows = parse(aiter_lines(request.stream()))
+    importer = AddressImporter(address_service, async_address_service)
+
+    async def results():
+        async for result in importer.run(rows):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+
+    gate = admission_gates["import"]
+    await gate.acquire()
+    return DuplexStreamingResponse(
+        results(), media_type="application/x-ndjson", background=BackgroundTask(gate.release)
+    )
+
+
+@router.post(
+    "/{address_id}", response_model=Address, status_code=201, dependencies=[admit("update")]
+)
+async def update_address(address_id: int, payload: AddressUpdate) -> Address:
+    """Update an existing address; `methods` are scored as on create."""
+    return await async_address_service.update(address_id, payload.address, payload.methods)
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""Liveness and readiness endpoints."""
+
+from fastapi import APIRouter, Response, status
+
+from application.services import readiness
+from domain.models import Readiness
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/health")
+def get_health() -> dict:
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@router.get("/ready", response_model=Readiness)
+async def get_ready(response: Response) -> Readiness:
+    """
+    Readiness: state of each dependency warmed up after boot.
+
+    Answers 503 until every component is ready; failed components are
+    checked again in the background.
+    """
+    readiness.retry_failed()
+    report = readiness.report()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
@@ -0,0 +1,66 @@
+"""Background job endpoints."""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from domain.models import Job
+from application.jobs import job_engine
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+EVENTS_POLL_INTERVAL = 0.5  # seconds
+
+
+def _get_or_404(job_id: str) -> Job:
+    job = job_engine.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/{job_id}", response_model=Job)
+def get_job(job_id: str) -> Job:
+    """Get job status and progress."""
+    return _get_or_404(job_id)
+
+
+@router.post("/{job_id}/cancel", response_model=Job)
+def cancel_job(job_id: str) -> Job:
+    """Cancel a job; a running job stops after its current chunk."""
+    _get_or_404(job_id)
+    return job_engine.cancel(job_id)
+
+
+@router.post("/{job_id}/resume", response_model=Job, status_code=202)
+def resume_job(job_id: str) -> Job:
+    """Resume a failed, cancelled or interrupted job from its last checkpoint."""
+    _get_or_404(job_id)
+    return job_engine.resume(job_id)
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str) -> StreamingResponse:
+    """Stream job progress as server-sent events until the job stops."""
+    await run_in_threadpool(_get_or_404, job_id)
+
+    async def stream():
+        last_payload = None
+        while True:
+            job = await run_in_threadpool(job_engine.get, job_id)
+            payload = job.model_dump_json()
+            if payload != last_payload:
+                yield f"event: progress\ndata: {payload}\n\n"
+                last_payload = payload
+            if job.status.is_terminal:
+                yield f"event: done\ndata: {payload}\n\n"
+                return
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
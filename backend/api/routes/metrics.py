@@ -0,0 +1,67 @@
+"""Operational metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from api.admission import admission_gates
+from application.services import cache_warmer
+from infrastructure.cache import cache_client
+
+router = APIRouter(tags=["metrics"])
+
+# (name, type, help, gate attribute)
+ADMISSION_METRICS = [
+    ("admission_queue_depth", "gauge", "Requests waiting for an admission slot", "queued"),
+    ("admission_in_flight", "gauge", "Requests holding an admission slot", "active"),
+    ("admission_limit", "gauge", "Concurrent requests admitted", "limit"),
+    ("admission_rejected_total", "counter", "Requests rejected with 429, queue full", "rejected"),
+    ("admission_timed_out_total", "counter", "Requests rejected with 503, wait timed out", "timed_out"),
+]
+
+# (name, type, help, CacheStats attribute)
+CACHE_METRICS = [
+    ("cache_hits_total", "counter", "Cache reads that found a value", "hits"),
+    ("cache_misses_total", "counter", "Cache reads that found nothing", "misses"),
+    ("cache_evictions_total", "counter", "Entries evicted to stay within the size budget", "evictions"),
+    ("cache_expirations_total", "counter", "Entries dropped when their TTL ran out", "expirations"),
+    ("cache_entries", "gauge", "Entries held", "entries"),
+    ("cache_bytes", "gauge", "Approximate memory held", "bytes"),
+    ("cache_hit_ratio", "gauge", "Share of reads reaching the tier that found a value", "hit_ratio"),
+]
+
+# (name, type, help, WarmupStats attribute)
+WARMUP_METRICS = [
+    ("cache_warmup_runs_total", "counter", "Cache warm-ups run", "runs"),
+    ("cache_warmup_failures_total", "counter", "Cache warm-ups that failed", "failures"),
+    ("cache_warmup_addresses", "gauge", "Addresses cached by the last warm-up", "addresses"),
+    ("cache_warmup_pages", "gauge", "List pages cached by the last warm-up", "pages"),
+    ("cache_warmup_seconds", "gauge", "Duration of the last warm-up", "seconds"),
+]
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> str:
+    """
+    Admission control per endpoint, cache counters per tier and cache
+    warm-ups, in Prometheus text format.
+    """
+    lines = []
+    for name, kind, help_text, attribute in ADMISSION_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for gate in admission_gates.values():
+            lines.append(f'{name}{{endpoint="{gate.name}"}} {getattr(gate, attribute)}')
+
+    tiers = cache_client.stats()
+    for name, kind, help_text, attribute in CACHE_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for tier, stats in tiers.items():
+            labels = f'tier="{tier}",backend="{stats.backend}"'
+            lines.append(f"{name}{{{labels}}} {getattr(stats, attribute)}")
+
+    for name, kind, help_text, attribute in WARMUP_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"{name} {getattr(cache_warmer.stats, attribute)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,18 @@
+"""Background jobs - Long-running bulk operations run off the request path."""
+
+from .engine import JobCancelled, JobContext, JobEngine
+from .handlers import REFRESH_JOB, RESCORE_JOB, refresh_handler, rescore_handler
+
+# Singleton instance
+job_engine = JobEngine()
+job_engine.register(REFRESH_JOB, refresh_handler)
+job_engine.register(RESCORE_JOB, rescore_handler)
+
+__all__ = [
+    "JobCancelled",
+    "JobContext",
+    "JobEngine",
+    "REFRESH_JOB",
+    "RESCORE_JOB",
+    "job_engine",
+]
@@ -0,0 +1,172 @@
+"""Background job engine - queueing, execution, progress and cancellation."""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from config import settings
+from domain.models import Job, JobStatus
+from infrastructure.queue import create_queue
+from infrastructure.repositories import JobRepository
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler to stop at the next checkpoint."""
+
+
+class JobContext:
+    """Handle passed to job handlers for checkpointing and cancellation."""
+
+    def __init__(self, job: Job, repository: JobRepository, cancel_event: threading.Event):
+        self.job = job
+        self._repository = repository
+        self._cancel_event = cancel_event
+
+    @property
+    def params(self) -> dict:
+        return self.job.params
+
+    @property
+    def checkpoint(self) -> Optional[int]:
+        """Last committed position; handlers resume after it."""
+        return self.job.checkpoint
+
+    def start(self, total: Optional[int]) -> None:
+        """Report the amount of work and mark the job running."""
+        self._repository.mark_running(self.job.id, total)
+
+    def advance(self, processed: int, checkpoint: int) -> None:
+        """Record a committed chunk, then stop if cancellation was requested."""
+        self._repository.advance(self.job.id, processed, checkpoint)
+        self.job.checkpoint = checkpoint
+        self.raise_if_cancelled()
+
+    def raise_if_cancelled(self) -> None:
+        """Stop the handler if the job was cancelled here or by another process."""
+        if self._cancel_event.is_set() or self._repository.is_cancel_requested(self.job.id):
+            raise JobCancelled()
+
+
+JobHandler = Callable[[JobContext], None]
+
+
+class JobEngine:
+    """Runs registered job kinds on the configured queue."""
+
+    def __init__(self, repository: Optional[JobRepository] = None, queue=None):
+        self._repository = repository or JobRepository()
+        self._queue = queue
+        self._handlers: Dict[str, JobHandler] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register the handler for a job kind."""
+        self._handlers[kind] = handler
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._queue is None:
+                self._queue = create_queue()
+            self._queue.start(self.run)
+            if self._heartbeat is None:
+                self._stopping.clear()
+                self._heartbeat = threading.Thread(
+                    target=self._beat, name="job-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+        return self._queue
+
+    def _beat(self) -> None:
+        """Refresh the heartbeat of jobs running in this process until shutdown."""
+        while not self._stopping.wait(settings.job_heartbeat_interval):
+            try:
+                self._repository.heartbeat(list(self._cancel_events))
+            except Exception as e:
+                print(f"Job heartbeat error: {type(e).__name__}: {e}")
+
+    def submit(self, kind: str, params: dict) -> Job:
+        """Create a job and queue it."""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = self._repository.create(kind, params)
+        self._ensure_started().enqueue(job.id)
+        return job
+
+    def count_active(self, kind: str) -> int:
+        """Count jobs of `kind` that are queued or running."""
+        return self._repository.count_active(kind)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get current job state."""
+        return self._repository.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; a running job stops after its current chunk."""
+        job = self._repository.request_cancel(job_id)
+        event = self._cancel_events.get(job_id)
+        if event:
+            event.set()
+        return job
+
+    def resume(self, job_id: str) -> Optional[Job]:
+        """
+        Re-queue a failed, cancelled or interrupted job from its checkpoint.
+
+        A running job counts as interrupted once its worker has sent no
+        heartbeat for JOB_STALE_AFTER seconds. Queued, succeeded and live
+        running jobs are returned unchanged.
+        """
+        if job_id in self._cancel_events:
+            return self._repository.get(job_id)  # Still running in this process
+
+        job = self._repository.mark_queued(job_id, settings.job_stale_after)
+        if job is None:
+            return self._repository.get(job_id)
+        self._ensure_started().enqueue(job_id)
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, interval: float = 0.1) -> Job:
+        """Block until the job reaches a terminal status."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = self._repository.get(job_id)
+            if job is None or job.status.is_terminal:
+                return job
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Job {job_id} did not finish within {timeout}s")
+            time.sleep(interval)
+
+    def run(self, job_id: str) -> None:
+        """Execute a queued job to completion, failure or cancellation, if no worker has it."""
+        job = self._repository.claim(job_id)
+        if job is None:
+            return
+
+        event = threading.Event()
+        self._cancel_events[job_id] = event
+        try:
+            context = JobContext(job, self._repository, event)
+            context.raise_if_cancelled()
+            self._handlers[job.kind](context)
+        except JobCancelled:
+            self._repository.finish(job_id, JobStatus.CANCELLED)
+        except Exception as e:
+            # Checkpoint is kept, so the job can be resumed
+            self._repository.finish(job_id, JobStatus.FAILED, f"{type(e).__name__}: {e}")
+        else:
+            self._repository.finish(job_id, JobStatus.SUCCEEDED)
+        finally:
+            self._cancel_events.pop(job_id, None)
+
+    def shutdown(self) -> None:
+        """Stop the queue workers and the heartbeat."""
+        if self._queue is not None:
+            self._queue.shutdown()
+        if self._heartbeat is not None:
+            self._stopping.set()
+            self._heartbeat.join()
+            self._heartbeat = None
@@ -0,0 +1,73 @@
+"""Job handlers for address bulk operations."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from config import settings
+from domain.similarity import SimilarityMethod
+from application.services.address_service import AddressService
+from application.services.warmup import cache_warmer
+from .engine import JobContext
+
+
+REFRESH_JOB = "refresh"
+RESCORE_JOB = "rescore"
+
+
+def refresh_handler(context: JobContext) -> None:
+    """
+    Refresh stale addresses chunk by chunk, checkpointing after each commit.
+
+    Only stale rows are refreshed, unless the `force` or `ids` param is
+    set, and progress counts those. Rows are also scored by the `methods`
+    param into the score table. Hot addresses and pages dropped from the
+    cache are then cached again.
+    """
+    service = AddressService()
+    ids = context.params.get("ids")
+    force = context.params.get("force", False)
+    methods = [SimilarityMethod(method) for method in context.params.get("methods") or []]
+    chunk_size = context.params.get("chunk_size") or settings.refresh_chunk_size
+
+    # Rows refreshed before a resume are no longer stale, so add them back
+    plan = service.plan_refresh(ids, force, after_id=context.checkpoint)
+    context.start(total=context.job.processed + plan.stale)
+    after_id = context.checkpoint
+    while True:
+        scanned, refreshed, after_id = service.refresh_chunk(
+            after_id, chunk_size, ids, force=force, methods=methods
+        )
+        if not scanned:
+            break
+        context.advance(refreshed, after_id)
+    cache_warmer.warm()
+
+
+def rescore_handler(context: JobContext) -> None:
+    """
+    Re-score addresses from stored candidates with a process pool.
+
+    Makes no geocoding calls. Only rows not yet scored by the current
+    version of the method are processed, so a finished or resumed job
+    skips what is already done. Hot keys are cached again afterwards.
+    """
+    service = AddressService()
+    ids = context.params.get("ids")
+    method = SimilarityMethod(context.params.get("method") or settings.default_similarity_method)
+    chunk_size = context.params.get("chunk_size") or settings.rescore_chunk_size
+
+    # Rescored rows drop out of the count, so add those done before a resume
+    context.start(total=context.job.processed + service.count_to_rescore(method, ids))
+    after_id = context.checkpoint
+    # Spawned, not forked: this runs on a worker thread of a threaded process,
+    # and a fork copies other threads' locks while they may be held
+    with ProcessPoolExecutor(
+        max_workers=max(settings.rescore_workers, 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        while True:
+            count, after_id = service.rescore_chunk(after_id, chunk_size, method, executor, ids)
+            if not count:
+                break
+            context.advance(count, after_id)
+    cache_warmer.warm()
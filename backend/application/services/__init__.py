@@ -1,5 +1,46 @@
 """Service layer - Business logic."""
 
 from .address_service import AddressService
+from .async_address_service import AsyncAddressService
+from .address_import import AddressImporter, aiter_lines, parse_csv, parse_ndjson
+from .address_export import AddressExporter, ExportFormat, ExportFormatUnavailable
+from .pagination import InvalidCursor, decode_cursor, encode_cursor
+from .revision import (
+    abump_revision,
+    acurrent_revision,
+    bump_revision,
+    count_cache_key,
+    current_revision,
+    list_cache_key,
+)
+from .readiness import ReadinessTracker, readiness
+from .hot_keys import HotKeys, hot_keys
+from .warmup import CacheWarmer, WarmupStats, cache_warmer
 
-__all__ = ["AddressService"]
\ No newline at end of file
+__all__ = [
+    "AddressService",
+    "AsyncAddressService",
+    "AddressImporter",
+    "aiter_lines",
+    "parse_csv",
+    "parse_ndjson",
+    "AddressExporter",
+    "ExportFormat",
+    "ExportFormatUnavailable",
+    "InvalidCursor",
+    "decode_cursor",
+    "encode_cursor",
+    "abump_revision",
+    "acurrent_revision",
+    "bump_revision",
+    "current_revision",
+    "count_cache_key",
+    "list_cache_key",
+    "ReadinessTracker",
+    "readiness",
+    "HotKeys",
+    "hot_keys",
+    "CacheWarmer",
+    "WarmupStats",
+    "cache_warmer",
+]
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Streaming export - incremental CSV, NDJSON, Arrow IPC and Parquet encoders."""
+
+import csv
+import io
+import json
+from enum import Enum
+from typing import Iterable, Iterator, List, Optional
+
+from infrastructure.repositories import AddressRepository
+
+
+EXPORT_COLUMNS = ["id", "address", "matched_address", "match_score"]
+
+ExportRow = tuple[int, str, Optional[str], Optional[float]]
+
+
+class ExportFormat(str, Enum):
+    """Supported export encodings."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+    @property
+    def media_type(self) -> str:
+        return {
+            self.CSV: "text/csv; charset=utf-8",
+            self.NDJSON: "application/x-ndjson",
+            self.ARROW: "application/vnd.apache.arrow.stream",
+            self.PARQUET: "application/vnd.apache.parquet",
+        }[self]
+
+    @property
+    def extension(self) -> str:
+        return {self.ARROW: "arrows"}.get(self, self.value)
+
+
+class ExportFormatUnavailable(Exception):
+    """Raised when a format's optional dependency is not installed."""
+
+
+def _batched(rows: Iterable[ExportRow], size: int) -> Iterator[List[ExportRow]]:
+    batch: List[ExportRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_csv(rows: Iterable[ExportRow], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as CSV with a header, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in _batched(rows, batch_size):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_ndjson(rows: Iterable[ExportRow], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as one JSON object per line, one chunk per batch."""
+    for batch in _batched(rows, batch_size):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+def _arrow_schema():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ExportFormatUnavailable("Arrow and Parquet export require pyarrow") from e
+
+    return pa, pa.schema([
+        ("id", pa.int64()),
+        ("address", pa.string()),
+        ("matched_address", pa.string()),
+        ("match_score", pa.float64()),
+    ])
+
+
+def _record_batch(pa, schema, batch: List[ExportRow]):
+    columns = list(zip(*batch))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only sink handing out what was written since the last drain.
+
+    Keeps counting the absolute position, which writers use for file offsets.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def encode_arrow(rows: Iterable[ExportRow], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as an Arrow IPC stream with one record batch per chunk."""
+    pa, schema = _arrow_schema()
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield sink.drain()
+        for batch in _batched(rows, batch_size):
+            writer.write_batch(_record_batch(pa, schema, batch))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def encode_parquet(rows: Iterable[ExportRow], batch_size: int) -> Iterator[bytes]:
+    """Encode rows as Parquet with one row group per chunk; the footer comes last."""
+    pa, schema = _arrow_schema()
+    import pyarrow.parquet as pq
+
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for batch in _batched(rows, batch_size):
+            writer.write_batch(_record_batch(pa, schema, batch))
+            yield sink.drain()
+    yield sink.drain()
+
+
+_ENCODERS = {
+    ExportFormat.CSV: encode_csv,
+    ExportFormat.NDJSON: encode_ndjson,
+    ExportFormat.ARROW: encode_arrow,
+    ExportFormat.PARQUET: encode_parquet,
+}
+
+
+class AddressExporter:
+    """Streams the addresses table in keyset batches into an encoder."""
+
+    def __init__(self, repository: Optional[AddressRepository] = None, batch_size: int = 1000):
+        self._repository = repository or AddressRepository()
+        self._batch_size = batch_size
+
+    def check_available(self, export_format: ExportFormat) -> None:
+        """Raise ExportFormatUnavailable before streaming starts, if needed."""
+        if export_format in (ExportFormat.ARROW, ExportFormat.PARQUET):
+            _arrow_schema()
+
+    def export(self, export_format: ExportFormat) -> Iterator[bytes]:
+        """Yield encoded chunks of the whole table."""
+        rows = self._repository.iter_all(self._batch_size, columns=EXPORT_COLUMNS)
+        chunks = _ENCODERS[export_format](rows, self._batch_size)
+        return (chunk for chunk in chunks if chunk)
@@ -0,0 +1,211 @@
+"""Streaming bulk import - incremental parsing and a bounded geocode/score/insert pipeline."""
+
+import asyncio
+import codecs
+import csv
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from config import settings
+from .address_service import AddressService
+from .async_address_service import AsyncAddressService
+
+
+@dataclass
+class ImportRow:
+    """One parsed input record, or the reason it could not be parsed."""
+    line: int
+    address: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class GeocodedRow:
+    """An input record with its geocoding candidates."""
+    row: ImportRow
+    candidates: List[str]
+    error: Optional[str] = None
+
+
+async def aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a UTF-8 byte stream (BOM tolerated) into lines without buffering it whole."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def parse_csv(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """
+    Parse CSV records shaped like data/addresses.csv.
+
+    Only the `address` column is used. Quoted fields may span lines: a
+    record is complete once its quote count is even.
+    """
+    header: Optional[List[str]] = None
+    record, line_no, start_line = "", 0, 0
+    async for line in lines:
+        line_no += 1
+        if not record:
+            start_line = line_no
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            continue
+
+        if not record.strip():
+            record = ""
+            continue
+        fields = next(csv.reader([record]))
+        record = ""
+        if header is None:
+            header = [field.strip().lower() for field in fields]
+            if "address" not in header:
+                yield ImportRow(line=start_line, error="CSV header must have an 'address' column")
+                return
+            continue
+
+        values = dict(zip(header, fields))
+        address = (values.get("address") or "").strip()
+        if address:
+            yield ImportRow(line=start_line, address=address)
+        else:
+            yield ImportRow(line=start_line, error="Missing address")
+
+    if record:
+        yield ImportRow(line=start_line, error="Unterminated quoted field")
+
+
+async def parse_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[ImportRow]:
+    """Parse one JSON object with an `address` field per line."""
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield ImportRow(line=line_no, error=f"Invalid JSON: {e}")
+            continue
+
+        address = record.get("address") if isinstance(record, dict) else None
+        if isinstance(address, str) and address.strip():
+            yield ImportRow(line=line_no, address=address.strip())
+        else:
+            yield ImportRow(line=line_no, error="Missing address")
+
+
+class AddressImporter:
+    """
+    Imports a stream of rows through a bounded pipeline.
+
+    Up to `concurrency` geocodes run at once on the event loop, results
+    are scored and inserted `batch_size` rows per transaction on a
+    thread, and at most `window` rows are in flight, so memory stays flat
+    regardless of input size. Rows whose lookup failed are reported as
+    errors, not stored. Results are yielded in input order.
+    """
+
+    def __init__(
+        self,
+        service: Optional[AddressService] = None,
+        async_service: Optional[AsyncAddressService] = None,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self._service = service or AddressService()
+        self._async_service = async_service or AsyncAddressService()
+        self._concurrency = concurrency or settings.import_concurrency
+        self._batch_size = batch_size or settings.import_batch_size
+        self._window = self._concurrency * 2
+
+    async def _geocode(self, row: ImportRow, semaphore: asyncio.Semaphore) -> GeocodedRow:
+        if row.error:
+            return GeocodedRow(row=row, candidates=[])
+        async with semaphore:
+            try:
+                candidates = await self._async_service.lookup(row.address)
+            except Exception as e:
+                return GeocodedRow(row=row, candidates=[], error=f"Geocoding failed: {e}")
+        if candidates is None:
+            return GeocodedRow(row=row, candidates=[], error="Geocoding failed")
+        return GeocodedRow(row=row, candidates=candidates)
+
+    def _score_and_insert(self, batch: List[GeocodedRow]) -> List[dict]:
+        """Score a batch and insert its valid rows in one transaction."""
+        scored = {}
+        for i, item in enumerate(batch):
+            if item.row.error or item.error:
+                continue
+            matched, score, candidates = self._service.score_candidates(
+                item.row.address, item.candidates
+            )
+            scored[i] = (item.row.address, matched, score, candidates)
+
+        try:
+            created = iter(self._service.create_scored(list(scored.values())))
+            insert_error = None
+        except Exception as e:
+            created, insert_error = iter(()), f"Insert failed: {type(e).__name__}: {e}"
+
+        results = []
+        for i, item in enumerate(batch):
+            error = item.row.error or item.error or (insert_error if i in scored else None)
+            if error:
+                results.append({"line": item.row.line, "status": "error", "error": error})
+            else:
+                address = next(created)
+                results.append({
+                    "line": item.row.line,
+                    "status": "created",
+                    "address": address.model_dump(mode="json"),
+                })
+        return results
+
+    async def run(self, rows: AsyncIterator[ImportRow]) -> AsyncIterator[dict]:
+        """Import rows, yielding one result per row and a final summary."""
+        semaphore = asyncio.Semaphore(self._concurrency)
+        in_flight: deque[asyncio.Task] = deque()
+        batch: List[GeocodedRow] = []
+        counts = {"created": 0, "error": 0}
+
+        async def flush():
+            results = await run_in_threadpool(self._score_and_insert, batch.copy())
+            batch.clear()
+            for result in results:
+                counts[result["status"]] += 1
+            return results
+
+        try:
+            async for row in rows:
+                in_flight.append(asyncio.create_task(self._geocode(row, semaphore)))
+                if len(in_flight) < self._window:
+                    continue
+                batch.append(await in_flight.popleft())
+                if len(batch) >= self._batch_size:
+                    for result in await flush():
+                        yield result
+
+            while in_flight:
+                batch.append(await in_flight.popleft())
+                if len(batch) >= self._batch_size:
+                    for result in await flush():
+                        yield result
+            if batch:
+                for result in await flush():
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        yield {"summary": {**counts, "total": counts["created"] + counts["error"]}}
@@ -1,91 +1,353 @@
 """Address service - Business logic for address operations."""
 
-from typing import List, Optional
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Dict, List, Optional, Sequence
 
-from domain.models import Address, PaginatedAddresses
-from domain.similarity import address_similarity
+from config import settings
+from domain.models import Address, MethodScore, PaginatedAddresses, Provenance, RefreshPlan
+from domain.similarity import SimilarityMethod, get_method_version, rank_candidates_by_method
 from infrastructure.cache import cache_client
 from infrastructure.clients import MapboxClient
 from infrastructure.repositories import AddressRepository
+from .pagination import build_page, decode_cursor
+from .refresh_policy import FORCED, METHOD_CHANGED, RefreshPolicy, geocoder_version, utcnow
+from .revision import bump_revision, count_cache_key, current_revision
+
+
+def scoring_method() -> SimilarityMethod:
+    """The configured similarity method for new scores."""
+    return SimilarityMethod(settings.default_similarity_method)
+
+
+def scoring_provenance(
+    method: Optional[SimilarityMethod] = None, geocoded: bool = False
+) -> Provenance:
+    """
+    Provenance recorded with scores from `method`, or the configured one.
+
+    With `geocoded`, the candidates come from a successful lookup made now.
+    """
+    method = method or scoring_method()
+    return Provenance(
+        score_method=method.value,
+        score_version=get_method_version(method),
+        geocoder_version=geocoder_version() if geocoded else None,
+        geocoded_at=utcnow() if geocoded else None,
+    )
+
+
+def score_candidates_by_method(
+    address: str,
+    candidates: List[str],
+    methods: Sequence[SimilarityMethod],
+) -> Dict[SimilarityMethod, tuple[str, float, List[dict]]]:
+    """
+    Pick the best scoring candidate under each of `methods` in one pass.
+
+    Normalization and tokenization are shared by all methods. Each result
+    keeps all scores in provider order.
+    """
+    results = {}
+    ranked_by_method = rank_candidates_by_method(
+        address, candidates, methods, score_cutoff=settings.candidate_score_cutoff
+    )
+    for method, ranked in ranked_by_method.items():
+        if not ranked:
+            results[method] = ("", 0.0, [])
+            continue
+        scores = dict(ranked)
+        best_address, best_score = ranked[0]
+        results[method] = (
+            best_address,
+            best_score,
+            [{"address": c, "score": scores[c]} for c in candidates],
+        )
+    return results
+
+
+def score_candidates(
+    address: str,
+    candidates: List[str],
+    method: Optional[SimilarityMethod] = None,
+) -> tuple[str, float, List[dict]]:
+    """Pick the best scoring candidate; keep all scores in provider order."""
+    method = method or scoring_method()
+    return score_candidates_by_method(address, candidates, [method])[method]
+
+
+def method_scores(
+    results: Dict[SimilarityMethod, tuple[str, float, List[dict]]]
+) -> List[MethodScore]:
+    """Score table rows for the results of `score_candidates_by_method`."""
+    scored_at = utcnow()
+    return [
+        MethodScore(
+            method=method.value,
+            method_version=get_method_version(method),
+            matched_address=matched,
+            match_score=score,
+            scored_at=scored_at,
+        )
+        for method, (matched, score, _) in results.items()
+    ]
+
+
+def score_batch(
+    pairs: List[tuple[str, List[str]]],
+    method: Optional[SimilarityMethod] = None,
+) -> List[tuple[str, float, List[dict]]]:
+    """Score many (address, candidates) pairs in one call."""
+    return [score_candidates(address, candidates, method) for address, candidates in pairs]
 
 
 class AddressService:
-    """Service for address-related business operations."""
+    """
+    Address operations of jobs, import and cache warm-up, on worker threads.
+
+    Requests are served by `AsyncAddressService`; both share the scoring
+    functions of this module and the cache keys of this class.
+    """
 
     CACHE_KEY_PREFIX = "address:"
+    PLAN_CHUNK_SIZE = 5000  # Rows scanned per query by a dry-run refresh
 
     def __init__(self):
-        self._mapbox_client = MapboxClient()
+        self._mapbox = None
         self._repository = AddressRepository()
         self._cache = cache_client
 
+    @property
+    def _mapbox_client(self) -> MapboxClient:
+        """Created on first use, so building the service checks no configuration."""
+        if self._mapbox is None:
+            self._mapbox = MapboxClient()
+        return self._mapbox
+
     def _cache_key(self, address_id: int) -> str:
         """Generate cache key for address."""
         return f"{self.CACHE_KEY_PREFIX}{address_id}"
 
-    def _lookup_and_score(self, address: str) -> tuple[str, float]:
-        """Lookup address via Mapbox and calculate similarity score."""
-        matched_address = self._mapbox_client.geocode_best_match(address)
-        similarity_score = address_similarity(address, matched_address or "")
-        return matched_address or "", similarity_score
-
-    def get_all(self, page: int = 1, per_page: int = 5) -> PaginatedAddresses:
-        """Get paginated addresses."""
-        items, total = self._repository.get_paginated(page, per_page)
-        pages = (total + per_page - 1) // per_page  # Ceiling division
-
-        return PaginatedAddresses(
-            items=items,
-            total=total,
-            page=page,
-            per_page=per_page,
-            pages=pages
+    def score_candidates(
+        self, address: str, candidates: List[str]
+    ) -> tuple[str, float, List[dict]]:
+        """Pick the best scoring candidate; keep all scores in provider order."""
+        return score_candidates(address, candidates)
+
+    def _score_with(
+        self,
+        address: str,
+        candidates: List[str],
+        methods: Sequence[SimilarityMethod],
+    ) -> tuple[tuple[str, float, List[dict]], List[MethodScore]]:
+        """
+        Score with the configured method and, in the same pass, `methods`.
+
+        Returns the configured method's result, which is the row's match,
+        and score table rows for it and `methods`, or none without `methods`.
+        """
+        primary = scoring_method()
+        if not methods:
+            return self.score_candidates(address, candidates), []
+        results = score_candidates_by_method(address, candidates, [primary, *methods])
+        return results[primary], method_scores(results)
+
+    def lookup(self, address: str) -> Optional[List[str]]:
+        """Geocoding candidates in relevance order, or None if the lookup failed."""
+        return self._mapbox_client.lookup_candidates(address)
+
+    def _total(self) -> int:
+        """Total address count, cached until the next write."""
+        total = self._cache.get_or_compute(
+            count_cache_key(current_revision()),
+            lambda: str(self._repository.count()),
+            settings.count_cache_ttl,
         )
+        return int(total)
 
-    def get_by_id(self, address_id: int) -> Optional[Address]:
-        """Get a single address by ID with caching."""
-        cache_key = self._cache_key(address_id)
+    def _invalidate_lists(self) -> None:
+        """Mark cached list pages and counts stale."""
+        bump_revision()
 
-        # Try cache first
-        cached = self._cache.get_json(cache_key)
-        if cached:
-            return Address.model_validate(cached)
+    def get_all(
+        self,
+        page: int = 1,
+        per_page: int = 5,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        with_total: bool = True,
+    ) -> PaginatedAddresses:
+        """
+        Get paginated addresses, newest first.
 
-        # Cache miss - fetch from DB
-        address = self._repository.get_by_id(address_id)
-        if address:
-            self._cache.set_json(cache_key, address.model_dump())
+        With `after`/`before` cursors, pages are read by keyset on id and
+        `page` is ignored; otherwise `page` selects an offset page.
 
-        return address
+        Raises:
+            InvalidCursor: If a cursor cannot be decoded
+        """
+        if after is not None or before is not None:
+            items = self._repository.get_page_by_keyset(
+                per_page + 1,
+                after_id=decode_cursor(after) if after is not None else None,
+                before_id=decode_cursor(before) if before is not None else None,
+            )
+        else:
+            items = self._repository.get_page((page - 1) * per_page, per_page + 1)
 
-    def create(self, address: str) -> Address:
-        """Create a new address with Mapbox lookup and scoring."""
-        matched, score = self._lookup_and_score(address)
-        return self._repository.create(address, matched, score)
+        total = self._total() if with_total else None
+        return build_page(items, per_page, page, after, before, total)
 
-    def update(self, address_id: int, new_address: str) -> Optional[Address]:
-        """Update an existing address."""
-        matched, score = self._lookup_and_score(new_address)
-        result = self._repository.update(address_id, new_address, matched, score)
+    def count(self, ids: Optional[List[int]] = None) -> int:
+        """Count all addresses, or those among `ids`."""
+        return self._repository.count(ids)
 
-        # Invalidate cache on update
-        if result:
-            self._cache.delete(self._cache_key(address_id))
+    def create_scored(self, rows: List[tuple[str, str, float, List[dict]]]) -> List[Address]:
+        """Insert already geocoded and scored addresses in one transaction."""
+        created = self._repository.create_many(
+            rows, provenance=scoring_provenance(geocoded=True), chunk_size=max(len(rows), 1)
+        )
+        self._invalidate_lists()
+        return created
 
-        return result
+    def _refresh_policy(self) -> RefreshPolicy:
+        provenance = scoring_provenance()
+        return RefreshPolicy.from_settings(provenance.score_method, provenance.score_version)
 
-    def refresh(self, ids: Optional[List[int]] = None) -> None:
-        """Refresh matched addresses and scores."""
-        # Get addresses to refresh
-        if ids:
-            addresses = self._repository.get_by_ids(ids)
-        else:
-            addresses = self._repository.get_all()
+    def refresh_chunk(
+        self,
+        after_id: Optional[int],
+        limit: int,
+        ids: Optional[List[int]] = None,
+        force: bool = False,
+        methods: Sequence[SimilarityMethod] = (),
+    ) -> tuple[int, int, Optional[int]]:
+        """
+        Refresh the stale addresses of the next chunk after `after_id` and commit it.
+
+        Rows are stale by `RefreshPolicy`; with `force` or `ids`, all of
+        them are, since rows asked for by id are refreshed whatever their state.
+        Rows whose only issue is a changed scoring method are rescored from
+        stored candidates without geocoding. A failed lookup leaves the row
+        as it was, so it stays stale for the next run.
+
+        With `methods`, every scanned row with candidates is also scored by
+        them, in the same pass, into the score table; rows that are not
+        stale are scored from their stored candidates and left unchanged.
+
+        Returns the number of addresses scanned, the number of stale ones
+        refreshed (or attempted) and the last scanned id, which callers keep
+        as a checkpoint to resume from.
+        """
+        states = list(islice(self._repository.iter_refresh_states(ids, after_id, limit), limit))
+        if not states:
+            return 0, 0, after_id
+
+        policy = self._refresh_policy()
+        force = force or bool(ids)
+        geocoded, rescored, scores = [], [], {}
+        refreshed = 0
+        for state in states:
+            reason = FORCED if force else policy.stale_reason(state)
+            refreshed += bool(reason)
+            if reason and reason != METHOD_CHANGED:
+                candidates, target = self.lookup(state.address), geocoded
+            else:
+                candidates = state.candidates
+                target = rescored if reason == METHOD_CHANGED else None
+            if candidates is None or (target is None and not methods):
+                continue
+
+            result, scores[state.id] = self._score_with(state.address, candidates, methods)
+            if target is not None:
+                target.append((state.id, state.address, *result))
+
+        if geocoded:
+            self._repository.refresh_all(geocoded, provenance=scoring_provenance(geocoded=True))
+        if rescored:
+            self._repository.refresh_all(rescored, provenance=scoring_provenance())
+        self._repository.save_scores({k: v for k, v in scores.items() if v})
+        self._cache.delete_many([
+            self._cache_key(address_id) for address_id, *_ in geocoded + rescored
+        ])
+        if geocoded or rescored:
+            self._invalidate_lists()
 
-        # Calculate new scores and batch update
-        updates = []
-        for addr in addresses:
-            matched, score = self._lookup_and_score(addr.address)
-            updates.append((addr.id, matched, score))
+        return len(states), refreshed, states[-1].id
+
+    def plan_refresh(
+        self,
+        ids: Optional[List[int]] = None,
+        force: bool = False,
+        after_id: Optional[int] = None,
+    ) -> RefreshPlan:
+        """
+        Count the addresses a refresh would touch, by reason, without changing any.
+
+        As in `refresh_chunk`, every row among `ids` counts as forced. Only
+        rows after `after_id` are counted.
+        """
+        policy = self._refresh_policy()
+        force = force or bool(ids)
+        reasons: dict[str, int] = {}
+        total = 0
+        states = self._repository.iter_refresh_states(ids, after_id, self.PLAN_CHUNK_SIZE)
+        for state in states:
+            total += 1
+            reason = FORCED if force else policy.stale_reason(state)
+            if reason:
+                reasons[reason] = reasons.get(reason, 0) + 1
+
+        return RefreshPlan(total=total, stale=sum(reasons.values()), reasons=reasons)
+
+    def count_to_rescore(
+        self, method: SimilarityMethod, ids: Optional[List[int]] = None
+    ) -> int:
+        """Count addresses whose score did not come from this version of `method`."""
+        return self._repository.count_to_rescore(scoring_provenance(method), ids)
+
+    def rescore_chunk(
+        self,
+        after_id: Optional[int],
+        limit: int,
+        method: SimilarityMethod,
+        executor: Executor,
+        ids: Optional[List[int]] = None,
+    ) -> tuple[int, Optional[int]]:
+        """
+        Re-score the next chunk of addresses from their stored candidates.
+
+        No geocoding happens. Rows already scored by this version of
+        `method`, and rows without stored candidates, are skipped. The
+        chunk is split into one batched scoring call per RESCORE_WORKERS
+        on `executor`, then written in one transaction.
+
+        Returns the number of addresses rescored and the last rescored id.
+        """
+        provenance = scoring_provenance(method)
+        rows = list(islice(
+            self._repository.iter_to_rescore(provenance, ids, after_id, limit), limit
+        ))
+        if not rows:
+            return 0, after_id
+
+        pairs = [(address, candidates) for _, address, candidates in rows]
+        step = -(-len(pairs) // max(settings.rescore_workers, 1))  # One batch per worker
+        batches = [pairs[start:start + step] for start in range(0, len(pairs), step)]
+        scored = [
+            result
+            for batch in executor.map(score_batch, batches, [method] * len(batches))
+            for result in batch
+        ]
+
+        self._repository.refresh_all(
+            [
+                (address_id, address, *result)
+                for (address_id, address, _), result in zip(rows, scored)
+            ],
+            provenance=provenance,
+        )
+        self._cache.delete_many([self._cache_key(address_id) for address_id, _, _ in rows])
+        self._invalidate_lists()
 
-        self._repository.refresh_all(updates)
\ No newline at end of file
+        return len(rows), rows[-1][0]
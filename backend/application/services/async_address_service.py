@@ -0,0 +1,328 @@
+"""Async address service - Request-path business logic on asyncio."""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+from pydantic_core import from_json
+
+from config import settings
+from domain.models import (
+    Address,
+    AddressBatchItem,
+    AddressBatchResponse,
+    AddressBatchResult,
+    MethodScore,
+    PaginatedAddresses,
+    Provenance,
+)
+from domain.similarity import SimilarityMethod
+from infrastructure.cache import cache_client
+from infrastructure.clients import AsyncMapboxClient
+from infrastructure.repositories import AsyncAddressRepository
+from .address_service import (
+    AddressService,
+    method_scores,
+    score_batch,
+    score_candidates_by_method,
+    scoring_method,
+    scoring_provenance,
+)
+from .executors import run_scoring
+from .hot_keys import hot_keys
+from .pagination import build_page, decode_cursor
+from .revision import abump_revision, acurrent_revision, count_cache_key, list_cache_key
+
+
+class AsyncAddressService:
+    """
+    Address operations of request handlers and the import pipeline.
+
+    Geocoding, database and cache access are awaited rather than run on a
+    thread each; similarity scoring runs on the dedicated scoring executor.
+    Cache keys are shared with `AddressService`, whose jobs invalidate
+    what this service caches.
+    """
+
+    def __init__(self):
+        self._mapbox = None
+        self._repository = AsyncAddressRepository()
+        self._cache = cache_client
+        self._hot_keys = hot_keys
+
+    @property
+    def _mapbox_client(self) -> AsyncMapboxClient:
+        """Created on first use, so building the service checks no configuration."""
+        if self._mapbox is None:
+            self._mapbox = AsyncMapboxClient()
+        return self._mapbox
+
+    def _cache_key(self, address_id: int) -> str:
+        """Generate cache key for address."""
+        return f"{AddressService.CACHE_KEY_PREFIX}{address_id}"
+
+    async def lookup(self, address: str) -> Optional[List[str]]:
+        """Geocoding candidates in relevance order, or None if the lookup failed."""
+        return await self._mapbox_client.lookup_candidates(address)
+
+    async def _lookup_and_score(
+        self, address: str, methods: Sequence[SimilarityMethod] = ()
+    ) -> tuple[str, float, List[dict], Provenance, List[MethodScore]]:
+        """
+        Lookup candidates via Mapbox and re-rank them by similarity score.
+
+        `methods` are scored in the same pass as the configured method;
+        with any, score table rows for all of them are returned too.
+        """
+        candidates = await self.lookup(address)
+        primary = scoring_method()
+        results = await run_scoring(
+            score_candidates_by_method, address, candidates or [], [primary, *methods]
+        )
+        matched, score, scored = results[primary]
+        provenance = scoring_provenance(geocoded=candidates is not None)
+        return matched, score, scored, provenance, method_scores(results) if methods else []
+
+    async def _total(self) -> int:
+        """Total address count, cached until the next write."""
+        async def load() -> str:
+            return str(await self._repository.count())
+
+        total = await self._cache.aget_or_compute(
+            count_cache_key(await acurrent_revision()), load, settings.count_cache_ttl
+        )
+        return int(total)
+
+    async def get_all(
+        self,
+        page: int = 1,
+        per_page: int = 5,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        with_total: bool = True,
+    ) -> PaginatedAddresses:
+        """
+        Get paginated addresses, newest first.
+
+        Raises:
+            InvalidCursor: If a cursor cannot be decoded
+        """
+        if after is not None or before is not None:
+            items = await self._repository.get_page_by_keyset(
+                per_page + 1,
+                after_id=decode_cursor(after) if after is not None else None,
+                before_id=decode_cursor(before) if before is not None else None,
+            )
+        else:
+            items = await self._repository.get_page((page - 1) * per_page, per_page + 1)
+
+        total = await self._total() if with_total else None
+        return build_page(items, per_page, page, after, before, total)
+
+    async def get_all_json(
+        self,
+        page: int = 1,
+        per_page: int = 5,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        with_total: bool = True,
+        revision: Optional[str] = None,
+    ) -> str:
+        """
+        Serialized `get_all` page, cached under the table revision.
+
+        Pass the `revision` the response is validated with, so the cached
+        body always matches its ETag. Writes bump the revision, so pages
+        cached before them are never served again. Served pages are
+        recorded for the cache warm-up.
+
+        Raises:
+            InvalidCursor: If a cursor cannot be decoded
+        """
+        params = dict(
+            page=page, per_page=per_page, after=after, before=before, with_total=with_total
+        )
+
+        async def load() -> str:
+            return (await self.get_all(**params)).model_dump_json()
+
+        body = await self._cache.aget_or_compute(
+            list_cache_key(revision or await acurrent_revision(), **params),
+            load,
+            settings.list_cache_ttl,
+        )
+        self._hot_keys.record_page(**params)
+        return body
+
+    async def get_by_id(self, address_id: int) -> Optional[Address]:
+        """Get a single address by ID with caching."""
+        cached = await self.get_json_by_id(address_id)
+        return Address.model_validate_json(cached[0]) if cached else None
+
+    async def get_json_by_id(self, address_id: int) -> Optional[tuple[str, int]]:
+        """
+        Serialized JSON and version of an address, or None if it does not exist.
+
+        The cache holds the final response body, so hits are returned
+        verbatim without parsing or validating it. Concurrent misses share
+        one query. Found addresses are recorded for the cache warm-up.
+        """
+        async def load() -> Optional[str]:
+            address = await self._repository.get_by_id(address_id)
+            return address.model_dump_json() if address else None
+
+        body = await self._cache.aget_or_compute(self._cache_key(address_id), load)
+        if body is None:
+            return None
+        self._hot_keys.record_address(address_id)
+        return body, from_json(body)["version"]
+
+    async def cached_version(self, address_id: int) -> Optional[int]:
+        """Version of a cached address without touching the database."""
+        cached = await self._cache.aget(self._cache_key(address_id))
+        return from_json(cached)["version"] if cached else None
+
+    async def get_json_by_ids(self, ids: List[int]) -> List[str]:
+        """
+        Serialized JSON of many addresses in request order; unknown ids are left out.
+
+        Hits come from one cache multi-get; misses are read with one query
+        and written back to the cache in one pipeline.
+        """
+        ids = list(dict.fromkeys(ids))
+        keys = {address_id: self._cache_key(address_id) for address_id in ids}
+        cached = await self._cache.aget_many(list(keys.values()))
+        found = {address_id: cached[key] for address_id, key in keys.items() if key in cached}
+
+        missing = [address_id for address_id in ids if address_id not in found]
+        if missing:
+            loaded = {
+                address.id: address.model_dump_json()
+                for address in await self._repository.get_by_ids(missing)
+            }
+            await self._cache.aset_many(
+                {keys[address_id]: body for address_id, body in loaded.items()}
+            )
+            found.update(loaded)
+
+        self._hot_keys.record_addresses(found)
+        return [found[address_id] for address_id in ids if address_id in found]
+
+    async def get_scores(self, address_id: int) -> Optional[List[MethodScore]]:
+        """Get the per-method scores stored for an address, or None if it does not exist."""
+        return await self._repository.get_scores(address_id)
+
+    async def create(self, address: str, methods: Sequence[SimilarityMethod] = ()) -> Address:
+        """Create a new address with Mapbox lookup and scoring of `methods` too."""
+        matched, score, candidates, provenance, scores = await self._lookup_and_score(
+            address, methods
+        )
+        result = await self._repository.create(
+            address, matched, score, candidates, provenance=provenance
+        )
+        await self._repository.save_scores({result.id: scores} if scores else {})
+        await abump_revision()
+        return result
+
+    async def update(
+        self, address_id: int, new_address: str, methods: Sequence[SimilarityMethod] = ()
+    ) -> Optional[Address]:
+        """Update an existing address; `methods` are scored as in `create`."""
+        matched, score, candidates, provenance, scores = await self._lookup_and_score(
+            new_address, methods
+        )
+        result = await self._repository.update(
+            address_id, new_address, matched, score, candidates, provenance=provenance
+        )
+
+        if result:
+            await self._repository.save_scores({address_id: scores} if scores else {})
+            await self._cache.adelete(self._cache_key(address_id))
+            await abump_revision()
+
+        return result
+
+    async def _geocode_many(self, queries: List[str]) -> List[Optional[List[str]]]:
+        """Candidates per query, or None where the lookup failed."""
+        if not queries:
+            return []
+        if settings.mapbox_batch_geocoding:
+            return await self._mapbox_client.geocode_batch(queries)
+        return list(await asyncio.gather(
+            *(self.lookup(query) for query in queries)
+        ))
+
+    async def batch(self, items: List[AddressBatchItem]) -> AddressBatchResponse:
+        """
+        Create and update many addresses with one geocoding pass, one
+        scoring call and one transaction.
+
+        Items with an `id` update that address; the others are created.
+        Failures are reported per item and do not affect the other items.
+        """
+        errors: Dict[int, str] = {}
+        seen_ids = set()
+        for index, item in enumerate(items):
+            if not item.address.strip():
+                errors[index] = "Missing address"
+            elif item.id is not None:
+                if item.id in seen_ids:
+                    errors[index] = f"Duplicate id {item.id} in batch"
+                seen_ids.add(item.id)
+
+        pending = [index for index in range(len(items)) if index not in errors]
+        geocoded = await self._geocode_many([items[index].address for index in pending])
+        found = []
+        for index, candidates in zip(pending, geocoded):
+            if candidates is None:
+                errors[index] = "Geocoding failed"
+            else:
+                found.append((index, candidates))
+
+        scored = await run_scoring(score_batch, [
+            (items[index].address, candidates) for index, candidates in found
+        ])
+        rows = {
+            index: (items[index].address, *row) for (index, _), row in zip(found, scored)
+        }
+        valid = list(rows)
+
+        creates = [index for index in valid if items[index].id is None]
+        updates = {items[index].id: rows[index] for index in valid if items[index].id is not None}
+        created, updated = await self._repository.write_batch(
+            [rows[index] for index in creates],
+            updates,
+            provenance=scoring_provenance(geocoded=True),
+        )
+
+        await self._cache.adelete_many([self._cache_key(address_id) for address_id in updated])
+        if created or updated:
+            await abump_revision()
+
+        results = {
+            index: AddressBatchResult(index=index, status="created", address=address)
+            for index, address in zip(creates, created)
+        }
+        for index in valid:
+            address_id = items[index].id
+            if address_id is None:
+                continue
+            if address_id in updated:
+                results[index] = AddressBatchResult(
+                    index=index, status="updated", address=updated[address_id]
+                )
+            else:
+                errors[index] = "Address not found"
+        for index, error in errors.items():
+            results[index] = AddressBatchResult(index=index, status="error", error=error)
+
+        return AddressBatchResponse(
+            results=[results[index] for index in range(len(items))],
+            created=len(created),
+            updated=len(updated),
+            errors=len(errors),
+        )
+
+    async def aclose(self) -> None:
+        """Release pooled upstream connections."""
+        if self._mapbox is not None:
+            await self._mapbox.aclose()
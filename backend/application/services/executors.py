@@ -0,0 +1,24 @@
+"""Dedicated executors for CPU-bound work on the asyncio request path."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar
+
+from config import settings
+
+
+T = TypeVar("T")
+
+# Separate from the event loop's default pool and FastAPI's threadpool, so
+# scoring bursts cannot starve sync routes, file I/O or each other
+scoring_executor = ThreadPoolExecutor(
+    max_workers=settings.scoring_workers,
+    thread_name_prefix="scoring",
+)
+
+
+async def run_scoring(fn: Callable[..., T], *args) -> T:
+    """Run a CPU-bound scoring call on the scoring executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(scoring_executor, partial(fn, *args))
@@ -0,0 +1,104 @@
+"""Access statistics of addresses and list pages, used to pick what to warm."""
+
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import settings
+
+
+class HotKeys:
+    """
+    Counts reads of addresses and list pages served by this process.
+
+    Recording is one counter increment under a lock. Past `max_tracked`
+    keys of a kind, the less read half is dropped, so memory stays bounded
+    while keys that keep being read keep their place.
+    """
+
+    def __init__(self, max_tracked: Optional[int] = None):
+        self._max_tracked = max_tracked
+        self._addresses: Counter = Counter()
+        self._pages: Counter = Counter()  # Keyed by sorted (name, value) pairs
+        self._lock = threading.Lock()
+
+    @property
+    def max_tracked(self) -> int:
+        return self._max_tracked or settings.warmup_max_tracked
+
+    def _add(self, counter: Counter, keys: Iterable, hits: float = 1) -> None:
+        with self._lock:
+            for key in keys:
+                counter[key] += hits
+            if len(counter) > self.max_tracked:
+                kept = counter.most_common(self.max_tracked // 2)
+                counter.clear()
+                counter.update(dict(kept))
+
+    def record_address(self, address_id: int) -> None:
+        self._add(self._addresses, (address_id,))
+
+    def record_addresses(self, ids: Iterable[int]) -> None:
+        self._add(self._addresses, ids)
+
+    def record_page(self, **params: Any) -> None:
+        """Record a list page by the parameters it is requested with."""
+        self._add(self._pages, (tuple(sorted(params.items())),))
+
+    def top_addresses(self, limit: int) -> List[int]:
+        """Ids of the `limit` most read addresses, most read first."""
+        with self._lock:
+            return [address_id for address_id, _ in self._addresses.most_common(limit)]
+
+    def top_pages(self, limit: int) -> List[Dict[str, Any]]:
+        """Parameters of the `limit` most read list pages, most read first."""
+        with self._lock:
+            return [dict(params) for params, _ in self._pages.most_common(limit)]
+
+    def snapshot(self, addresses: int, pages: int) -> Dict[str, list]:
+        """The top keys with their read counts, as JSON-compatible lists."""
+        with self._lock:
+            return {
+                "addresses": [
+                    [address_id, round(hits, 3)]
+                    for address_id, hits in self._addresses.most_common(addresses)
+                ],
+                "pages": [
+                    [dict(params), round(hits, 3)]
+                    for params, hits in self._pages.most_common(pages)
+                ],
+            }
+
+    def merge(self, snapshot: Dict[str, list], weight: float = 1.0) -> None:
+        """
+        Add the counts of a `snapshot`, scaled by `weight`.
+
+        A weight below 1 lets keys that were hot in an earlier process fade
+        unless they are read again.
+
+        Raises:
+            ValueError: If the snapshot is malformed
+        """
+        try:
+            addresses = [
+                (int(address_id), float(hits))
+                for address_id, hits in snapshot.get("addresses", [])
+            ]
+            pages = [
+                (tuple(sorted(dict(params).items())), float(hits))
+                for params, hits in snapshot.get("pages", [])
+            ]
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Malformed hot keys: {e}") from e
+        for counter, entries in ((self._addresses, addresses), (self._pages, pages)):
+            for key, hits in entries:
+                self._add(counter, (key,), hits * weight)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._addresses.clear()
+            self._pages.clear()
+
+
+# Singleton instance
+hot_keys = HotKeys()
@@ -0,0 +1,66 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import json
+from typing import List, Optional
+
+from domain.models import Address, PaginatedAddresses
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(address_id: int) -> str:
+    """Encode a row position as an opaque, URL-safe token."""
+    raw = json.dumps({"id": address_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> int:
+    """Decode a token produced by `encode_cursor`."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        address_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token!r}") from e
+    if not isinstance(address_id, int):
+        raise InvalidCursor(f"Invalid cursor: {token!r}")
+    return address_id
+
+
+def build_page(
+    items: List[Address],
+    per_page: int,
+    page: int,
+    after: Optional[str],
+    before: Optional[str],
+    total: Optional[int],
+) -> PaginatedAddresses:
+    """
+    Assemble a page from up to `per_page + 1` rows read newest first.
+
+    The extra row only tells whether another page follows in the read
+    direction; it is dropped from the result.
+    """
+    keyset = after is not None or before is not None
+    more = len(items) > per_page
+    if before is not None:
+        items = items[-per_page:] if more else items
+        has_next, has_prev = True, more
+    else:
+        items = items[:per_page]
+        has_next, has_prev = more, after is not None or (not keyset and page > 1)
+
+    pages = (total + per_page - 1) // per_page if total is not None else None  # Ceiling division
+
+    # Rows come from our own database, so skip re-validating them
+    return PaginatedAddresses.model_construct(
+        items=items,
+        total=total,
+        page=None if keyset else page,
+        per_page=per_page,
+        pages=pages,
+        next_cursor=encode_cursor(items[-1].id) if items and has_next else None,
+        prev_cursor=encode_cursor(items[0].id) if items and has_prev else None,
+    )
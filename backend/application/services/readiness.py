@@ -0,0 +1,131 @@
+"""Readiness - background warm-up of dependencies after boot."""
+
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from config import settings
+from domain.models import ComponentReadiness, ComponentStatus, Readiness
+from domain.similarity import rank_candidates
+from infrastructure.cache import cache_client
+from infrastructure.database import db
+from .address_service import scoring_method
+
+
+# A warm-up check raises when its dependency is unusable; it may return a detail
+Check = Callable[[], Optional[str]]
+
+
+def check_database() -> str:
+    """Connect and verify the schema; migrations run separately, never on boot."""
+    missing = db.missing_schema()
+    if missing:
+        raise RuntimeError(
+            f"Schema is missing {', '.join(missing)}; run `python cli.py migrate`"
+        )
+    return db.engine.dialect.name
+
+
+def check_cache() -> str:
+    """Pick the cache backend, connecting to Redis when configured."""
+    cache_client.connect()
+    if cache_client.is_redis:
+        return "redis"
+    return "memory (redis unreachable)" if settings.redis_url else "memory"
+
+
+def check_geocoder() -> None:
+    """Check the geocoder is configured; no request is made."""
+    if not settings.mapbox_access_token:
+        raise RuntimeError("MAPBOX_ACCESS_TOKEN is not set")
+
+
+def check_scoring() -> str:
+    """Load the configured similarity method by scoring one pair."""
+    method = scoring_method()
+    rank_candidates("warm up", ["warm up"], method)
+    return method.value
+
+
+DEFAULT_CHECKS: Dict[str, Check] = {
+    "database": check_database,
+    "cache": check_cache,
+    "geocoder": check_geocoder,
+    "scoring": check_scoring,
+}
+
+
+class ReadinessTracker:
+    """
+    Runs warm-up checks in the background and reports their state.
+
+    `start` only schedules the checks, so the app serves requests right
+    away; components that are still pending simply initialize on first
+    use. Failed checks are retried when readiness is next reported.
+    """
+
+    def __init__(self, checks: Optional[Dict[str, Check]] = None):
+        self._checks = checks if checks is not None else DEFAULT_CHECKS
+        self._components: Dict[str, ComponentReadiness] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._components = {name: ComponentReadiness(name=name) for name in self._checks}
+
+    def start(self) -> None:
+        """Schedule every check on the running loop without waiting for them."""
+        self._reset()
+        self._task = asyncio.get_running_loop().create_task(self.warm_up(self._checks))
+
+    async def warm_up(self, names: Iterable[str]) -> None:
+        """Run the named checks concurrently, each on a worker thread."""
+        await asyncio.gather(*(self._run(name) for name in names))
+
+    async def _run(self, name: str) -> None:
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.to_thread(self._checks[name])
+            status = ComponentStatus.READY
+        except Exception as e:
+            detail = f"{type(e).__name__}: {e}"
+            status = ComponentStatus.FAILED
+        self._components[name] = ComponentReadiness(
+            name=name,
+            status=status,
+            detail=detail,
+            seconds=round(time.perf_counter() - started, 4),
+        )
+
+    def retry_failed(self) -> None:
+        """Run failed checks again, unless a warm-up is still in progress."""
+        if self._task is not None and not self._task.done():
+            return
+        failed = [
+            name for name, component in self._components.items()
+            if component.status == ComponentStatus.FAILED
+        ]
+        if failed:
+            self._task = asyncio.get_running_loop().create_task(self.warm_up(failed))
+
+    def report(self) -> Readiness:
+        """Current state of every component."""
+        components = list(self._components.values())
+        return Readiness(
+            ready=all(c.status == ComponentStatus.READY for c in components),
+            components=components,
+        )
+
+    async def stop(self) -> None:
+        """Stop waiting for a warm-up in progress."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# Singleton instance
+readiness = ReadinessTracker()
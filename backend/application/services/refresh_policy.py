@@ -0,0 +1,71 @@
+"""Refresh policy - which addresses a refresh must touch, and why."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from config import settings
+from domain.models import RefreshState, input_hash
+
+
+# Reasons a row is stale, checked in this order
+NEVER_GEOCODED = "never_geocoded"  # Includes rows whose last lookup failed
+INPUT_CHANGED = "input_changed"
+GEOCODER_CHANGED = "geocoder_changed"
+EXPIRED = "expired"
+LOW_SCORE = "low_score"
+METHOD_CHANGED = "method_changed"  # Fixed by rescoring stored candidates, no geocoding
+FORCED = "forced"
+
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, as stored in DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def geocoder_version() -> str:
+    """The geocoder setup candidates come from; changing it makes every row stale."""
+    return f"{settings.geocoder_version}:limit={settings.mapbox_candidate_limit}"
+
+
+@dataclass(frozen=True)
+class RefreshPolicy:
+    """Staleness rules for one refresh run."""
+
+    now: datetime
+    max_age: Optional[timedelta]
+    min_score: float
+    geocoder_version: str
+    score_method: str
+    score_version: str
+
+    @classmethod
+    def from_settings(cls, score_method: str, score_version: str) -> "RefreshPolicy":
+        """The configured policy, for scores from `score_method` at `score_version`."""
+        return cls(
+            now=utcnow(),
+            max_age=(
+                timedelta(days=settings.refresh_max_age_days)
+                if settings.refresh_max_age_days else None
+            ),
+            min_score=settings.refresh_min_score,
+            geocoder_version=geocoder_version(),
+            score_method=score_method,
+            score_version=score_version,
+        )
+
+    def stale_reason(self, state: RefreshState) -> Optional[str]:
+        """Why `state` must be refreshed, or None if its match is current."""
+        if state.geocoded_at is None:
+            return NEVER_GEOCODED
+        if state.input_hash != input_hash(state.address):
+            return INPUT_CHANGED
+        if state.geocoder_version != self.geocoder_version:
+            return GEOCODER_CHANGED
+        if self.max_age is not None and state.geocoded_at < self.now - self.max_age:
+            return EXPIRED
+        if (state.match_score or 0.0) < self.min_score:
+            return LOW_SCORE
+        if (state.score_method, state.score_version) != (self.score_method, self.score_version):
+            return METHOD_CHANGED
+        return None
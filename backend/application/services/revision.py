@@ -0,0 +1,59 @@
+"""Table-level revision of the addresses table for conditional and cached list requests."""
+
+import time
+
+from infrastructure.cache import cache_client
+
+
+REVISION_CACHE_KEY = "addresses:revision"
+REVISION_TTL = 24 * 60 * 60  # seconds
+
+
+def current_revision() -> str:
+    """
+    Revision of the addresses table as last seen by the cache.
+
+    A missing revision (first use, eviction, restart) starts from the clock,
+    so it never repeats one a client may still hold.
+    """
+    revision = cache_client.get(REVISION_CACHE_KEY)
+    if revision is None:
+        revision = str(time.time_ns())
+        cache_client.set(REVISION_CACHE_KEY, revision, REVISION_TTL)
+    return revision
+
+
+async def acurrent_revision() -> str:
+    """`current_revision` for coroutines; a Redis round trip does not block the loop."""
+    revision = await cache_client.aget(REVISION_CACHE_KEY)
+    if revision is None:
+        revision = str(time.time_ns())
+        await cache_client.aset(REVISION_CACHE_KEY, revision, REVISION_TTL)
+    return revision
+
+
+def bump_revision() -> None:
+    """Mark the addresses table as changed."""
+    cache_client.set(REVISION_CACHE_KEY, str(time.time_ns()), REVISION_TTL)
+
+
+async def abump_revision() -> None:
+    """`bump_revision` for coroutines."""
+    await cache_client.aset(REVISION_CACHE_KEY, str(time.time_ns()), REVISION_TTL)
+
+
+def list_cache_key(revision: str, **params) -> str:
+    """
+    Cache key of a list response as of `revision`.
+
+    Keys embed the revision, so a bump makes every cached page and count
+    unreachable at once without deleting or scanning keys; orphaned
+    entries age out with their TTL.
+    """
+    query = ":".join(f"{name}={value}" for name, value in sorted(params.items()))
+    return f"addresses:list:{revision}:{query}"
+
+
+def count_cache_key(revision: str) -> str:
+    """Cache key of the total address count as of `revision`."""
+    return f"addresses:count:{revision}"
@@ -0,0 +1,180 @@
+"""Cache warm-up - pre-populate the cache with the most read addresses and pages."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from infrastructure.cache import cache_client
+from infrastructure.repositories import AddressRepository
+from .address_service import AddressService
+from .hot_keys import HotKeys, hot_keys
+from .revision import current_revision, list_cache_key
+
+
+@dataclass
+class WarmupStats:
+    """Warm-ups run in this process, and what the last one cached."""
+    runs: int = 0
+    failures: int = 0
+    addresses: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None  # Of the last failed warm-up or save
+
+
+class CacheWarmer:
+    """
+    Fills the cache with the most read addresses and list pages.
+
+    Runs at startup, from the hot keys saved by the previous process, and
+    after refresh jobs, which drop the rows they rewrite from the cache.
+    Addresses already cached are skipped; the others are read with one
+    query and written with one pipeline per chunk. At most
+    `warmup_concurrency` chunks or pages load at a time, so live requests
+    keep most of the database pool.
+    """
+
+    def __init__(self, keys: HotKeys, path: Optional[str] = None):
+        self.hot_keys = keys
+        self._path = path
+        self._service = AddressService()
+        self._repository = AddressRepository()
+        self._cache = cache_client
+        self._loaded = False
+        self._running = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = WarmupStats()
+
+    @property
+    def path(self) -> str:
+        """File the hot keys are saved to; empty disables saving."""
+        return self._path if self._path is not None else settings.warmup_keys_path
+
+    def load(self) -> None:
+        """Add the hot keys saved by a previous process, at half weight so they fade."""
+        self._loaded = True
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.hot_keys.merge(json.load(file), weight=0.5)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:  # An unreadable list only costs a cold start
+            self.stats.error = f"{type(e).__name__}: {e}"
+
+    def save(self) -> bool:
+        """Save the hot keys, replacing the file atomically; False if it failed."""
+        if not self.path:
+            return False
+        snapshot = self.hot_keys.snapshot(settings.warmup_addresses, settings.warmup_pages)
+        temp = f"{self.path}.{os.getpid()}.tmp"  # Workers sharing the file write their own
+        try:
+            with open(temp, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file)
+            os.replace(temp, self.path)
+            return True
+        except OSError as e:
+            self.stats.error = f"{type(e).__name__}: {e}"
+            return False
+
+    def warm(self) -> bool:
+        """
+        Cache the hottest addresses and pages that are not cached yet.
+
+        Failures are counted in `stats`, not raised: a warm-up only saves
+        later misses. Returns False without doing anything while another
+        warm-up is running.
+        """
+        if not self._running.acquire(blocking=False):
+            return False
+        started = time.perf_counter()
+        try:
+            if not self._loaded:
+                self.load()
+            ids = self.hot_keys.top_addresses(settings.warmup_addresses)
+            pages = self.hot_keys.top_pages(settings.warmup_pages)
+            size = max(settings.warmup_batch_size, 1)
+            with ThreadPoolExecutor(
+                max_workers=max(settings.warmup_concurrency, 1), thread_name_prefix="warmup"
+            ) as executor:
+                revision = current_revision() if pages else ""
+                chunks = [
+                    executor.submit(self._warm_addresses, ids[i:i + size])
+                    for i in range(0, len(ids), size)
+                ]
+                loaded = [executor.submit(self._warm_page, revision, params) for params in pages]
+                self.stats.addresses = sum(future.result() for future in chunks)
+                self.stats.pages = sum(future.result() for future in loaded)
+        except Exception as e:
+            self.stats.failures += 1
+            self.stats.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.stats.runs += 1
+            self.stats.seconds = round(time.perf_counter() - started, 4)
+            self._running.release()
+        return True
+
+    def _warm_addresses(self, ids: List[int]) -> int:
+        """Cache the addresses among `ids` that are not cached; how many were."""
+        keys = {
+            address_id: f"{AddressService.CACHE_KEY_PREFIX}{address_id}" for address_id in ids
+        }
+        cached = self._cache.get_many(list(keys.values()))
+        missing = [address_id for address_id, key in keys.items() if key not in cached]
+        if not missing:
+            return 0
+        bodies = {
+            keys[address.id]: address.model_dump_json()
+            for address in self._repository.get_by_ids(missing)
+        }
+        self._cache.set_many(bodies)
+        return len(bodies)
+
+    def _warm_page(self, revision: str, params: Dict[str, Any]) -> int:
+        """Cache a list page as `AsyncAddressService.get_all_json` does; 1 if it was computed."""
+        computed = []
+
+        def load() -> str:
+            computed.append(True)
+            return self._service.get_all(**params).model_dump_json()
+
+        self._cache.get_or_compute(
+            list_cache_key(revision, **params), load, settings.list_cache_ttl
+        )
+        return len(computed)
+
+    def start(self) -> None:
+        """
+        Warm the cache from the saved hot keys in the background, then save
+        them every `warmup_save_interval` seconds.
+        """
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        await asyncio.to_thread(self.load)
+        await asyncio.to_thread(self.warm)
+        while True:
+            await asyncio.sleep(settings.warmup_save_interval)
+            await asyncio.to_thread(self.save)
+
+    async def stop(self) -> None:
+        """Stop the background task and save the hot keys for the next process."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await asyncio.to_thread(self.save)
+
+
+# Singleton instance
+cache_warmer = CacheWarmer(hot_keys)
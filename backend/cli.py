@@ -0,0 +1,72 @@
+"""Command-line tools for bulk address operations.
+
+Usage:
+    cd backend
+    python cli.py migrate
+    python cli.py export --format parquet --output addresses.parquet
+"""
+
+import argparse
+import sys
+
+from config import settings
+from application.services import AddressExporter, ExportFormat, ExportFormatUnavailable
+from infrastructure.database import db
+
+
+def migrate(args: argparse.Namespace) -> int:
+    """Create missing tables; run before starting the server."""
+    db.create_tables()
+    missing = db.missing_schema()
+    if missing:
+        print(f"Tables still missing: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    print("Schema is up to date")
+    return 0
+
+
+def export(args: argparse.Namespace) -> int:
+    """Stream the addresses table to a file or stdout."""
+    export_format = ExportFormat(args.format)
+    exporter = AddressExporter(batch_size=args.batch_size)
+    try:
+        exporter.check_available(export_format)
+    except ExportFormatUnavailable as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in exporter.export(export_format):
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Address bulk operations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Create the database schema")
+    migrate_parser.set_defaults(handler=migrate)
+
+    export_parser = commands.add_parser("export", help="Export all addresses")
+    export_parser.add_argument(
+        "--format", choices=[f.value for f in ExportFormat], default=ExportFormat.CSV.value
+    )
+    export_parser.add_argument("--output", help="Output file (default: stdout)")
+    export_parser.add_argument("--batch-size", type=int, default=settings.export_batch_size)
+    export_parser.set_defaults(handler=export)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,19 +18,79 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./addresses.db"
 
     # Mapbox
-    mapbox_access_token: str
+    mapbox_access_token: str = ""  # Required to geocode; GET /ready reports it missing
     mapbox_base_url: str = "https://api.mapbox.com/search/geocode/v6/forward"
+    mapbox_candidate_limit: int = 5  # Mapbox v6 allows up to 10 per request
+    mapbox_debug_decoding: bool = False  # Validate full responses with pydantic
+    mapbox_max_connections: int = 100  # Pooled connections of the async client
+    geocoder_version: str = "mapbox-v6"  # Bump when geocoding changes, to make refresh redo all rows
+    mapbox_batch_geocoding: bool = True  # Batch endpoint for POST /addresses/batch; else concurrent forward calls
 
     # Similarity
     default_similarity_method: str = "jaro_winkler"
+    candidate_score_cutoff: float = 0.0  # Candidates scoring below are ranked as 0.0
+    scoring_workers: int = 4  # Threads scoring candidates off the event loop
 
     # Pagination
     default_page_size: int = 5
     max_page_size: int = 100
+    count_cache_ttl: int = 60  # Seconds the cached total count lives; writes invalidate it
+    list_cache_ttl: int = 300  # Seconds a cached list page lives; writes invalidate it
 
     # Cache
     redis_url: str | None = None
     cache_ttl: int = 300  # 5 minutes
+    cache_max_entries: int = 100_000  # In-memory cache: least recently used entries evicted past this
+    cache_max_bytes: int = 256 * 1024 * 1024  # In-memory cache: approximate memory budget
+    cache_l1_max_entries: int = 10_000  # With Redis: entries kept in-process in front of it
+    cache_l1_ttl: int = 30  # With Redis: seconds an in-process entry lives at most
+    cache_invalidation_channel: str = "cache:invalidate"  # Pub/sub channel dropping keys from every L1
+    cache_compression: str = "none"  # Values sent to Redis: none | zlib | zstd | lz4 (if installed)
+    cache_compression_threshold: int = 1024  # Bytes; smaller values are stored as plain text
+    cache_early_refresh_beta: float = 1.0  # XFetch eagerness to refresh before expiry; 0 disables
+    cache_stale_ttl: int = 0  # Seconds an expired value is served while one caller recomputes it
+    cache_lease_timeout: float = 5.0  # Seconds other callers wait for the one computing a value
+    cache_lease_poll_interval: float = 0.05  # Seconds between checks for another process's value
+
+    # Cache warm-up at startup and after refresh jobs
+    warmup_addresses: int = 1000  # Most read addresses cached; 0 disables
+    warmup_pages: int = 50  # Most read list pages cached; 0 disables
+    warmup_concurrency: int = 2  # Chunks or pages loaded at once, leaving the pool to requests
+    warmup_batch_size: int = 200  # Addresses read per query and written per pipeline
+    warmup_max_tracked: int = 20_000  # Keys counted per kind; the less read half is then dropped
+    warmup_keys_path: str = "hot_keys.json"  # Where hot keys survive restarts; empty disables
+    warmup_save_interval: int = 300  # Seconds between saves of the hot keys
+
+    # Background jobs
+    job_queue_backend: str = "memory"  # memory | redis
+    job_workers: int = 2
+    job_heartbeat_interval: float = 10.0  # Seconds between liveness writes of running jobs
+    job_stale_after: float = 60.0  # A running job without a heartbeat this long can be resumed
+    refresh_chunk_size: int = 100  # Addresses committed per checkpoint
+    refresh_max_age_days: int = 90  # Re-geocode matches older than this; 0 never expires them
+    refresh_min_score: float = 0.0  # Re-geocode matches scoring below this; 0 disables
+    rescore_chunk_size: int = 5000  # Addresses rescored from stored candidates per checkpoint
+    rescore_workers: int = 4  # Processes scoring a rescore chunk
+    bulk_write_chunk_size: int = 1000  # Rows per statement and per commit in bulk writes
+
+    # Admission control for geocoding endpoints; reads are never limited
+    admission_create_limit: int = 16  # Concurrent POST /addresses
+    admission_update_limit: int = 16  # Concurrent POST /addresses/{id}
+    admission_bulk_limit: int = 2  # Concurrent batches, and concurrent imports
+    admission_refresh_limit: int = 2  # Refresh jobs queued or running at once
+    admission_queue_size: int = 64  # Requests waiting per endpoint; more get 429
+    admission_timeout: float = 10.0  # Seconds a request waits for a slot before 503
+    admission_retry_after: int = 5  # Retry-After seconds on 429 and 503
+
+    # Batch endpoints
+    batch_max_items: int = 1000  # Items per POST /addresses/batch and ids per GET /addresses?ids=
+
+    # Bulk import
+    import_concurrency: int = 8  # Concurrent geocodes per import
+    import_batch_size: int = 100  # Rows scored and inserted per transaction
+
+    # Export
+    export_batch_size: int = 1000  # Rows fetched and encoded per chunk
 
 
 @lru_cache
@@ -2,16 +2,42 @@
 
 from .address import (
     Address,
+    AddressBatch,
+    AddressBatchItem,
+    AddressBatchResponse,
+    AddressBatchResult,
     AddressCreate,
     AddressUpdate,
     AddressesRefresh,
+    AddressesRescore,
+    MatchCandidate,
+    MethodScore,
     PaginatedAddresses,
 )
+from .job import Job, JobStatus
+from .provenance import Provenance, RefreshPlan, RefreshState, input_hash
+from .readiness import ComponentReadiness, ComponentStatus, Readiness
 
 __all__ = [
     "Address",
+    "AddressBatch",
+    "AddressBatchItem",
+    "AddressBatchResponse",
+    "AddressBatchResult",
     "AddressCreate",
     "AddressUpdate",
     "AddressesRefresh",
+    "AddressesRescore",
+    "MatchCandidate",
+    "MethodScore",
     "PaginatedAddresses",
+    "Job",
+    "JobStatus",
+    "Provenance",
+    "RefreshPlan",
+    "RefreshState",
+    "input_hash",
+    "ComponentReadiness",
+    "ComponentStatus",
+    "Readiness",
 ]
\ No newline at end of file
@@ -1,8 +1,17 @@
 """Address domain models."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from domain.similarity import SimilarityMethod
+
+
+class MatchCandidate(BaseModel):
+    """A geocoding candidate with its similarity score."""
+    address: str
+    score: float
 
 
 class Address(BaseModel):
@@ -11,27 +20,88 @@ class Address(BaseModel):
     address: str
     matched_address: Optional[str]
     match_score: float
+    candidates: List[MatchCandidate] = Field(default_factory=list)
+    version: int = 1  # Increases on every change to the row
+    score_method: Optional[str] = None  # Similarity method that produced match_score
+    score_version: Optional[str] = None  # Version of that method
+    geocoded_at: Optional[datetime] = None  # Last successful geocoding (UTC)
+
+
+class MethodScore(BaseModel):
+    """An address's best match under one similarity method, from the score table."""
+    method: str
+    method_version: str
+    matched_address: Optional[str]
+    match_score: float
+    scored_at: datetime
 
 
 class AddressCreate(BaseModel):
     """Schema for creating a new address."""
     address: str
+    # Extra similarity methods to score in the same pass, kept in the score table
+    methods: List[SimilarityMethod] = Field(default_factory=list)
 
 
 class AddressUpdate(BaseModel):
     """Schema for updating an existing address."""
     address: str
+    methods: List[SimilarityMethod] = Field(default_factory=list)
+
+
+class AddressBatchItem(BaseModel):
+    """One entry of a batch: a new address, or an update when `id` is set."""
+    id: Optional[int] = None
+    address: str
+
+
+class AddressBatch(BaseModel):
+    """Schema for creating and updating addresses in one request."""
+    items: List[AddressBatchItem]
+
+
+class AddressBatchResult(BaseModel):
+    """Outcome of one batch entry, at the same index as in the request."""
+    index: int
+    status: Literal["created", "updated", "error"]
+    address: Optional[Address] = None
+    error: Optional[str] = None
+
+
+class AddressBatchResponse(BaseModel):
+    """Per-entry results of a batch with counts by status."""
+    results: List[AddressBatchResult]
+    created: int
+    updated: int
+    errors: int
 
 
 class AddressesRefresh(BaseModel):
     """Schema for refreshing addresses."""
-    ids: List[int] | None
+    ids: List[int] | None  # Listed rows are refreshed whether stale or not
+    force: bool = False  # Refresh every row, not only the stale ones
+    # Extra similarity methods to score every scanned row with, from its
+    # stored or freshly geocoded candidates, kept in the score table
+    methods: List[SimilarityMethod] = Field(default_factory=list)
+
+
+class AddressesRescore(BaseModel):
+    """Schema for re-scoring addresses from their stored candidates."""
+    ids: List[int] | None = None
+    method: Optional[SimilarityMethod] = None  # Defaults to DEFAULT_SIMILARITY_METHOD
 
 
 class PaginatedAddresses(BaseModel):
-    """Paginated response for addresses."""
+    """
+    Paginated response for addresses.
+
+    `page` is None for cursor-based requests. `total` and `pages` come from
+    a cached count and are None when the total was not requested.
+    """
     items: List[Address]
-    total: int
-    page: int
+    total: Optional[int]
+    page: Optional[int]
     per_page: int
-    pages: int
\ No newline at end of file
+    pages: Optional[int]
+    next_cursor: Optional[str] = None  # Pass as `after` for the next (older) page
+    prev_cursor: Optional[str] = None  # Pass as `before` for the previous (newer) page
\ No newline at end of file
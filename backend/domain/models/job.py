@@ -0,0 +1,48 @@
+"""Background job domain models."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the job has stopped and will not progress further."""
+        return self in (self.SUCCEEDED, self.FAILED, self.CANCELLED)
+
+
+class Job(BaseModel):
+    """Background job with progress and resumable checkpoint."""
+    id: str
+    kind: str
+    status: JobStatus
+    params: dict[str, Any] = Field(default_factory=dict)
+    total: Optional[int] = None
+    processed: int = 0
+    checkpoint: Optional[int] = None  # Last committed address id
+    cancel_requested: bool = False
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @computed_field
+    @property
+    def progress(self) -> float:
+        """Fraction of work done, between 0.0 and 1.0."""
+        if self.status == JobStatus.SUCCEEDED:
+            return 1.0
+        if not self.total:
+            return 0.0
+        return min(1.0, self.processed / self.total)
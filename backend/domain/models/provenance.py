@@ -0,0 +1,48 @@
+"""Provenance of stored match data - what produced it and from which input."""
+
+import hashlib
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+def input_hash(address: str) -> str:
+    """Fingerprint of the address text a match was computed from."""
+    normalized = " ".join(address.split()).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:32]
+
+
+class Provenance(BaseModel):
+    """
+    How the match data being written was produced.
+
+    `geocoded_at` and `geocoder_version` are set when the candidates come
+    from a successful geocoding call; they are None when scores were only
+    recomputed from stored candidates, or the lookup failed.
+    """
+    score_method: str
+    score_version: str
+    geocoder_version: Optional[str] = None
+    geocoded_at: Optional[datetime] = None
+
+
+class RefreshState(BaseModel):
+    """The columns of one address that decide whether a refresh must touch it."""
+    id: int
+    address: str
+    matched_address: Optional[str]
+    match_score: Optional[float]
+    candidates: Optional[List[str]]  # Stored candidate addresses, in provider order
+    geocoded_at: Optional[datetime]
+    geocoder_version: Optional[str]
+    input_hash: Optional[str]
+    score_method: Optional[str]
+    score_version: Optional[str]
+
+
+class RefreshPlan(BaseModel):
+    """What a refresh would do: rows scanned, rows stale and why."""
+    total: int
+    stale: int
+    reasons: dict[str, int]
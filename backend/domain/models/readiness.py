@@ -0,0 +1,28 @@
+"""Readiness of the app's dependencies, as reported by GET /ready."""
+
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ComponentStatus(str, Enum):
+    """Warm-up state of one dependency."""
+
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class ComponentReadiness(BaseModel):
+    """One dependency's warm-up state, with what was found and how long it took."""
+    name: str
+    status: ComponentStatus = ComponentStatus.PENDING
+    detail: Optional[str] = None
+    seconds: Optional[float] = None
+
+
+class Readiness(BaseModel):
+    """Whether every dependency is warmed up, and each one's state."""
+    ready: bool
+    components: List[ComponentReadiness]
@@ -1,9 +1,13 @@
 """Similarity module for address matching."""
 
+from typing import Dict, List, Sequence
+
 from .base import BaseSimilarity
 from .enums import SimilarityMethod
+from .prepared import PreparedAddress, normalize_text
 from .factory import (
     get_similarity_method,
+    get_method_version,
     get_all_methods,
     list_available_methods,
 )
@@ -20,16 +24,20 @@ from .methods import (
 # Default method to use (Jaro-Winkler has best MAE: 0.1387)
 DEFAULT_METHOD = SimilarityMethod.JARO_WINKLER
 
-# Cached instance of the default method
-_default_instance = None
+# Cached instances, one per method
+_instances: dict = {}
+
+
+def _get_instance(method: SimilarityMethod):
+    """Get or create the shared instance of a similarity method."""
+    if method not in _instances:
+        _instances[method] = get_similarity_method(method)
+    return _instances[method]
 
 
 def _get_default_instance():
     """Get or create the default similarity method instance."""
-    global _default_instance
-    if _default_instance is None:
-        _default_instance = get_similarity_method(DEFAULT_METHOD)
-    return _default_instance
+    return _get_instance(DEFAULT_METHOD)
 
 
 def address_similarity(a: str, b: str, method: SimilarityMethod | None = None) -> float:
@@ -56,6 +64,71 @@ def address_similarity(a: str, b: str, method: SimilarityMethod | None = None) -
     return _get_default_instance().calculate(a, b)
 
 
+def rank_candidates(
+    address: str,
+    candidates: Sequence[str],
+    method: SimilarityMethod | None = None,
+    score_cutoff: float = 0.0,
+) -> List[tuple[str, float]]:
+    """
+    Score all candidates against an address and rank them best first.
+
+    Candidates are scored in one batched call. Ties keep the incoming
+    order, so the provider's relevance ranking breaks them.
+
+    Args:
+        address: Original address string
+        candidates: Candidate address strings, in provider relevance order
+        method: Optional similarity method to use. If None, uses DEFAULT_METHOD.
+        score_cutoff: Candidates scoring below this are ranked as 0.0
+
+    Returns:
+        List of (candidate, score) tuples sorted by descending score
+    """
+    if not address or not candidates:
+        return []
+
+    instance = _get_instance(method if method is not None else DEFAULT_METHOD)
+    scores = instance.calculate_many(address, candidates, score_cutoff=score_cutoff)
+    return sorted(zip(candidates, scores), key=lambda pair: pair[1], reverse=True)
+
+
+def rank_candidates_by_method(
+    address: str,
+    candidates: Sequence[str],
+    methods: Sequence[SimilarityMethod],
+    score_cutoff: float = 0.0,
+) -> Dict[SimilarityMethod, List[tuple[str, float]]]:
+    """
+    Rank candidates against an address with several methods in one pass.
+
+    Every string is prepared once and shared by all methods, so
+    normalization and tokenization are not repeated per method.
+
+    Args:
+        address: Original address string
+        candidates: Candidate address strings, in provider relevance order
+        methods: Similarity methods to score with; duplicates are ignored
+        score_cutoff: Candidates scoring below this are ranked as 0.0
+
+    Returns:
+        Mapping of method to its (candidate, score) tuples, best first
+    """
+    methods = list(dict.fromkeys(methods))
+    if not address or not candidates:
+        return {method: [] for method in methods}
+
+    prepared = PreparedAddress(address)
+    prepared_candidates = [PreparedAddress(candidate) for candidate in candidates]
+    ranked = {}
+    for method in methods:
+        scores = _get_instance(method).score_many_prepared(
+            prepared, prepared_candidates, score_cutoff=score_cutoff
+        )
+        ranked[method] = sorted(zip(candidates, scores), key=lambda pair: pair[1], reverse=True)
+    return ranked
+
+
 def baseline_similarity(a: str, b: str) -> float:
     """
     Legacy baseline similarity function.
@@ -70,14 +143,19 @@ def baseline_similarity(a: str, b: str) -> float:
 __all__ = [
     # Base class
     "BaseSimilarity",
+    "PreparedAddress",
+    "normalize_text",
     # Enum
     "SimilarityMethod",
     # Factory functions
     "get_similarity_method",
+    "get_method_version",
     "get_all_methods",
     "list_available_methods",
     # Main functions
     "address_similarity",
+    "rank_candidates",
+    "rank_candidates_by_method",
     "baseline_similarity",
     "DEFAULT_METHOD",
     # Method classes
@@ -1,11 +1,18 @@
 """Abstract base class for similarity methods."""
 
 from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from .prepared import PreparedAddress, normalize_text
 
 
 class BaseSimilarity(ABC):
     """Abstract base class for address similarity calculations."""
 
+    # Bump whenever a change to a method alters the scores it produces, so
+    # rows scored by the previous version are picked up by a rescore
+    version: str = "1"
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -20,9 +27,7 @@ class BaseSimilarity(ABC):
 
     def normalize(self, text: str) -> str:
         """Basic text normalization. Can be overridden by subclasses."""
-        if not text:
-            return ""
-        return " ".join(text.strip().lower().split())
+        return normalize_text(text)
 
     @abstractmethod
     def calculate(self, address_a: str, address_b: str) -> float:
@@ -40,6 +45,52 @@ class BaseSimilarity(ABC):
         """
         pass
 
+    def calculate_many(
+        self,
+        address: str,
+        candidates: Sequence[str],
+        score_cutoff: float = 0.0,
+    ) -> List[float]:
+        """
+        Score one address against many candidates in a single call.
+
+        Preprocessing of `address` is shared across candidates. Scores
+        below `score_cutoff` are reported as 0.0.
+
+        Args:
+            address: Address string to compare against
+            candidates: Candidate address strings
+            score_cutoff: Minimum score to keep
+
+        Returns:
+            One score per candidate, in candidate order
+        """
+        return self.score_many_prepared(
+            PreparedAddress(address),
+            [PreparedAddress(candidate) for candidate in candidates],
+            score_cutoff,
+        )
+
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        """
+        Calculate similarity between two prepared addresses.
+
+        Subclasses override this to read normalized text and cached
+        features from the prepared addresses instead of recomputing them;
+        by default it falls back to `calculate` on the raw strings.
+        """
+        return self.calculate(address_a.raw, address_b.raw)
+
+    def score_many_prepared(
+        self,
+        address: PreparedAddress,
+        candidates: Sequence[PreparedAddress],
+        score_cutoff: float = 0.0,
+    ) -> List[float]:
+        """`calculate_many` for prepared addresses, in candidate order."""
+        scores = [self.score_prepared(address, candidate) for candidate in candidates]
+        return [score if score >= score_cutoff else 0.0 for score in scores]
+
     def __call__(self, address_a: str, address_b: str) -> float:
         """Allow instance to be called as a function."""
         return self.calculate(address_a, address_b)
\ No newline at end of file
@@ -46,6 +46,25 @@ def get_similarity_method(method: SimilarityMethod) -> BaseSimilarity:
     return _METHOD_REGISTRY[method]()
 
 
+def get_method_version(method: SimilarityMethod) -> str:
+    """
+    Get the version of a similarity method without instantiating it.
+
+    Args:
+        method: SimilarityMethod enum value
+
+    Returns:
+        The method class's version string
+
+    Raises:
+        ValueError: If method is not registered
+    """
+    if method not in _METHOD_REGISTRY:
+        raise ValueError(f"Unknown similarity method: {method}")
+
+    return _METHOD_REGISTRY[method].version
+
+
 def get_all_methods() -> Dict[SimilarityMethod, BaseSimilarity]:
     """
     Get instances of all registered similarity methods.
@@ -3,6 +3,7 @@
 import difflib
 
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
 
 
 class BaselineSimilarity(BaseSimilarity):
@@ -25,11 +26,11 @@ class BaselineSimilarity(BaseSimilarity):
         )
 
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        a_norm = self.normalize(address_a)
-        b_norm = self.normalize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        a_norm = address_a.normalized
+        b_norm = address_b.normalized
 
         if not a_norm or not b_norm:
             return 0.0
@@ -1,6 +1,9 @@
 """Fuzzy similarity using rapidfuzz library."""
 
+from typing import List, Sequence
+
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
 
 
 class FuzzySimilarity(BaseSimilarity):
@@ -54,6 +57,24 @@ class FuzzySimilarity(BaseSimilarity):
             0.3 * token_set
         )
 
+    def _rapidfuzz_calculate_many(self, a: str, candidates: List[str]) -> List[float]:
+        """Score one string against many candidates with rapidfuzz's batch API."""
+        from rapidfuzz import fuzz, process
+
+        weighted_scorers = (
+            (fuzz.ratio, 0.2),
+            (fuzz.partial_ratio, 0.2),
+            (fuzz.token_sort_ratio, 0.3),
+            (fuzz.token_set_ratio, 0.3),
+        )
+        scores = [0.0] * len(candidates)
+        for scorer, weight in weighted_scorers:
+            for _, score, index in process.extract(
+                a, candidates, scorer=scorer, limit=None
+            ):
+                scores[index] += weight * score / 100.0
+        return scores
+
     def _fallback_calculate(self, a: str, b: str) -> float:
         """Fallback implementation without rapidfuzz."""
         import difflib
@@ -82,11 +103,11 @@ class FuzzySimilarity(BaseSimilarity):
         return 0.4 * simple_ratio + 0.3 * token_sort + 0.3 * token_set
 
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        a_norm = self.normalize(address_a)
-        b_norm = self.normalize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        a_norm = address_a.normalized
+        b_norm = address_b.normalized
 
         if not a_norm or not b_norm:
             return 0.0
@@ -94,4 +115,24 @@ class FuzzySimilarity(BaseSimilarity):
         if self._rapidfuzz_available:
             return self._rapidfuzz_calculate(a_norm, b_norm)
         else:
-            return self._fallback_calculate(a_norm, b_norm)
\ No newline at end of file
+            return self._fallback_calculate(a_norm, b_norm)
+
+    def score_many_prepared(
+        self,
+        address: PreparedAddress,
+        candidates: Sequence[PreparedAddress],
+        score_cutoff: float = 0.0,
+    ) -> List[float]:
+        if not self._rapidfuzz_available:
+            return super().score_many_prepared(address, candidates, score_cutoff)
+
+        a_norm = address.normalized
+        b_norms = [candidate.normalized for candidate in candidates]
+        if not a_norm:
+            return [0.0] * len(b_norms)
+
+        scores = self._rapidfuzz_calculate_many(a_norm, b_norms)
+        return [
+            score if b_norm and score >= score_cutoff else 0.0
+            for b_norm, score in zip(b_norms, scores)
+        ]
@@ -22,10 +22,15 @@ class GeminiSimilarity(BaseSimilarity):
         self._client = None
         self._model_name = None
         self._available = False
-        self._init_client()
+        # The client is created on first use: listing or enumerating
+        # methods must not import the SDK or print setup messages
+        self._initialized = False
 
     def _init_client(self):
         """Initialize Gemini client if API key is available."""
+        if self._initialized:
+            return
+        self._initialized = True
         try:
             from google import genai
 
@@ -57,6 +62,7 @@ class GeminiSimilarity(BaseSimilarity):
         if not address_a or not address_b:
             return 0.0
 
+        self._init_client()
         if not self._available:
             return 0.5
 
@@ -1,6 +1,24 @@
 """Jaro-Winkler similarity algorithm."""
 
+from functools import lru_cache
+
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
+
+
+@lru_cache(maxsize=None)
+def _rapidfuzz_jaro():
+    """
+    rapidfuzz's Jaro, imported on first use so importing the app skips it.
+
+    Same Jaro similarity, computed in C; the Winkler bonus is applied here
+    because rapidfuzz's JaroWinkler only applies it above a 0.7 threshold.
+    """
+    try:
+        from rapidfuzz.distance import Jaro
+    except ImportError:
+        return None
+    return Jaro
 
 
 class JaroWinklerSimilarity(BaseSimilarity):
@@ -34,6 +52,10 @@ class JaroWinklerSimilarity(BaseSimilarity):
 
     def _jaro_similarity(self, s1: str, s2: str) -> float:
         """Calculate Jaro similarity between two strings."""
+        jaro = _rapidfuzz_jaro()
+        if jaro is not None:
+            return jaro.similarity(s1, s2)
+
         if s1 == s2:
             return 1.0
 
@@ -86,15 +108,19 @@ class JaroWinklerSimilarity(BaseSimilarity):
         ) / 3.0
 
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        a_norm = self.normalize(address_a)
-        b_norm = self.normalize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        a_norm = address_a.normalized
+        b_norm = address_b.normalized
 
         if not a_norm or not b_norm:
             return 0.0
 
+        return self._score_normalized(a_norm, b_norm)
+
+    def _score_normalized(self, a_norm: str, b_norm: str) -> float:
+        """Jaro-Winkler score for two already normalized strings."""
         jaro = self._jaro_similarity(a_norm, b_norm)
 
         # Calculate common prefix length (max 4 chars)
@@ -1,6 +1,19 @@
 """Levenshtein distance based similarity."""
 
+from functools import lru_cache
+
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
+
+
+@lru_cache(maxsize=None)
+def _rapidfuzz_levenshtein():
+    """rapidfuzz's same unit-cost edit distance in C, imported on first use."""
+    try:
+        from rapidfuzz.distance import Levenshtein
+    except ImportError:
+        return None
+    return Levenshtein
 
 
 class LevenshteinSimilarity(BaseSimilarity):
@@ -25,6 +38,10 @@ class LevenshteinSimilarity(BaseSimilarity):
 
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """Calculate Levenshtein distance between two strings."""
+        levenshtein = _rapidfuzz_levenshtein()
+        if levenshtein is not None:
+            return levenshtein.distance(s1, s2)
+
         if len(s1) < len(s2):
             s1, s2 = s2, s1
 
@@ -45,11 +62,11 @@ class LevenshteinSimilarity(BaseSimilarity):
         return previous_row[-1]
 
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        a_norm = self.normalize(address_a)
-        b_norm = self.normalize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        a_norm = address_a.normalized
+        b_norm = address_b.normalized
 
         if not a_norm or not b_norm:
             return 0.0
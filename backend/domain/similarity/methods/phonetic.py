@@ -1,9 +1,11 @@
 """Phonetic similarity using Soundex algorithm."""
 
 import re
-from typing import Set
+from functools import lru_cache
+from typing import Set, Tuple
 
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
 
 
 class PhoneticSimilarity(BaseSimilarity):
@@ -15,6 +17,10 @@ class PhoneticSimilarity(BaseSimilarity):
     E.g., "Parijs" and "Paris" would have similar Soundex codes.
     """
 
+    def __init__(self):
+        # Words repeat across addresses and a word's code never changes
+        self._soundex = lru_cache(maxsize=65536)(self._soundex)
+
     @property
     def name(self) -> str:
         return "Phonetic (Soundex)"
@@ -76,20 +82,24 @@ class PhoneticSimilarity(BaseSimilarity):
         # Only consider meaningful tokens
         return {t for t in tokens if len(t) > 2}
 
+    def _features(self, address: PreparedAddress) -> Tuple[Set[str], Set[str]]:
+        """Tokens and their Soundex codes, cached on the prepared address."""
+        return address.feature("phonetic.codes", self._compute_features)
+
+    def _compute_features(self, address: PreparedAddress) -> Tuple[Set[str], Set[str]]:
+        tokens = self._tokenize(address.normalized)
+        return tokens, {self._soundex(t) for t in tokens}
+
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        tokens_a = self._tokenize(address_a)
-        tokens_b = self._tokenize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        tokens_a, codes_a = self._features(address_a)
+        tokens_b, codes_b = self._features(address_b)
 
         if not tokens_a or not tokens_b:
             return 0.0
 
-        # Generate Soundex codes for all tokens
-        codes_a = {self._soundex(t) for t in tokens_a}
-        codes_b = {self._soundex(t) for t in tokens_b}
-
         # Calculate Jaccard similarity on Soundex codes
         intersection = len(codes_a & codes_b)
         union = len(codes_a | codes_b)
@@ -1,9 +1,11 @@
 """Token-based similarity methods."""
 
+import difflib
 import re
-from typing import Set
+from typing import Set, Tuple
 
 from ..base import BaseSimilarity
+from ..prepared import PreparedAddress
 
 
 class TokenBasedSimilarity(BaseSimilarity):
@@ -46,34 +48,27 @@ class TokenBasedSimilarity(BaseSimilarity):
 
         return intersection / union
 
-    def _token_sort_ratio(self, tokens1: Set[str], tokens2: Set[str]) -> float:
-        """
-        Sort tokens alphabetically and compare.
-        Helps with different orderings of the same components.
-        """
-        sorted1 = " ".join(sorted(tokens1))
-        sorted2 = " ".join(sorted(tokens2))
+    def _features(self, address: PreparedAddress) -> Tuple[Set[str], str]:
+        """Tokens and their sorted join, cached on the prepared address."""
+        return address.feature("token_based.tokens", self._compute_features)
 
-        if not sorted1 or not sorted2:
-            return 0.0
-
-        # Use simple ratio on sorted strings
-        import difflib
-        return difflib.SequenceMatcher(None, sorted1, sorted2).ratio()
+    def _compute_features(self, address: PreparedAddress) -> Tuple[Set[str], str]:
+        tokens = self._tokenize(address.normalized)
+        return tokens, " ".join(sorted(tokens))
 
     def calculate(self, address_a: str, address_b: str) -> float:
-        if not address_a or not address_b:
-            return 0.0
+        return self.score_prepared(PreparedAddress(address_a), PreparedAddress(address_b))
 
-        tokens_a = self._tokenize(address_a)
-        tokens_b = self._tokenize(address_b)
+    def score_prepared(self, address_a: PreparedAddress, address_b: PreparedAddress) -> float:
+        tokens_a, sorted_a = self._features(address_a)
+        tokens_b, sorted_b = self._features(address_b)
 
         if not tokens_a or not tokens_b:
             return 0.0
 
         # Combine Jaccard and token sort ratio
         jaccard = self._jaccard_similarity(tokens_a, tokens_b)
-        token_sort = self._token_sort_ratio(tokens_a, tokens_b)
+        token_sort = difflib.SequenceMatcher(None, sorted_a, sorted_b).ratio()
 
         # Weighted combination (Jaccard is more important for addresses)
-        return 0.6 * jaccard + 0.4 * token_sort
\ No newline at end of file
+        return 0.6 * jaccard + 0.4 * token_sort
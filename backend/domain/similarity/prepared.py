@@ -0,0 +1,40 @@
+"""Preprocessed addresses shared by similarity methods."""
+
+from typing import Any, Callable, Dict
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace; the normalization all methods start from."""
+    if not text:
+        return ""
+    return " ".join(text.strip().lower().split())
+
+
+class PreparedAddress:
+    """
+    An address with its preprocessing computed at most once.
+
+    Scoring one address against several candidates, with several methods,
+    prepares every string once: normalization is shared by all methods,
+    and method-specific features such as token sets are cached under a
+    name the first time a method asks for them.
+    """
+
+    __slots__ = ("raw", "_features")
+
+    def __init__(self, raw: str):
+        self.raw = raw or ""
+        self._features: Dict[str, Any] = {}
+
+    @property
+    def normalized(self) -> str:
+        """The address as returned by `normalize_text`."""
+        return self.feature("normalized", lambda prepared: normalize_text(prepared.raw))
+
+    def feature(self, name: str, compute: Callable[["PreparedAddress"], Any]) -> Any:
+        """Get a derived feature, computing and caching it on first use."""
+        try:
+            return self._features[name]
+        except KeyError:
+            value = self._features[name] = compute(self)
+            return value
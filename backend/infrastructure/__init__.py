@@ -1,14 +1,16 @@
 """Infrastructure layer - Database, external APIs, and persistence."""
 
 from .database import db, Base
-from .entities import AddressEntity
-from .repositories import AddressRepository
+from .entities import AddressEntity, JobEntity
+from .repositories import AddressRepository, JobRepository
 from .clients import MapboxClient
 
 __all__ = [
     "db",
     "Base",
     "AddressEntity",
+    "JobEntity",
     "AddressRepository",
+    "JobRepository",
     "MapboxClient",
 ]
\ No newline at end of file
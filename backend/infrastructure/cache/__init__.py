@@ -1,5 +1,6 @@
 """Cache infrastructure - Redis with in-memory fallback."""
 
-from infrastructure.cache.client import CacheClient, cache_client
+from infrastructure.cache.client import CacheClient, CacheStats, cache_client
+from infrastructure.cache.codecs import CacheCodec, UnknownCacheFormat
 
-__all__ = ["CacheClient", "cache_client"]
\ No newline at end of file
+__all__ = ["CacheClient", "CacheStats", "cache_client", "CacheCodec", "UnknownCacheFormat"]
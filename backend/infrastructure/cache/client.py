@@ -1,95 +1,649 @@
 """Cache client with Redis and in-memory fallback."""
 
-import json
+import asyncio
+import heapq
+import sys
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from config import settings
+from .codecs import CacheCodec, UnknownCacheFormat
+from .invalidation import CacheInvalidator
+from .stampede import AsyncFlights, Flights, Freshness
+
+@dataclass
+class CacheStats:
+    """Counters of a cache tier since it was created."""
+    backend: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # Dropped to stay within the size budget
+    expirations: int = 0  # Dropped when their TTL ran out
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of reads that found a value."""
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+
+# Bytes of bookkeeping per entry: LRU link, expiry heap item and tuples
+ENTRY_OVERHEAD = 200
+
+
+def entry_size(key: str, value: str) -> int:
+    """Approximate memory held by one entry."""
+    return sys.getsizeof(key) + sys.getsizeof(value) + ENTRY_OVERHEAD
 
 
 class InMemoryCache:
-    """Simple in-memory cache with TTL support."""
+    """
+    Bounded, thread-safe in-memory LRU cache with TTL support.
 
-    def __init__(self):
-        self._store: dict[str, tuple[Any, float]] = {}
+    Entries live in an OrderedDict in least-recently-used order, so reads,
+    writes and evictions are O(1). Writes evict from the cold end until
+    both `max_entries` and `max_bytes` hold. Expiry times sit in a min-heap
+    and every operation first drops the entries that are due, so expired
+    values are freed even if their keys are never read again.
+    """
 
-    def get(self, key: str) -> Optional[str]:
-        """Get value from cache if not expired."""
-        if key not in self._store:
-            return None
+    def __init__(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ):
+        self.max_entries = max_entries or settings.cache_max_entries
+        self.max_bytes = max_bytes or settings.cache_max_bytes
+        # key -> (value, expires_at, size)
+        self._store: OrderedDict[str, Tuple[str, float, int]] = OrderedDict()
+        # (expires_at, key); stale after an overwrite or delete, skipped when popped
+        self._expiry: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._stats = CacheStats(backend="memory")
+
+    def _drop(self, key: str) -> None:
+        _, _, size = self._store.pop(key)
+        self._stats.bytes -= size
+
+    def _expire_due(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._drop(key)
+                self._stats.expirations += 1
 
-        value, expires_at = self._store[key]
-        if time.time() > expires_at:
-            del self._store[key]
+    def _compact(self) -> None:
+        # Overwritten keys leave stale heap items behind; rebuild when they dominate
+        if len(self._expiry) > 2 * len(self._store) + 64:
+            self._expiry = [(expires_at, key) for key, (_, expires_at, _) in self._store.items()]
+            heapq.heapify(self._expiry)
+
+    def _get(self, key: str) -> Optional[str]:
+        entry = self._store.get(key)
+        if entry is None:
+            self._stats.misses += 1
             return None
+        self._store.move_to_end(key)
+        self._stats.hits += 1
+        return entry[0]
 
-        return value
+    def _set(self, key: str, value: str, expires_at: float) -> None:
+        if key in self._store:
+            self._drop(key)
+        size = entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        self._store[key] = (value, expires_at, size)
+        self._stats.bytes += size
+        heapq.heappush(self._expiry, (expires_at, key))
+        while len(self._store) > self.max_entries or self._stats.bytes > self.max_bytes:
+            self._drop(next(iter(self._store)))
+            self._stats.evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Get value from cache if not expired."""
+        with self._lock:
+            self._expire_due(time.monotonic())
+            return self._get(key)
 
     def set(self, key: str, value: str, ttl: int) -> None:
-        """Set value with TTL in seconds."""
-        expires_at = time.time() + ttl
-        self._store[key] = (value, expires_at)
+        """Set value with TTL in seconds, evicting least recently used entries if full."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire_due(now)
+            self._set(key, value, now + ttl)
+            self._compact()
 
     def delete(self, key: str) -> None:
         """Delete key from cache."""
-        self._store.pop(key, None)
+        with self._lock:
+            if key in self._store:
+                self._drop(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Get the unexpired values among `keys`."""
+        found = {}
+        with self._lock:
+            self._expire_due(time.monotonic())
+            for key in keys:
+                value = self._get(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def set_many(self, mapping: Dict[str, str], ttl: int) -> None:
+        """Set several values with the same TTL."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire_due(now)
+            for key, value in mapping.items():
+                self._set(key, value, now + ttl)
+            self._compact()
+
+    def delete_many(self, keys: List[str]) -> None:
+        """Delete several keys."""
+        with self._lock:
+            for key in keys:
+                if key in self._store:
+                    self._drop(key)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            self._store.clear()
+            self._expiry.clear()
+            self._stats.bytes = 0
+
+    def expire(self) -> None:
+        """Drop every entry whose TTL has run out."""
+        with self._lock:
+            self._expire_due(time.monotonic())
+
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            self._expire_due(time.monotonic())
+            return replace(self._stats, entries=len(self._store))
 
 
 class CacheClient:
-    """Cache client that uses Redis if available, otherwise in-memory."""
+    """
+    Cache client that uses Redis if available, otherwise in-memory.
+
+    With Redis, an in-process L1 of up to `cache_l1_max_entries` entries
+    sits in front of it: reads served by L1 make no round trip. Writes and
+    deletes go to Redis and are announced on `cache_invalidation_channel`,
+    so every process drops the key from its own L1. An announcement can
+    arrive late or be missed while reconnecting, so L1 entries also live at
+    most `cache_l1_ttl` seconds. Without Redis, the in-memory cache is the
+    only tier and is private to the process.
+
+    Values are text in L1 and bytes encoded by `codec` in Redis, where
+    large ones are compressed; they are decoded once on their way into L1.
+
+    The backend is chosen on first use, or by `connect`, so creating the
+    client does no network I/O.
+    """
 
     def __init__(self):
         self._redis = None
         self._memory_cache = None
+        self._invalidator = None
+        self._codec = None
+        self._connect_lock = threading.Lock()
+        self._l2_lock = threading.Lock()
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._invalidations = 0  # Keys dropped by other processes' writes
+        self._flights = Flights()
+        self._async_flights = AsyncFlights()
+        self._leases: Dict[str, float] = {}  # key -> monotonic expiry, without Redis
+        self._leases_lock = threading.Lock()
+        self._refreshes: Set[asyncio.Task] = set()
+
+    def connect(self) -> None:
+        """Pick the backend: Redis if configured and reachable, else in-memory."""
+        if self._redis is not None or self._memory_cache is not None:
+            return
 
-        if settings.redis_url:
-            try:
-                import redis
-                self._redis = redis.from_url(settings.redis_url)
-                self._redis.ping()  # Test connection
-            except Exception:
-                self._redis = None
+        with self._connect_lock:
+            if self._redis is not None or self._memory_cache is not None:
+                return
+            if settings.redis_url:
+                try:
+                    import redis
+                    client = redis.from_url(settings.redis_url)
+                    client.ping()  # Test connection
+                    self._use_redis(client)
+                    return
+                except Exception:
+                    self._redis = None
 
-        if self._redis is None:
             self._memory_cache = InMemoryCache()
 
+    def _use_redis(self, client) -> None:
+        self._memory_cache = InMemoryCache(max_entries=settings.cache_l1_max_entries)
+        self._invalidator = CacheInvalidator(
+            client,
+            settings.cache_invalidation_channel,
+            on_invalidate=self._invalidate_l1,
+            on_reset=self._memory_cache.clear,
+        )
+        self._invalidator.start()
+        self._redis = client
+
+    def _invalidate_l1(self, keys: List[str]) -> None:
+        self._invalidations += 1
+        self._memory_cache.delete_many(keys)
+
+    def _l1_ttl(self, ttl: int) -> int:
+        return min(ttl, settings.cache_l1_ttl)
+
+    def _publish(self, target, keys: List[str]) -> None:
+        if self._invalidator is not None:
+            self._invalidator.publish(target, keys)
+
+    def _count_l2(self, hits: int, misses: int) -> None:
+        with self._l2_lock:
+            self._l2_hits += hits
+            self._l2_misses += misses
+
     @property
     def is_redis(self) -> bool:
         """Check if using Redis backend."""
+        self.connect()
         return self._redis is not None
 
+    @property
+    def codec(self) -> CacheCodec:
+        """Encoding of values stored in Redis."""
+        if self._codec is None:
+            self._codec = CacheCodec()
+        return self._codec
+
+    def _decode(self, data: Optional[bytes]) -> Optional[str]:
+        if not data:
+            return None
+        try:
+            return self.codec.decode(data)
+        except UnknownCacheFormat:
+            return None  # Written by a process with more compressors installed: a miss here
+
+    def _read_l2(self, key: str) -> Optional[str]:
+        """A value from Redis, decoded and kept in L1."""
+        invalidations = self._invalidations
+        value = self._decode(self._redis.get(key))
+        self._count_l2(int(value is not None), int(value is None))
+        if value is None:
+            return None
+        # An invalidation during the round trip may be for this key: do not cache it
+        if invalidations == self._invalidations:
+            self._memory_cache.set(key, value, settings.cache_l1_ttl)
+        return value
+
+    def _read_l2_many(self, keys: List[str]) -> Dict[str, str]:
+        """Values found in Redis among `keys`, in one round trip, decoded and kept in L1."""
+        invalidations = self._invalidations
+        decoded = zip(keys, map(self._decode, self._redis.mget(keys)))
+        fetched = {key: value for key, value in decoded if value is not None}
+        self._count_l2(len(fetched), len(keys) - len(fetched))
+        if fetched and invalidations == self._invalidations:
+            self._memory_cache.set_many(fetched, settings.cache_l1_ttl)
+        return fetched
+
+    def _fetch(self, key: str) -> Optional[str]:
+        """A value from L1, else from Redis."""
+        self.connect()
+        value = self._memory_cache.get(key)
+        if value is not None or not self._redis:
+            return value
+        return self._read_l2(key)
+
+    async def _afetch(self, key: str) -> Optional[str]:
+        """`_fetch`, with the Redis round trip on a worker thread."""
+        await self.aconnect()
+        value = self._memory_cache.get(key)
+        if value is not None or not self._redis:
+            return value
+        return await asyncio.to_thread(self._read_l2, key)
+
+    def _fetch_many(self, keys: List[str]) -> Dict[str, str]:
+        """Values found among `keys`, from L1 and then one Redis round trip."""
+        if not keys:
+            return {}
+        self.connect()
+        found = self._memory_cache.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if self._redis and missing:
+            found.update(self._read_l2_many(missing))
+        return found
+
+    async def _afetch_many(self, keys: List[str]) -> Dict[str, str]:
+        """`_fetch_many`, with the Redis round trip on a worker thread."""
+        if not keys:
+            return {}
+        await self.aconnect()
+        found = self._memory_cache.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if self._redis and missing:
+            found.update(await asyncio.to_thread(self._read_l2_many, missing))
+        return found
+
     def get(self, key: str) -> Optional[str]:
-        """Get value from cache."""
-        if self._redis:
-            value = self._redis.get(key)
-            return value.decode() if value else None
-        return self._memory_cache.get(key)
+        """Get value from cache, from L1 when it holds it."""
+        return self._fetch(key)
 
     def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
         """Set value with optional TTL."""
+        self._store({key: value}, ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete key from cache."""
+        self.delete_many([key])
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Get several values in one round trip; missing keys are left out."""
+        return self._fetch_many(keys)
+
+    def set_many(self, mapping: Dict[str, str], ttl: Optional[int] = None) -> None:
+        """Set several values with optional TTL in one round trip."""
+        if mapping:
+            self._store(mapping, ttl)
+
+    def delete_many(self, keys: List[str]) -> None:
+        """Delete several keys in one round trip."""
+        if not keys:
+            return
+        self.connect()
+        self._memory_cache.delete_many(keys)
+        if self._redis:
+            self._delete_l2(keys)
+
+    def _delete_l2(self, keys: List[str]) -> None:
+        pipeline = self._redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.delete(key)
+        self._publish(pipeline, keys)
+        pipeline.execute()
+
+    def _store(self, mapping: Dict[str, str], ttl: Optional[int]) -> None:
+        self.connect()
+        ttl = ttl or settings.cache_ttl
+        if self._redis:
+            self._write_l2(mapping, ttl)
+            ttl = self._l1_ttl(ttl)
+        self._memory_cache.set_many(mapping, ttl)
+
+    def _write_l2(self, mapping: Dict[str, str], ttl: int) -> None:
+        # MSET has no TTL, so pipeline SETEX commands instead
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.setex(key, ttl, self.codec.encode(value))
+        self._publish(pipeline, list(mapping))
+        pipeline.execute()
+
+    # Asyncio interface: L1 is read and written in place, Redis round trips
+    # run on worker threads so they never block the event loop
+
+    async def aconnect(self) -> None:
+        """`connect`, with the first Redis ping on a worker thread."""
+        if self._redis is None and self._memory_cache is None:
+            await asyncio.to_thread(self.connect)
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Get value from cache, from L1 when it holds it."""
+        return await self._afetch(key)
+
+    async def aset(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """Set value with optional TTL."""
+        await self._astore({key: value}, ttl)
+
+    async def adelete(self, key: str) -> None:
+        """Delete key from cache."""
+        await self.adelete_many([key])
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, str]:
+        """Get several values in one round trip; missing keys are left out."""
+        return await self._afetch_many(keys)
+
+    async def aset_many(self, mapping: Dict[str, str], ttl: Optional[int] = None) -> None:
+        """Set several values with optional TTL in one round trip."""
+        if mapping:
+            await self._astore(mapping, ttl)
+
+    async def adelete_many(self, keys: List[str]) -> None:
+        """Delete several keys in one round trip."""
+        if not keys:
+            return
+        await self.aconnect()
+        self._memory_cache.delete_many(keys)
+        if self._redis:
+            await asyncio.to_thread(self._delete_l2, keys)
+
+    async def _astore(self, mapping: Dict[str, str], ttl: Optional[int]) -> None:
+        await self.aconnect()
         ttl = ttl or settings.cache_ttl
         if self._redis:
-            self._redis.setex(key, ttl, value)
+            await asyncio.to_thread(self._write_l2, mapping, ttl)
+            ttl = self._l1_ttl(ttl)
+        self._memory_cache.set_many(mapping, ttl)
+
+    # Stampede protection
+
+    def _freshness_key(self, key: str) -> str:
+        return f"{key}:freshness"
+
+    def _lease_key(self, key: str) -> str:
+        return f"{key}:lease"
+
+    def _lookup(self, key: str) -> Tuple[Optional[str], str]:
+        """
+        The cached value of `key` and what to do about it.
+
+        One of "fresh" (serve it), "early" (serve it, or refresh it first if
+        this caller gets the lease), "stale" (serve it, refreshing in the
+        background) or "miss" (compute it).
+        """
+        return self._classify(key, self.get_many([key, self._freshness_key(key)]))
+
+    async def _alookup(self, key: str) -> Tuple[Optional[str], str]:
+        """`_lookup`, with the Redis round trip on a worker thread."""
+        return self._classify(key, await self.aget_many([key, self._freshness_key(key)]))
+
+    def _classify(self, key: str, found: Dict[str, str]) -> Tuple[Optional[str], str]:
+        value = found.get(key)
+        if value is None:
+            return None, "miss"
+        freshness = Freshness.decode(found.get(self._freshness_key(key)))
+        now = time.time()
+        if freshness is None or not freshness.refresh_due(now, settings.cache_early_refresh_beta):
+            return value, "fresh"  # Values set without freshness live until their TTL
+        if now < freshness.expires_at:
+            return value, "early"
+        return (value, "stale") if settings.cache_stale_ttl > 0 else (None, "miss")
+
+    def _acquire_lease(self, key: str) -> bool:
+        """Claim the right to compute `key` across processes, for at most the lease timeout."""
+        timeout = settings.cache_lease_timeout
+        if self._redis:
+            return bool(self._redis.set(self._lease_key(key), "1", nx=True, px=int(timeout * 1000)))
+        now = time.monotonic()
+        with self._leases_lock:
+            if self._leases.get(key, 0.0) > now:
+                return False
+            self._leases[key] = now + timeout
+            return True
+
+    async def _aacquire_lease(self, key: str) -> bool:
+        """`_acquire_lease`, with the Redis round trip on a worker thread."""
+        if self._redis:
+            return await asyncio.to_thread(self._acquire_lease, key)
+        return self._acquire_lease(key)
+
+    def _release_lease(self, key: str) -> None:
+        if self._redis:
+            self._redis.delete(self._lease_key(key))
         else:
-            self._memory_cache.set(key, value, ttl)
+            with self._leases_lock:
+                self._leases.pop(key, None)
 
-    def delete(self, key: str) -> None:
-        """Delete key from cache."""
+    async def _arelease_lease(self, key: str) -> None:
         if self._redis:
-            self._redis.delete(key)
+            await asyncio.to_thread(self._release_lease, key)
         else:
-            self._memory_cache.delete(key)
-
-    def get_json(self, key: str) -> Optional[dict]:
-        """Get and deserialize JSON value."""
-        value = self.get(key)
-        if value:
-            return json.loads(value)
-        return None
-
-    def set_json(self, key: str, value: dict, ttl: Optional[int] = None) -> None:
-        """Serialize and set JSON value."""
-        self.set(key, json.dumps(value), ttl)
+            self._release_lease(key)
+
+    def _computed(self, key: str, value: str, ttl: int, delta: float) -> Dict[str, str]:
+        """The value and freshness entries of a computed `key`."""
+        return {key: value, self._freshness_key(key): Freshness(time.time() + ttl, delta).encode()}
+
+    def _store_computed(self, key: str, value: Optional[str], ttl: int, delta: float) -> None:
+        if value is None:
+            return  # Nothing to cache, e.g. a missing row
+        # Kept past expiry for the stale-while-revalidate window
+        self.set_many(self._computed(key, value, ttl, delta), ttl + settings.cache_stale_ttl)
+
+    async def _astore_computed(
+        self, key: str, value: Optional[str], ttl: int, delta: float
+    ) -> None:
+        if value is not None:
+            await self.aset_many(
+                self._computed(key, value, ttl, delta), ttl + settings.cache_stale_ttl
+            )
+
+    def _compute(self, key: str, compute: Callable[[], Optional[str]], ttl: int) -> Optional[str]:
+        """Compute and store `key`, releasing the lease held for it."""
+        started = time.perf_counter()
+        try:
+            value = compute()
+            self._store_computed(key, value, ttl, time.perf_counter() - started)
+            return value
+        finally:
+            self._release_lease(key)
+
+    def _compute_missing(
+        self, key: str, compute: Callable[[], Optional[str]], ttl: int
+    ) -> Optional[str]:
+        if self._acquire_lease(key):
+            return self._compute(key, compute, ttl)
+        # Another process is computing it: wait for its value, up to the lease timeout
+        deadline = time.monotonic() + settings.cache_lease_timeout
+        while time.monotonic() < deadline:
+            time.sleep(settings.cache_lease_poll_interval)
+            value = self.get(key)
+            if value is not None:
+                return value
+        return compute()
+
+    def get_or_compute(
+        self, key: str, compute: Callable[[], Optional[str]], ttl: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Get `key`, computing and caching it with `compute` when needed.
+
+        Protects the source behind `compute` from stampedes at expiry:
+
+        - Concurrent misses are collapsed: one thread per process, and one
+          process with Redis, computes while the others wait for its value.
+        - Before expiry, callers refresh early with a probability rising as
+          expiry nears (XFetch, `cache_early_refresh_beta`), so one caller
+          refreshes while the others keep being served.
+        - For `cache_stale_ttl` seconds after expiry the old value is
+          served while one caller recomputes it in the background.
+
+        `compute` returning None caches nothing.
+        """
+        ttl = ttl or settings.cache_ttl
+        value, state = self._lookup(key)
+        if state == "fresh":
+            return value
+        if state == "early":
+            return self._compute(key, compute, ttl) if self._acquire_lease(key) else value
+        if state == "stale":
+            if self._acquire_lease(key):
+                threading.Thread(
+                    target=self._compute, args=(key, compute, ttl),
+                    name="cache-refresh", daemon=True,
+                ).start()
+            return value
+        return self._flights.run(
+            key, lambda: self._compute_missing(key, compute, ttl), settings.cache_lease_timeout
+        )
+
+    async def _acompute(
+        self, key: str, compute: Callable[[], Awaitable[Optional[str]]], ttl: int
+    ) -> Optional[str]:
+        started = time.perf_counter()
+        try:
+            value = await compute()
+            await self._astore_computed(key, value, ttl, time.perf_counter() - started)
+            return value
+        finally:
+            await self._arelease_lease(key)
+
+    async def _acompute_missing(
+        self, key: str, compute: Callable[[], Awaitable[Optional[str]]], ttl: int
+    ) -> Optional[str]:
+        if await self._aacquire_lease(key):
+            return await self._acompute(key, compute, ttl)
+        deadline = time.monotonic() + settings.cache_lease_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.cache_lease_poll_interval)
+            value = await self.aget(key)
+            if value is not None:
+                return value
+        return await compute()
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Optional[str]]],
+        ttl: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        `get_or_compute` for a coroutine function.
+
+        Neither waiting nor Redis round trips block the loop: the latter
+        run on worker threads.
+        """
+        ttl = ttl or settings.cache_ttl
+        value, state = await self._alookup(key)
+        if state == "fresh":
+            return value
+        if state == "early":
+            if await self._aacquire_lease(key):
+                return await self._acompute(key, compute, ttl)
+            return value
+        if state == "stale":
+            if await self._aacquire_lease(key):
+                task = asyncio.get_running_loop().create_task(self._acompute(key, compute, ttl))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+            return value
+        return await self._async_flights.run(
+            key, lambda: self._acompute_missing(key, compute, ttl)
+        )
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Hit, miss, eviction and size counters per tier: "l1", and "l2" with Redis."""
+        self.connect()
+        tiers = {"l1": self._memory_cache.stats()}
+        if self._redis:
+            info = self._redis.info()
+            tiers["l2"] = CacheStats(
+                backend="redis",
+                hits=self._l2_hits,
+                misses=self._l2_misses,
+                evictions=info.get("evicted_keys", 0),
+                expirations=info.get("expired_keys", 0),
+                entries=self._redis.dbsize(),
+                bytes=info.get("used_memory", 0),
+            )
+        return tiers
 
 
 # Singleton instance
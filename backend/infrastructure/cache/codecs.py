@@ -0,0 +1,91 @@
+"""Encoding of cached text for Redis: optional compression behind a format header.
+
+Every cached payload is text: JSON response bodies, list pages, counts.
+Values of at least the compression threshold are compressed and stored
+as a two-byte header, a marker byte that never starts valid UTF-8 and
+the compressor id, followed by the compressed bytes. Smaller values are
+stored as plain UTF-8, which is also how every value was written before
+the header existed, so both kinds are read while workers are rolled out.
+
+zstandard and lz4 are used when installed; zlib is always available.
+"""
+
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from config import settings
+
+MARKER = 0xFF  # Never the first byte of UTF-8 text
+
+
+class UnknownCacheFormat(ValueError):
+    """Raised for a value written with a compressor this process lacks."""
+
+
+@dataclass(frozen=True)
+class Compressor:
+    """A compression scheme, with the id recorded in the header."""
+    name: str
+    id: int
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+COMPRESSORS: Dict[str, Compressor] = {
+    "zlib": Compressor("zlib", 1, zlib.compress, zlib.decompress),
+}
+
+try:
+    import zstandard
+
+    COMPRESSORS["zstd"] = Compressor(
+        "zstd", 2, zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    )
+except ImportError:  # pragma: no cover - depends on environment
+    pass
+
+try:
+    import lz4.frame
+
+    COMPRESSORS["lz4"] = Compressor("lz4", 3, lz4.frame.compress, lz4.frame.decompress)
+except ImportError:  # pragma: no cover - depends on environment
+    pass
+
+_COMPRESSORS_BY_ID = {compressor.id: compressor for compressor in COMPRESSORS.values()}
+
+
+class CacheCodec:
+    """
+    Encodes cached text to the bytes stored in Redis, and back.
+
+    Only values of at least `threshold` UTF-8 bytes are compressed, with
+    `compression` ("none" or a key of COMPRESSORS). A configured
+    compressor that is not installed falls back to none. Decoding follows
+    each value's own header, whatever this codec writes.
+    """
+
+    def __init__(self, compression: Optional[str] = None, threshold: Optional[int] = None):
+        self.compressor = COMPRESSORS.get(compression or settings.cache_compression)
+        self.threshold = settings.cache_compression_threshold if threshold is None else threshold
+
+    def encode(self, value: str) -> bytes:
+        """UTF-8 bytes of `value`, compressed and prefixed with the header if large enough."""
+        data = value.encode()
+        if self.compressor is None or len(data) < self.threshold:
+            return data
+        return bytes((MARKER, self.compressor.id)) + self.compressor.compress(data)
+
+    def decode(self, data: bytes) -> str:
+        """
+        The text of a value written by any codec, or as plain UTF-8.
+
+        Raises:
+            UnknownCacheFormat: If the value's compressor is not installed
+        """
+        if not data or data[0] != MARKER:
+            return data.decode()
+        compressor = _COMPRESSORS_BY_ID.get(data[1])
+        if compressor is None:
+            raise UnknownCacheFormat(f"Unknown cache compressor {data[1]}")
+        return compressor.decompress(data[2:]).decode()
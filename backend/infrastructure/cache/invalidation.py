@@ -0,0 +1,78 @@
+"""Cross-process invalidation of in-process cache tiers over Redis pub/sub."""
+
+import json
+import threading
+import uuid
+from typing import Callable, List
+
+
+class CacheInvalidator:
+    """
+    Broadcasts changed keys to every process sharing a Redis, and applies theirs.
+
+    Each process sends `{"origin": ..., "keys": [...]}` on `channel` when
+    it writes or deletes keys, and drops the keys other processes announce
+    from its own in-process tier. Messages sent while a process is not
+    subscribed are lost, so `on_reset` is called on every (re)subscription
+    to drop everything the process may have missed.
+    """
+
+    RECONNECT_DELAY = 1.0  # seconds
+
+    def __init__(
+        self,
+        redis_client,
+        channel: str,
+        on_invalidate: Callable[[List[str]], None],
+        on_reset: Callable[[], None],
+    ):
+        self._redis = redis_client
+        self._channel = channel
+        self._on_invalidate = on_invalidate
+        self._on_reset = on_reset
+        self._origin = uuid.uuid4().hex
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def publish(self, target, keys: List[str]) -> None:
+        """Announce changed keys; `target` is the client or a pipeline to send with."""
+        target.publish(self._channel, json.dumps({"origin": self._origin, "keys": keys}))
+
+    def start(self) -> None:
+        """Start listening for other processes' invalidations."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._listen, name="cache-invalidation", daemon=True
+        )
+        self._thread.start()
+
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self._channel)
+                self._on_reset()
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=self.RECONNECT_DELAY)
+                    if message is not None:
+                        self.handle(message["data"])
+            except Exception as e:
+                print(f"Cache invalidation listener error: {type(e).__name__}: {e}")
+                self._on_reset()
+                self._stopping.wait(self.RECONNECT_DELAY)
+            finally:
+                pubsub.close()
+
+    def handle(self, data: bytes | str) -> None:
+        """Apply one invalidation message, ignoring this process's own."""
+        message = json.loads(data)
+        if message["origin"] != self._origin:
+            self._on_invalidate(message["keys"])
+
+    def stop(self) -> None:
+        """Stop listening."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,124 @@
+"""Building blocks of stampede protection for CacheClient.get_or_compute."""
+
+import asyncio
+import math
+import random
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """When a computed value expires, and how long computing it took (seconds)."""
+    expires_at: float  # Unix time, comparable across processes
+    delta: float
+
+    def encode(self) -> str:
+        return f"{self.expires_at:.6f},{self.delta:.6f}"
+
+    @classmethod
+    def decode(cls, text: Optional[str]) -> Optional["Freshness"]:
+        """Parse `encode` output; None for a missing or malformed value."""
+        try:
+            expires_at, delta = text.split(",")
+            return cls(float(expires_at), float(delta))
+        except (AttributeError, ValueError):
+            return None
+
+    def refresh_due(self, now: float, beta: float) -> bool:
+        """
+        Whether this caller should recompute now (XFetch).
+
+        True once expired; before that with a probability rising as expiry
+        nears, sooner for values that are slow to compute. With many callers
+        one of them refreshes shortly before expiry, instead of all of them
+        missing at once after it. `beta` 0 disables early refresh.
+        """
+        if now >= self.expires_at:
+            return True
+        if beta <= 0:
+            return False
+        # 1 - random() is in (0, 1], so the log is defined
+        return now - self.delta * beta * math.log(1.0 - random.random()) >= self.expires_at
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.failed = False
+        self.value = None
+
+
+class Flights:
+    """
+    Collapses concurrent computations of one key within a process (threads).
+
+    The first caller for a key computes it; callers arriving meanwhile wait
+    for its result. If it fails or takes longer than `timeout`, they compute
+    it themselves.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: str, compute: Callable[[], T], timeout: float) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if flight.done.wait(timeout) and not flight.failed:
+                return flight.value
+            return compute()
+
+        try:
+            flight.value = compute()
+            return flight.value
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncFlights:
+    """
+    Collapses concurrent computations of one key within an event loop.
+
+    Like `Flights`, waiters share the first caller's result, and compute
+    the value themselves if that caller fails or is cancelled.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get(key)
+        if flight is not None and flight.get_loop() is loop:
+            # Waiting does not cancel the shared flight if this caller is cancelled
+            await asyncio.wait({flight})
+            if not flight.cancelled():
+                return flight.result()
+            return await compute()
+
+        flight = loop.create_future()
+        self._flights[key] = flight
+        try:
+            value = await compute()
+            flight.set_result(value)
+            return value
+        except BaseException:
+            flight.cancel()
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
@@ -1,5 +1,5 @@
 """External API clients."""
 
-from .mapbox import MapboxClient
+from .mapbox import AsyncMapboxClient, MapboxClient
 
-__all__ = ["MapboxClient"]
\ No newline at end of file
+__all__ = ["AsyncMapboxClient", "MapboxClient"]
\ No newline at end of file
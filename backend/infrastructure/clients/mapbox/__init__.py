@@ -1,10 +1,18 @@
 """Mapbox client module."""
 
-from .client import MapboxClient
-from .models import MapboxResponse, MapboxFeature, MapboxProperties
+from .client import AsyncMapboxClient, BaseMapboxClient, MapboxClient
+from .decoding import MapboxDecodeError, decode_batch, decode_best_match, decode_candidates
+from .models import MapboxBatchResponse, MapboxResponse, MapboxFeature, MapboxProperties
 
 __all__ = [
+    "AsyncMapboxClient",
+    "BaseMapboxClient",
     "MapboxClient",
+    "MapboxDecodeError",
+    "decode_batch",
+    "decode_best_match",
+    "decode_candidates",
+    "MapboxBatchResponse",
     "MapboxResponse",
     "MapboxFeature",
     "MapboxProperties",
@@ -2,25 +2,108 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import TYPE_CHECKING, List, Optional
 
 import requests
 from pydantic import ValidationError
 
 from config import settings
-from .models import MapboxResponse
+from .decoding import MapboxDecodeError, decode_batch, decode_best_match, decode_candidates
+from .models import MapboxBatchResponse, MapboxResponse
 
+if TYPE_CHECKING:
+    import aiohttp
 
-class MapboxClient:
-    """Client for Mapbox Geocoding API."""
+# Mapbox v6 accepts up to 1000 queries per batch request
+MAX_BATCH_QUERIES = 1000
+
+
+class BaseMapboxClient:
+    """Configuration and response decoding shared by the sync and async clients."""
 
-    def __init__(self, token: str | None = None, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str | None = None,
+        debug_decoding: bool | None = None,
+    ) -> None:
         self.token = token or settings.mapbox_access_token
         self.base_url = base_url or settings.mapbox_base_url
+        # v6 serves batch geocoding next to forward: .../geocode/v6/{forward,batch}
+        self.batch_url = self.base_url.rsplit("/", 1)[0] + "/batch"
+        # Debug mode validates whole responses with pydantic instead of the lean decoder
+        self.debug_decoding = (
+            settings.mapbox_debug_decoding if debug_decoding is None else debug_decoding
+        )
 
         if not self.token:
             raise Exception("MAPBOX_ACCESS_TOKEN must be set")
 
+    def _params(self, query: str, limit: int) -> dict:
+        return {
+            "q": query,
+            "access_token": self.token,
+            "limit": limit,
+        }
+
+    def _validate(self, payload: bytes) -> Optional[MapboxResponse]:
+        """Full pydantic validation of a response (debug decode mode)."""
+        try:
+            return MapboxResponse.model_validate_json(payload)
+        except ValidationError as e:
+            print(f"Mapbox response validation error: {e}")
+            return None
+
+    def _decode_candidates(self, payload: Optional[bytes]) -> Optional[List[str]]:
+        """Candidate addresses of a forward response, in relevance order; None if it failed."""
+        if payload is None:
+            return None
+
+        if self.debug_decoding:
+            mapbox_response = self._validate(payload)
+            return mapbox_response.get_candidates() if mapbox_response else None
+
+        try:
+            return decode_candidates(payload)
+        except MapboxDecodeError as e:
+            print(f"Mapbox response decode error: {e}")
+            return None
+
+    def _decode_batch(self, payload: Optional[bytes], expected: int) -> List[Optional[List[str]]]:
+        """Candidates per query of a batch response; None for every query if it failed."""
+        if payload is None:
+            return [None] * expected
+
+        try:
+            if self.debug_decoding:
+                batch = MapboxBatchResponse.model_validate_json(payload).get_candidates()
+            else:
+                batch = decode_batch(payload)
+        except (ValidationError, MapboxDecodeError) as e:
+            print(f"Mapbox batch response decode error: {e}")
+            return [None] * expected
+
+        if len(batch) != expected:
+            print(f"Mapbox batch response has {len(batch)} results for {expected} queries")
+            return [None] * expected
+        return batch
+
+
+class MapboxClient(BaseMapboxClient):
+    """Client for Mapbox Geocoding API."""
+
+    def _forward(self, query: str, limit: int) -> Optional[bytes]:
+        """Run a forward geocoding request and return the raw response body."""
+        try:
+            response = requests.get(self.base_url, params=self._params(query, limit), timeout=10)
+            response.raise_for_status()
+            return response.content
+
+        except requests.RequestException as e:
+            print(f"Mapbox API error: {e}")
+            return None
+
     def geocode_best_match(self, query: str) -> Optional[str]:
         """
         Find the best matching address for a given query using Mapbox Geocoding API.
@@ -30,22 +113,136 @@ class MapboxClient:
         if not query or not query.strip():
             return None
 
-        params = {
-            "q": query,
-            "access_token": self.token,
-            "limit": 1,
-        }
+        payload = self._forward(query, limit=1)
+        if payload is None:
+            return None
+
+        if self.debug_decoding:
+            mapbox_response = self._validate(payload)
+            return mapbox_response.get_best_match() if mapbox_response else None
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+            return decode_best_match(payload)
+        except MapboxDecodeError as e:
+            print(f"Mapbox response decode error: {e}")
+            return None
 
-            mapbox_response = MapboxResponse.model_validate(response.json())
-            return mapbox_response.get_best_match()
+    def geocode_candidates(self, query: str, limit: int | None = None) -> List[str]:
+        """
+        Fetch up to `limit` candidate addresses for a query in one request.
 
-        except ValidationError as e:
-            print(f"Mapbox response validation error: {e}")
+        Candidates are returned in Mapbox relevance order so callers can
+        re-rank them without issuing further requests.
+        """
+        return self.lookup_candidates(query, limit) or []
+
+    def lookup_candidates(self, query: str, limit: int | None = None) -> Optional[List[str]]:
+        """Like `geocode_candidates`, but None when the request or decoding failed."""
+        if not query or not query.strip():
+            return []
+
+        limit = limit or settings.mapbox_candidate_limit
+        return self._decode_candidates(self._forward(query, limit=limit))
+
+
+class AsyncMapboxClient(BaseMapboxClient):
+    """
+    Asyncio client for Mapbox Geocoding API.
+
+    Requests share one pooled aiohttp session, so concurrent lookups wait
+    on sockets instead of holding a thread each. Call `aclose` on shutdown.
+    aiohttp is imported with the first session, keeping it off the import
+    path of processes that never geocode asynchronously.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str | None = None,
+        debug_decoding: bool | None = None,
+    ) -> None:
+        super().__init__(token, base_url, debug_decoding)
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazily created so the session binds to the running event loop."""
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.mapbox_max_connections),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    async def _forward(self, query: str, limit: int) -> Optional[bytes]:
+        """Run a forward geocoding request and return the raw response body."""
+        import aiohttp
+
+        try:
+            async with self.session.get(self.base_url, params=self._params(query, limit)) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Mapbox API error: {e}")
             return None
-        except requests.RequestException as e:
+
+    async def geocode_candidates(self, query: str, limit: int | None = None) -> List[str]:
+        """Fetch up to `limit` candidate addresses for a query in one request."""
+        return await self.lookup_candidates(query, limit) or []
+
+    async def lookup_candidates(
+        self, query: str, limit: int | None = None
+    ) -> Optional[List[str]]:
+        """Like `geocode_candidates`, but None when the request or decoding failed."""
+        if not query or not query.strip():
+            return []
+
+        limit = limit or settings.mapbox_candidate_limit
+        return self._decode_candidates(await self._forward(query, limit=limit))
+
+    async def _batch(self, queries: List[str], limit: int) -> Optional[bytes]:
+        """Run one batch geocoding request and return the raw response body."""
+        import aiohttp
+
+        body = [{"q": query, "limit": limit} for query in queries]
+        try:
+            async with self.session.post(
+                self.batch_url, params={"access_token": self.token}, json=body
+            ) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Mapbox API error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def geocode_batch(
+        self, queries: List[str], limit: int | None = None
+    ) -> List[Optional[List[str]]]:
+        """
+        Fetch candidates for many queries through the batch API.
+
+        Returns candidates per query in input order, or None for queries
+        whose request failed. Chunks of up to MAX_BATCH_QUERIES are sent
+        concurrently.
+        """
+        limit = limit or settings.mapbox_candidate_limit
+        chunks = [
+            queries[start:start + MAX_BATCH_QUERIES]
+            for start in range(0, len(queries), MAX_BATCH_QUERIES)
+        ]
+        payloads = await asyncio.gather(*(self._batch(chunk, limit) for chunk in chunks))
+        return [
+            candidates
+            for chunk, payload in zip(chunks, payloads)
+            for candidates in self._decode_batch(payload, len(chunk))
+        ]
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,92 @@
+"""Lean decoding of Mapbox responses without full pydantic validation.
+
+Only the property fields used by `MapboxProperties.get_best_address` are
+read; geometry, context and the remaining properties are never turned into
+models. Uses orjson when installed, falling back to the stdlib json module.
+"""
+
+import json
+from typing import Any, List, Optional
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+
+class MapboxDecodeError(ValueError):
+    """Raised when a Mapbox payload does not have the expected shape."""
+
+
+def _best_address(properties: Any) -> Optional[str]:
+    """Same selection rules as `MapboxProperties.get_best_address`."""
+    if not isinstance(properties, dict):
+        raise MapboxDecodeError("feature properties must be an object")
+
+    full_address = properties.get("full_address")
+    if full_address:
+        return full_address
+    name = properties.get("name")
+    place_formatted = properties.get("place_formatted")
+    if name and place_formatted:
+        return f"{name}, {place_formatted}"
+    return name or place_formatted
+
+
+def _parse(payload: bytes) -> Any:
+    """Parse JSON bytes, reporting malformed input as MapboxDecodeError."""
+    try:
+        return _loads(payload)
+    except (TypeError, ValueError) as e:
+        raise MapboxDecodeError(f"invalid JSON: {e}") from e
+
+
+def _features(collection: Any) -> List[Any]:
+    """Feature list of a FeatureCollection."""
+    if not isinstance(collection, dict):
+        raise MapboxDecodeError("response must be an object")
+
+    features = collection.get("features", [])
+    if not isinstance(features, list):
+        raise MapboxDecodeError("features must be a list")
+    return features
+
+
+def _properties(feature: Any) -> Any:
+    """Properties object of a feature."""
+    if not isinstance(feature, dict) or "properties" not in feature:
+        raise MapboxDecodeError("feature must have properties")
+    return feature["properties"]
+
+
+def _collection_candidates(collection: Any) -> List[str]:
+    """Distinct best addresses of a FeatureCollection, in relevance order."""
+    candidates: List[str] = []
+    for feature in _features(collection):
+        address = _best_address(_properties(feature))
+        if address and address not in candidates:
+            candidates.append(address)
+    return candidates
+
+
+def decode_candidates(payload: bytes) -> List[str]:
+    """Decode a forward geocoding response into candidate addresses."""
+    return _collection_candidates(_parse(payload))
+
+
+def decode_best_match(payload: bytes) -> Optional[str]:
+    """Decode a forward geocoding response into its best match."""
+    features = _features(_parse(payload))
+    if not features:
+        return None
+    return _best_address(_properties(features[0]))
+
+
+def decode_batch(payload: bytes) -> List[List[str]]:
+    """Decode a batch geocoding response into candidates per query."""
+    document = _parse(payload)
+    if not isinstance(document, dict) or not isinstance(document.get("batch"), list):
+        raise MapboxDecodeError("batch response must have a batch list")
+    return [_collection_candidates(collection) for collection in document["batch"]]
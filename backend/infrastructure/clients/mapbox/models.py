@@ -38,4 +38,22 @@ class MapboxResponse(BaseModel):
         """Return the best matching address from the response."""
         if not self.features:
             return None
-        return self.features[0].properties.get_best_address()
\ No newline at end of file
+        return self.features[0].properties.get_best_address()
+
+    def get_candidates(self) -> List[str]:
+        """Return all distinct candidate addresses in relevance order."""
+        candidates: List[str] = []
+        for feature in self.features:
+            address = feature.properties.get_best_address()
+            if address and address not in candidates:
+                candidates.append(address)
+        return candidates
+
+
+class MapboxBatchResponse(BaseModel):
+    """Mapbox batch geocoding API response."""
+    batch: List[MapboxResponse] = Field(default_factory=list)
+
+    def get_candidates(self) -> List[List[str]]:
+        """Return candidate addresses for each query in the batch."""
+        return [response.get_candidates() for response in self.batch]
\ No newline at end of file
@@ -1,16 +1,37 @@
 """Database configuration and session management."""
 
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, make_url, text
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
 from config import settings
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 Base = declarative_base()
 
+# Async drivers used for the request path, keyed by backend name
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+
+def async_url(url: str) -> str:
+    """Swap a sync database URL's driver for its asyncio counterpart."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.get_driver_name() == driver:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
 
 class Database:
     """Database connection manager with session pooling."""
@@ -19,6 +40,8 @@ class Database:
         self._url = url or settings.database_url
         self._engine = None
         self._session_factory = None
+        self._async_engine = None
+        self._async_session_factory = None
 
     @property
     def engine(self):
@@ -53,9 +76,98 @@ class Database:
             )
         return self._session_factory
 
+    @property
+    def async_engine(self):
+        """Lazy-load the asyncio engine, sharing the sync engine's pool settings."""
+        if self._async_engine is None:
+            # Imported here: the asyncio extension is slow to import and
+            # processes without async request handlers never need it
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            url = async_url(self._url)
+            if self._url.startswith("sqlite"):
+                # SQLite has a single writer: queueing on one connection is much
+                # cheaper than several connections spinning on the file lock
+                self._async_engine = create_async_engine(
+                    url,
+                    pool_size=1,
+                    max_overflow=0,
+                    pool_pre_ping=True,
+                )
+            else:
+                self._async_engine = create_async_engine(
+                    url,
+                    pool_size=5,
+                    max_overflow=10,
+                    pool_pre_ping=True,
+                    pool_recycle=300,
+                )
+        return self._async_engine
+
+    @property
+    def async_session_factory(self):
+        """Lazy-load async session factory."""
+        if self._async_session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            self._async_session_factory = async_sessionmaker(
+                bind=self.async_engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._async_session_factory
+
+    async def dispose_async(self) -> None:
+        """Close the asyncio engine's pooled connections."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            self._async_engine = None
+            self._async_session_factory = None
+
     def create_tables(self):
-        """Create all tables."""
+        """Create all tables and add columns missing from existing ones.
+
+        This is the schema migration; run it with `python cli.py migrate`
+        before starting the app, not on boot.
+        """
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns()
+
+    def missing_schema(self) -> List[str]:
+        """Tables and table.columns of the models that the database lacks."""
+        inspector = inspect(self.engine)
+        missing = []
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                missing.append(table.name)
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            missing.extend(
+                f"{table.name}.{column.name}"
+                for column in table.columns
+                if column.name not in existing
+            )
+        return missing
+
+    def _add_missing_columns(self):
+        """Add columns introduced after a table was first created.
+
+        Columns must be nullable or have a server default to backfill rows.
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                existing = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                    if not column.nullable:
+                        if column.server_default is None:
+                            continue
+                        ddl += f" NOT NULL DEFAULT {column.server_default.arg.text}"
+                    connection.execute(text(ddl))
 
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
@@ -70,6 +182,17 @@ class Database:
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncGenerator["AsyncSession", None]:
+        """Provide a transactional scope on the asyncio engine."""
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
 
 # Global database instance
 db = Database()
\ No newline at end of file
@@ -1,5 +1,7 @@
 """ORM entities."""
 
 from .address import AddressEntity
+from .address_score import AddressScoreEntity
+from .job import JobEntity
 
-__all__ = ["AddressEntity"]
\ No newline at end of file
+__all__ = ["AddressEntity", "AddressScoreEntity", "JobEntity"]
@@ -1,8 +1,10 @@
 """Address ORM entity."""
 
-from sqlalchemy import Column, Integer, String, Float
+from typing import Optional
 
-from domain.models import Address
+from sqlalchemy import Column, DateTime, Integer, String, Float, JSON, text
+
+from domain.models import Address, MatchCandidate, Provenance, input_hash
 from infrastructure.database import Base
 
 
@@ -14,12 +16,60 @@ class AddressEntity(Base):
     address = Column(String, nullable=False)
     matched_address = Column(String, nullable=True)
     match_score = Column(Float, nullable=True)
+    # Raw geocoding candidates in provider order: [{"address": ..., "score": ...}]
+    candidates = Column(JSON, nullable=True)
+    # Bumped on every update; with id it makes the row's ETag
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+    # Provenance of match_score: similarity method and its version. Rows whose
+    # provenance differs from the configured method are rescored from candidates
+    score_method = Column(String, nullable=True)
+    score_version = Column(String, nullable=True)
+    # Provenance of candidates: last successful geocoding, the geocoder
+    # configuration used and a hash of the address it was given
+    geocoded_at = Column(DateTime, nullable=True)
+    geocoder_version = Column(String, nullable=True)
+    input_hash = Column(String, nullable=True)
 
     def to_domain(self) -> Address:
-        """Convert ORM entity to domain model."""
-        return Address(
-            id=self.id,
-            address=self.address,
-            matched_address=self.matched_address,
-            match_score=self.match_score
-        )
\ No newline at end of file
+        """Convert ORM entity to domain model.
+
+        Columns are already typed by the schema, so the model is built
+        without validation.
+        """
+        return self.row_to_domain(self)
+
+    @staticmethod
+    def row_to_domain(row) -> Address:
+        """Domain model of an entity, or of a Core row with the table's columns."""
+        return Address.model_construct(
+            id=row.id,
+            address=row.address,
+            matched_address=row.matched_address,
+            match_score=row.match_score,
+            candidates=[
+                MatchCandidate.model_construct(**candidate)
+                for candidate in row.candidates or []
+            ],
+            version=row.version,
+            score_method=row.score_method,
+            score_version=row.score_version,
+            geocoded_at=row.geocoded_at,
+        )
+
+    @staticmethod
+    def provenance_values(provenance: Optional[Provenance], address: str) -> dict:
+        """Column values recording how match data for `address` was produced."""
+        values = {
+            "score_method": provenance.score_method if provenance else None,
+            "score_version": provenance.score_version if provenance else None,
+        }
+        if provenance and provenance.geocoded_at:
+            values["geocoded_at"] = provenance.geocoded_at
+            values["geocoder_version"] = provenance.geocoder_version
+            values["input_hash"] = input_hash(address)
+        return values
+
+    def stamp(self, provenance: Optional[Provenance]) -> None:
+        """Record how the match data just written was produced."""
+        for name, value in self.provenance_values(provenance, self.address).items():
+            setattr(self, name, value)
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""Per-method address score ORM entity."""
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+
+from domain.models import MethodScore
+from infrastructure.database import Base
+
+
+class AddressScoreEntity(Base):
+    """ORM entity for the address_scores table: one row per address and method."""
+    __tablename__ = "address_scores"
+
+    address_id = Column(
+        Integer, ForeignKey("addresses.id", ondelete="CASCADE"), primary_key=True
+    )
+    method = Column(String, primary_key=True)
+    method_version = Column(String, nullable=False)
+    matched_address = Column(String, nullable=True)
+    match_score = Column(Float, nullable=False)
+    scored_at = Column(DateTime, nullable=False)
+
+    def to_domain(self) -> MethodScore:
+        """Convert ORM entity to domain model."""
+        return MethodScore.model_construct(
+            method=self.method,
+            method_version=self.method_version,
+            matched_address=self.matched_address,
+            match_score=self.match_score,
+            scored_at=self.scored_at,
+        )
@@ -0,0 +1,42 @@
+"""Job ORM entity."""
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, JSON, String
+
+from domain.models import Job, JobStatus
+from infrastructure.database import Base
+
+
+class JobEntity(Base):
+    """ORM entity for jobs table."""
+    __tablename__ = "jobs"
+
+    id = Column(String, primary_key=True)
+    kind = Column(String, nullable=False)
+    status = Column(String, nullable=False, index=True)
+    params = Column(JSON, nullable=True)
+    total = Column(Integer, nullable=True)
+    processed = Column(Integer, nullable=False, default=0)
+    checkpoint = Column(Integer, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # Last sign of life of the running worker
+
+    def to_domain(self) -> Job:
+        """Convert ORM entity to domain model."""
+        return Job(
+            id=self.id,
+            kind=self.kind,
+            status=JobStatus(self.status),
+            params=self.params or {},
+            total=self.total,
+            processed=self.processed or 0,
+            checkpoint=self.checkpoint,
+            cancel_requested=bool(self.cancel_requested),
+            error=self.error,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
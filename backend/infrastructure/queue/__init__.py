@@ -0,0 +1,5 @@
+"""Job queue infrastructure - Redis with in-process fallback."""
+
+from infrastructure.queue.client import InProcessQueue, RedisQueue, create_queue
+
+__all__ = ["InProcessQueue", "RedisQueue", "create_queue"]
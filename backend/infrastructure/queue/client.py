@@ -0,0 +1,101 @@
+"""Job queues: in-process worker pool, optionally backed by a Redis list."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from config import settings
+
+
+JobHandler = Callable[[str], None]
+
+
+class InProcessQueue:
+    """Runs jobs on a local thread pool."""
+
+    def __init__(self, workers: int):
+        self._workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._handler: Optional[JobHandler] = None
+
+    def start(self, handler: JobHandler) -> None:
+        """Start the worker pool; jobs are passed to `handler` by ID."""
+        self._handler = handler
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="job-worker"
+            )
+
+    def enqueue(self, job_id: str) -> None:
+        """Queue a job for execution."""
+        self._executor.submit(self._handler, job_id)
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and wait for running ones."""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class RedisQueue:
+    """
+    Shares jobs between processes through a Redis list.
+
+    Every process started with this backend runs `workers` consumer
+    threads, so jobs enqueued by one API worker may run in another.
+    """
+
+    QUEUE_KEY = "jobs:queue"
+    POLL_TIMEOUT = 1  # seconds; lets consumers notice shutdown
+
+    def __init__(self, redis_client, workers: int):
+        self._redis = redis_client
+        self._workers = workers
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    def start(self, handler: JobHandler) -> None:
+        """Start consumer threads."""
+        if self._threads:
+            return
+        for i in range(self._workers):
+            thread = threading.Thread(
+                target=self._consume, args=(handler,), name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _consume(self, handler: JobHandler) -> None:
+        while not self._stopping.is_set():
+            item = self._redis.brpop(self.QUEUE_KEY, timeout=self.POLL_TIMEOUT)
+            if item is None:
+                continue
+            _, job_id = item
+            try:
+                handler(job_id.decode())
+            except Exception as e:
+                print(f"Job worker error: {type(e).__name__}: {e}")
+
+    def enqueue(self, job_id: str) -> None:
+        """Queue a job for execution by any consumer."""
+        self._redis.lpush(self.QUEUE_KEY, job_id)
+
+    def shutdown(self) -> None:
+        """Stop consumers after their current job."""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+
+def create_queue() -> InProcessQueue | RedisQueue:
+    """Create the configured queue, falling back to in-process if Redis is unavailable."""
+    if settings.job_queue_backend == "redis" and settings.redis_url:
+        try:
+            import redis
+            client = redis.from_url(settings.redis_url)
+            client.ping()  # Test connection
+            return RedisQueue(client, settings.job_workers)
+        except Exception:
+            pass
+    return InProcessQueue(settings.job_workers)
@@ -1,5 +1,7 @@
 """Data repositories."""
 
 from .address_repository import AddressRepository
+from .async_address_repository import AsyncAddressRepository
+from .job_repository import JobRepository
 
-__all__ = ["AddressRepository"]
\ No newline at end of file
+__all__ = ["AddressRepository", "AsyncAddressRepository", "JobRepository"]
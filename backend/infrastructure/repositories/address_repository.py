@@ -1,41 +1,170 @@
 """Address repository - Data access layer."""
 
-from typing import List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Delete, Row, Select, String, bindparam, cast, delete, func, insert, or_, select, update,
+)
 
-from domain.models import Address
+from config import settings
+from domain.models import Address, MethodScore, Provenance, RefreshState
 from infrastructure.database import db
-from infrastructure.entities import AddressEntity
+from infrastructure.entities import AddressEntity, AddressScoreEntity
+
+
+# Columns of RefreshState
+REFRESH_COLUMNS = (
+    "id", "address", "matched_address", "match_score", "candidates",
+    "geocoded_at", "geocoder_version", "input_hash", "score_method", "score_version",
+)
+
+
+def page_query(offset: int, limit: int) -> Select:
+    """Up to `limit` addresses, newest first, skipping `offset` rows."""
+    return (
+        select(AddressEntity)
+        .order_by(AddressEntity.id.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def keyset_page_query(
+    limit: int, after_id: Optional[int] = None, before_id: Optional[int] = None
+) -> Select:
+    """
+    Up to `limit` addresses next to a keyset position.
+
+    `after_id` continues towards older rows (id below it), newest first;
+    `before_id` goes back towards newer rows (id above it), oldest first,
+    so callers reverse those. Both use the primary key index, so deep
+    pages cost the same as the first one.
+    """
+    query = select(AddressEntity).limit(limit)
+    if before_id is not None:
+        return query.where(AddressEntity.id > before_id).order_by(AddressEntity.id.asc())
+    query = query.order_by(AddressEntity.id.desc())
+    if after_id is not None:
+        query = query.where(AddressEntity.id < after_id)
+    return query
+
+
+def scores_query(address_id: int) -> Select:
+    """The per-method scores stored for an address, by method name."""
+    return (
+        select(AddressScoreEntity)
+        .where(AddressScoreEntity.address_id == address_id)
+        .order_by(AddressScoreEntity.method)
+    )
+
+
+def replace_scores(
+    scores: Dict[int, List[MethodScore]]
+) -> tuple[Delete, List[AddressScoreEntity]]:
+    """The delete and the rows that store `scores`, replacing those of the same methods."""
+    methods = {score.method for rows in scores.values() for score in rows}
+    return (
+        delete(AddressScoreEntity).where(
+            AddressScoreEntity.address_id.in_(scores),
+            AddressScoreEntity.method.in_(methods),
+        ),
+        [
+            AddressScoreEntity(address_id=address_id, **score.model_dump())
+            for address_id, rows in scores.items()
+            for score in rows
+        ],
+    )
 
 
 class AddressRepository:
     """Repository for address data access operations."""
 
-    def get_all(self) -> List[Address]:
-        """Get all addresses."""
+    def _iter_rows(
+        self,
+        query: Select,
+        batch_size: int,
+        ids: Optional[List[int]] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[Row]:
+        """
+        Stream the rows of `query` in id order, `batch_size` per query.
+
+        Each batch is read by keyset on id in a short session of its own and
+        handed out after the session closes: memory holds one batch whatever
+        the table size, and a slow consumer holds no connection or read
+        transaction. With `ids`, only those rows are read, `batch_size` ids
+        per IN list. Only rows with id above `after_id` are read.
+        """
+        if ids:
+            pending = sorted({i for i in ids if after_id is None or i > after_id})
+            for start in range(0, len(pending), batch_size):
+                with db.session() as session:
+                    rows = session.execute(
+                        query.where(AddressEntity.id.in_(pending[start:start + batch_size]))
+                        .order_by(AddressEntity.id)
+                    ).all()
+                yield from rows
+            return
+
+        while True:
+            batch = query.order_by(AddressEntity.id).limit(batch_size)
+            if after_id is not None:
+                batch = batch.where(AddressEntity.id > after_id)
+            with db.session() as session:
+                rows = session.execute(batch).all()
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1].id
+
+    def _columns(self, columns: Optional[Sequence[str]]) -> Select:
+        table = AddressEntity.__table__
+        return select(*(table.c[name] for name in columns) if columns else table.c)
+
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        columns: Optional[Sequence[str]] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[Row]:
+        """
+        Stream every address as a row tuple of `columns` (all by default), in id order.
+
+        Rows are read `batch_size` at a time, without building ORM objects
+        or models, so memory stays flat regardless of table size.
+        """
+        return self._iter_rows(self._columns(columns), batch_size, after_id=after_id)
+
+    def iter_by_ids(
+        self,
+        ids: List[int],
+        batch_size: int = 1000,
+        columns: Optional[Sequence[str]] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[Row]:
+        """Stream the addresses among `ids` like `iter_all`; unknown ids are skipped."""
+        return self._iter_rows(self._columns(columns), batch_size, ids or [], after_id)
+
+    def get_page(self, offset: int = 0, limit: int = 20) -> List[Address]:
+        """Get up to `limit` addresses, newest first, skipping `offset` rows."""
         with db.session() as session:
-            entities: Sequence[AddressEntity] = session.scalars(
-                select(AddressEntity)
-            ).all()
+            entities: Sequence[AddressEntity] = session.scalars(page_query(offset, limit)).all()
             return [entity.to_domain() for entity in entities]
 
-    def get_paginated(self, page: int = 1, per_page: int = 20) -> tuple[List[Address], int]:
-        """Get paginated addresses with total count."""
+    def get_page_by_keyset(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Address]:
+        """Get up to `limit` addresses, newest first, next to a keyset position."""
         with db.session() as session:
-            # Get total count
-            total = session.scalar(select(func.count(AddressEntity.id)))
-
-            # Get paginated results
-            offset = (page - 1) * per_page
             entities: Sequence[AddressEntity] = session.scalars(
-                select(AddressEntity)
-                .order_by(AddressEntity.id.desc())
-                .offset(offset)
-                .limit(per_page)
+                keyset_page_query(limit, after_id, before_id)
             ).all()
-
-            return [entity.to_domain() for entity in entities], total
+            if before_id is not None:
+                entities = list(reversed(entities))
+            return [entity.to_domain() for entity in entities]
 
     def get_by_id(self, address_id: int) -> Optional[Address]:
         """Get address by ID."""
@@ -53,64 +182,164 @@ class AddressRepository:
             ).all()
             return [entity.to_domain() for entity in entities]
 
-    def create(self, address: str, matched_address: str, match_score: float) -> Address:
-        """Create a new address."""
+    def count(self, ids: Optional[List[int]] = None) -> int:
+        """Count all addresses, or those among `ids`."""
         with db.session() as session:
-            entity = AddressEntity(
-                address=address,
-                matched_address=matched_address,
-                match_score=match_score
+            query = select(func.count(AddressEntity.id))
+            if ids:
+                query = query.where(AddressEntity.id.in_(ids))
+            return session.scalar(query)
+
+    def _rescore_filter(self, query, provenance: Provenance, ids: Optional[List[int]]):
+        """Rows with stored candidates whose score came from another method or version."""
+        query = query.where(
+            # JSON columns store None as a JSON null rather than SQL NULL; a
+            # lookup that found nothing stores an empty list, with nothing to score
+            AddressEntity.candidates.is_not(None),
+            cast(AddressEntity.candidates, String).not_in(["null", "[]"]),
+            or_(
+                AddressEntity.score_method.is_(None),
+                AddressEntity.score_version.is_(None),
+                AddressEntity.score_method != provenance.score_method,
+                AddressEntity.score_version != provenance.score_version,
+            ),
+        )
+        if ids:
+            query = query.where(AddressEntity.id.in_(ids))
+        return query
+
+    def count_to_rescore(
+        self, provenance: Provenance, ids: Optional[List[int]] = None
+    ) -> int:
+        """Count addresses a rescore to `provenance` would touch."""
+        with db.session() as session:
+            return session.scalar(
+                self._rescore_filter(select(func.count(AddressEntity.id)), provenance, ids)
             )
-            session.add(entity)
-            session.flush()
-            return entity.to_domain()
 
-    def update(
+    def iter_to_rescore(
         self,
-        address_id: int,
-        address: str,
-        matched_address: str,
-        match_score: float
-    ) -> Optional[Address]:
-        """Update an existing address."""
-        with db.session() as session:
-            entity = session.scalars(
-                select(AddressEntity).where(AddressEntity.id == address_id)
-            ).one_or_none()
+        provenance: Provenance,
+        ids: Optional[List[int]] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[tuple[int, str, List[str]]]:
+        """
+        Stream (id, address, candidate addresses) rows to rescore, in id order.
+
+        Only the columns scoring needs are read; candidates come back in
+        provider order, without their stored scores.
+        """
+        query = self._rescore_filter(
+            select(AddressEntity.id, AddressEntity.address, AddressEntity.candidates),
+            provenance,
+            None,
+        )
+        for address_id, address, candidates in self._iter_rows(query, batch_size, ids, after_id):
+            yield address_id, address, [candidate["address"] for candidate in candidates]
+
+    def iter_refresh_states(
+        self,
+        ids: Optional[List[int]] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RefreshState]:
+        """Stream the refresh state of all addresses, or those among `ids`, in id order."""
+        for row in self._iter_rows(self._columns(REFRESH_COLUMNS), batch_size, ids, after_id):
+            state = row._asdict()
+            if state["candidates"] is not None:
+                state["candidates"] = [c["address"] for c in state["candidates"]]
+            yield RefreshState.model_construct(**state)
 
-            if not entity:
-                return None
+    def create_many(
+        self,
+        rows: List[tuple[str, str, float, Optional[List[dict]]]],
+        provenance: Optional[Provenance] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[Address]:
+        """
+        Insert (address, matched_address, match_score, candidates) rows.
 
-            entity.address = address
-            entity.matched_address = matched_address
-            entity.match_score = match_score
-            session.flush()
-            return entity.to_domain()
+        Each chunk of `chunk_size` rows (`bulk_write_chunk_size` by default)
+        is one Core executemany INSERT ... RETURNING and its own commit; no
+        ORM objects are built or flushed. Returns the created addresses in
+        input order.
+        """
+        size = chunk_size or settings.bulk_write_chunk_size
+        table = AddressEntity.__table__
+        statement = insert(table).returning(*table.c, sort_by_parameter_order=True)
+        created = []
+        for start in range(0, len(rows), size):
+            params = [
+                {
+                    "address": address,
+                    "matched_address": matched_address,
+                    "match_score": match_score,
+                    "candidates": candidates,
+                    **AddressEntity.provenance_values(provenance, address),
+                }
+                for address, matched_address, match_score, candidates in rows[start:start + size]
+            ]
+            with db.session() as session:
+                created.extend(
+                    AddressEntity.row_to_domain(row) for row in session.execute(statement, params)
+                )
+        return created
 
-    def update_match(
+    def refresh_all(
         self,
-        address_id: int,
-        matched_address: str,
-        match_score: float
+        updates: List[tuple[int, str, str, float, Optional[List[dict]]]],
+        provenance: Optional[Provenance] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
-        """Update only the match data for an address."""
-        with db.session() as session:
-            entity = session.scalars(
-                select(AddressEntity).where(AddressEntity.id == address_id)
-            ).one_or_none()
+        """
+        Write new match data to many addresses and bump their versions.
 
-            if entity:
-                entity.matched_address = matched_address
-                entity.match_score = match_score
+        `updates` are (id, address, matched_address, match_score, candidates)
+        tuples; `address` is the text that was matched, used for the input
+        hash only. Each chunk of `chunk_size` rows (`bulk_write_chunk_size`
+        by default) is one executemany UPDATE by primary key, without
+        reading the rows first, and its own commit, so the write lock is
+        held per chunk. Ids that do not exist are skipped.
+        """
+        size = chunk_size or settings.bulk_write_chunk_size
+        table = AddressEntity.__table__
+        columns = [
+            "matched_address", "match_score", "candidates",
+            *AddressEntity.provenance_values(provenance, ""),
+        ]
+        # Bound names must differ from the names of the columns they set
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values({
+                **{name: bindparam(f"new_{name}", type_=table.c[name].type) for name in columns},
+                "version": table.c.version + 1,
+            })
+        )
+        for start in range(0, len(updates), size):
+            params = []
+            for address_id, address, matched_address, match_score, candidates in (
+                updates[start:start + size]
+            ):
+                values = {
+                    "matched_address": matched_address,
+                    "match_score": match_score,
+                    "candidates": candidates,
+                    **AddressEntity.provenance_values(provenance, address),
+                }
+                params.append({
+                    "row_id": address_id,
+                    **{f"new_{name}": value for name, value in values.items()},
+                })
+            with db.session() as session:
+                session.execute(statement, params)
 
-    def refresh_all(self, updates: List[tuple[int, str, float]]) -> None:
-        """Batch update match data for multiple addresses."""
+    def save_scores(self, scores: Dict[int, List[MethodScore]]) -> None:
+        """Store per-method scores by address id, replacing those of the same methods."""
+        if not scores:
+            return
+        statement, rows = replace_scores(scores)
         with db.session() as session:
-            for address_id, matched_address, match_score in updates:
-                entity = session.scalars(
-                    select(AddressEntity).where(AddressEntity.id == address_id)
-                ).one_or_none()
-
-                if entity:
-                    entity.matched_address = matched_address
-                    entity.match_score = match_score
\ No newline at end of file
+            session.execute(statement)
+            session.add_all(rows)
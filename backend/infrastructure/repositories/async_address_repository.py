@@ -0,0 +1,171 @@
+"""Async address repository - Data access for the asyncio request path."""
+
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import select, func
+
+from domain.models import Address, MethodScore, Provenance
+from infrastructure.database import db
+from infrastructure.entities import AddressEntity, AddressScoreEntity
+from .address_repository import keyset_page_query, page_query, replace_scores, scores_query
+
+
+class AsyncAddressRepository:
+    """
+    Data access for request handlers, on the asyncio engine.
+
+    Single-row writes only happen here. Bulk paths (jobs, import, export,
+    cache warm-up) use `AddressRepository` from worker threads; statements
+    both need are built by the functions of that module.
+    """
+
+    async def get_page(self, offset: int = 0, limit: int = 20) -> List[Address]:
+        """Get up to `limit` addresses, newest first, skipping `offset` rows."""
+        async with db.async_session() as session:
+            entities: Sequence[AddressEntity] = (
+                await session.scalars(page_query(offset, limit))
+            ).all()
+            return [entity.to_domain() for entity in entities]
+
+    async def get_page_by_keyset(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Address]:
+        """Get up to `limit` addresses, newest first, next to a keyset position."""
+        async with db.async_session() as session:
+            entities: Sequence[AddressEntity] = (
+                await session.scalars(keyset_page_query(limit, after_id, before_id))
+            ).all()
+            if before_id is not None:
+                entities = list(reversed(entities))
+            return [entity.to_domain() for entity in entities]
+
+    async def get_by_id(self, address_id: int) -> Optional[Address]:
+        """Get address by ID."""
+        async with db.async_session() as session:
+            entity = await session.get(AddressEntity, address_id)
+            return entity.to_domain() if entity else None
+
+    async def get_by_ids(self, ids: List[int]) -> List[Address]:
+        """Get the addresses among `ids` with one query, in no particular order."""
+        async with db.async_session() as session:
+            entities: Sequence[AddressEntity] = (await session.scalars(
+                select(AddressEntity).where(AddressEntity.id.in_(ids))
+            )).all()
+            return [entity.to_domain() for entity in entities]
+
+    async def count(self) -> int:
+        """Count all addresses."""
+        async with db.async_session() as session:
+            return await session.scalar(select(func.count(AddressEntity.id)))
+
+    async def create(
+        self,
+        address: str,
+        matched_address: str,
+        match_score: float,
+        candidates: Optional[List[dict]] = None,
+        provenance: Optional[Provenance] = None,
+    ) -> Address:
+        """Create a new address; `provenance` says how it was matched."""
+        async with db.async_session() as session:
+            entity = AddressEntity(
+                address=address,
+                matched_address=matched_address,
+                match_score=match_score,
+                candidates=candidates,
+            )
+            entity.stamp(provenance)
+            session.add(entity)
+            await session.flush()
+            return entity.to_domain()
+
+    async def update(
+        self,
+        address_id: int,
+        address: str,
+        matched_address: str,
+        match_score: float,
+        candidates: Optional[List[dict]] = None,
+        provenance: Optional[Provenance] = None,
+    ) -> Optional[Address]:
+        """Update an existing address; `provenance` says how it was matched."""
+        async with db.async_session() as session:
+            entity = await session.get(AddressEntity, address_id)
+            if not entity:
+                return None
+
+            entity.address = address
+            entity.matched_address = matched_address
+            entity.match_score = match_score
+            entity.candidates = candidates
+            entity.stamp(provenance)
+            entity.version += 1
+            await session.flush()
+            return entity.to_domain()
+
+    async def write_batch(
+        self,
+        creates: List[tuple[str, str, float, Optional[List[dict]]]],
+        updates: Dict[int, tuple[str, str, float, Optional[List[dict]]]],
+        provenance: Optional[Provenance] = None,
+    ) -> tuple[List[Address], Dict[int, Address]]:
+        """
+        Insert and update addresses in one transaction.
+
+        `creates` are (address, matched_address, match_score, candidates)
+        rows; `updates` maps ids to the same tuples. Rows to update are
+        loaded with a single IN query. `provenance` says how all rows
+        were matched. Returns the created addresses in order and the
+        updated ones by id; ids that do not exist are absent.
+        """
+        async with db.async_session() as session:
+            created = [
+                AddressEntity(
+                    address=address,
+                    matched_address=matched_address,
+                    match_score=match_score,
+                    candidates=candidates,
+                )
+                for address, matched_address, match_score, candidates in creates
+            ]
+            for entity in created:
+                entity.stamp(provenance)
+            session.add_all(created)
+
+            existing: Sequence[AddressEntity] = (await session.scalars(
+                select(AddressEntity).where(AddressEntity.id.in_(updates))
+            )).all() if updates else []
+            for entity in existing:
+                entity.address, entity.matched_address, entity.match_score, entity.candidates = (
+                    updates[entity.id]
+                )
+                entity.stamp(provenance)
+                entity.version += 1
+
+            await session.flush()
+            return (
+                [entity.to_domain() for entity in created],
+                {entity.id: entity.to_domain() for entity in existing},
+            )
+
+    async def get_scores(self, address_id: int) -> Optional[List[MethodScore]]:
+        """Get the per-method scores stored for an address, by method name, or None if missing."""
+        async with db.async_session() as session:
+            entities: Sequence[AddressScoreEntity] = (
+                await session.scalars(scores_query(address_id))
+            ).all()
+            if not entities and await session.get(AddressEntity, address_id) is None:
+                return None
+            return [entity.to_domain() for entity in entities]
+
+    async def save_scores(self, scores: Dict[int, List[MethodScore]]) -> None:
+        """Store per-method scores by address id, replacing those of the same methods."""
+        if not scores:
+            return
+        statement, rows = replace_scores(scores)
+        async with db.async_session() as session:
+            await session.execute(statement)
+            session.add_all(rows)
@@ -0,0 +1,180 @@
+"""Job repository - Data access layer for background jobs."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+
+from domain.models import Job, JobStatus
+from infrastructure.database import db
+from infrastructure.entities import JobEntity
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class JobRepository:
+    """Repository for job state, progress and checkpoints."""
+
+    def _get_entity(self, session, job_id: str) -> Optional[JobEntity]:
+        return session.scalars(
+            select(JobEntity).where(JobEntity.id == job_id)
+        ).one_or_none()
+
+    def create(self, kind: str, params: dict, total: Optional[int] = None) -> Job:
+        """Create a queued job."""
+        with db.session() as session:
+            entity = JobEntity(
+                id=uuid.uuid4().hex,
+                kind=kind,
+                status=JobStatus.QUEUED.value,
+                params=params,
+                total=total,
+                processed=0,
+                cancel_requested=False,
+                created_at=_now(),
+            )
+            session.add(entity)
+            session.flush()
+            return entity.to_domain()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get job by ID."""
+        with db.session() as session:
+            entity = self._get_entity(session, job_id)
+            return entity.to_domain() if entity else None
+
+    def count_active(self, kind: str) -> int:
+        """Count jobs of `kind` that are queued or running."""
+        with db.session() as session:
+            return session.scalar(
+                select(func.count(JobEntity.id)).where(
+                    JobEntity.kind == kind,
+                    JobEntity.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value]),
+                )
+            )
+
+    def claim(self, job_id: str) -> Optional[Job]:
+        """
+        Mark a queued job running, unless another worker claimed it first.
+
+        One conditional UPDATE, so of workers handed the same job id only
+        one gets it back; the others get None.
+        """
+        now = _now()
+        with db.session() as session:
+            claimed = session.execute(
+                update(JobEntity)
+                .where(JobEntity.id == job_id, JobEntity.status == JobStatus.QUEUED.value)
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    started_at=func.coalesce(JobEntity.started_at, now),
+                    heartbeat_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not claimed:
+                return None
+            return self._get_entity(session, job_id).to_domain()
+
+    def heartbeat(self, job_ids: Iterable[str]) -> None:
+        """Record that the workers of these running jobs are alive."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with db.session() as session:
+            session.execute(
+                update(JobEntity)
+                .where(JobEntity.id.in_(job_ids), JobEntity.status == JobStatus.RUNNING.value)
+                .values(heartbeat_at=_now())
+                .execution_options(synchronize_session=False)
+            )
+
+    def mark_queued(self, job_id: str, stale_after: float) -> Optional[Job]:
+        """
+        Put a stopped job back in the queue, keeping its checkpoint.
+
+        Only failed and cancelled jobs, and running jobs whose worker has
+        not sent a heartbeat for `stale_after` seconds, are queued again;
+        for any other job, returns None and changes nothing.
+        """
+        stale_before = _now() - timedelta(seconds=stale_after)
+        with db.session() as session:
+            queued = session.execute(
+                update(JobEntity)
+                .where(
+                    JobEntity.id == job_id,
+                    or_(
+                        JobEntity.status.in_(
+                            [JobStatus.FAILED.value, JobStatus.CANCELLED.value]
+                        ),
+                        and_(
+                            JobEntity.status == JobStatus.RUNNING.value,
+                            or_(
+                                JobEntity.heartbeat_at.is_(None),
+                                JobEntity.heartbeat_at < stale_before,
+                            ),
+                        ),
+                    ),
+                )
+                .values(
+                    status=JobStatus.QUEUED.value,
+                    cancel_requested=False,
+                    error=None,
+                    finished_at=None,
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not queued:
+                return None
+            return self._get_entity(session, job_id).to_domain()
+
+    def mark_running(self, job_id: str, total: Optional[int]) -> None:
+        """Mark a job as started."""
+        with db.session() as session:
+            entity = self._get_entity(session, job_id)
+            if entity:
+                entity.status = JobStatus.RUNNING.value
+                entity.total = total
+                entity.started_at = entity.started_at or _now()
+
+    def advance(self, job_id: str, processed: int, checkpoint: int) -> None:
+        """Record progress after a chunk has been committed."""
+        with db.session() as session:
+            entity = self._get_entity(session, job_id)
+            if entity:
+                entity.processed = (entity.processed or 0) + processed
+                entity.checkpoint = checkpoint
+                entity.heartbeat_at = _now()
+
+    def finish(self, job_id: str, status: JobStatus, error: Optional[str] = None) -> None:
+        """Mark a job as stopped with a terminal status."""
+        with db.session() as session:
+            entity = self._get_entity(session, job_id)
+            if entity:
+                entity.status = status.value
+                entity.error = error
+                entity.finished_at = _now()
+
+    def request_cancel(self, job_id: str) -> Optional[Job]:
+        """Flag a job for cancellation; queued jobs are cancelled immediately."""
+        with db.session() as session:
+            entity = self._get_entity(session, job_id)
+            if not entity:
+                return None
+            if not JobStatus(entity.status).is_terminal:
+                entity.cancel_requested = True
+                if entity.status == JobStatus.QUEUED.value:
+                    entity.status = JobStatus.CANCELLED.value
+                    entity.finished_at = _now()
+            session.flush()
+            return entity.to_domain()
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """Check whether cancellation was requested, possibly by another process."""
+        with db.session() as session:
+            return bool(session.scalar(
+                select(JobEntity.cancel_requested).where(JobEntity.id == job_id)
+            ))
@@ -1,20 +1,40 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from infrastructure.database import db
-from api.routes import addresses_router
+from application.services import cache_warmer, readiness
+from api.routes import addresses_router, jobs_router, metrics_router, health_router
+from api.routes.addresses import async_address_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm up dependencies and the cache in the background; save the hot
+    keys and release async connection pools on shutdown.
 
+    Nothing is awaited before serving: GET /ready reports warm-up progress.
+    The schema is created by `python cli.py migrate`, not on boot.
+    """
+    readiness.start()
+    cache_warmer.start()
+    yield
+    await cache_warmer.stop()
+    await readiness.stop()
+    await async_address_service.aclose()
+    await db.dispose_async()
 
-# Create database tables
-db.create_tables()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Address Assessment Backend",
     description="Backend for the Root Sustainability AI/ML Engineer assessment.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -24,7 +44,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After"],
 )
 
 # Register routes
-app.include_router(addresses_router)
\ No newline at end of file
+app.include_router(addresses_router)
+app.include_router(jobs_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
\ No newline at end of file
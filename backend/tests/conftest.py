@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -10,6 +11,98 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 
+@pytest.fixture
+def temp_database(tmp_path):
+    """Point the global database at a fresh SQLite file for one test."""
+    from infrastructure.database import db
+
+    original = db._url, db._engine, db._session_factory, db._async_engine, db._async_session_factory
+    db._url = f"sqlite:///{tmp_path / 'test.db'}"
+    db._engine = None
+    db._session_factory = None
+    db._async_engine = None
+    db._async_session_factory = None
+    db.create_tables()
+    yield db
+    db.engine.dispose()
+    asyncio.run(db.dispose_async())
+    (
+        db._url, db._engine, db._session_factory, db._async_engine, db._async_session_factory
+    ) = original
+
+
+@pytest.fixture
+def refresh_job(temp_database):
+    """Run a refresh job to completion with these params, as POST /addresses/refresh queues it."""
+    from application.jobs import JobEngine, REFRESH_JOB
+    from application.jobs.handlers import refresh_handler
+    from infrastructure.queue import InProcessQueue
+
+    engine = JobEngine(queue=InProcessQueue(workers=1))
+    engine.register(REFRESH_JOB, refresh_handler)
+
+    def run(**params):
+        job = engine.submit(REFRESH_JOB, {"ids": None, **params})
+        return engine.wait(job.id, timeout=30)
+
+    yield run
+    engine.shutdown()
+
+
+@pytest.fixture
+def api_client(temp_database, memory_cache, monkeypatch):
+    """A client of the app whose request handlers use a fresh async service."""
+    import api.routes.addresses as addresses_routes
+    from application.services import AsyncAddressService
+    from fastapi.testclient import TestClient
+    from main import app
+
+    monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """A fresh in-memory cache behind the global cache client."""
+    from infrastructure.cache import cache_client
+    from infrastructure.cache.client import InMemoryCache
+
+    monkeypatch.setattr(cache_client, "_redis", None)
+    monkeypatch.setattr(cache_client, "_memory_cache", InMemoryCache())
+    monkeypatch.setattr(cache_client, "_leases", {})
+    return cache_client
+
+
+@pytest.fixture(autouse=True)
+def hot_keys(tmp_path, monkeypatch):
+    """No reads recorded yet, and hot keys saved to a file of this test's own."""
+    from application.services import hot_keys
+    from config import settings
+
+    monkeypatch.setattr(settings, "warmup_keys_path", str(tmp_path / "hot_keys.json"))
+    hot_keys.clear()
+    return hot_keys
+
+
+@pytest.fixture
+def stubbed_mapbox(mapbox_stub, monkeypatch):
+    """Route MapboxClient instances created with default settings to the stub."""
+    from config import settings
+
+    monkeypatch.setattr(settings, "mapbox_base_url", mapbox_stub.forward_url)
+    return mapbox_stub
+
+
+@pytest.fixture(scope="session")
+def mapbox_stub():
+    """Run the record/replay Mapbox stub seeded from data/addresses.csv."""
+    from tests.fakes import MapboxStubServer
+
+    with MapboxStubServer() as server:
+        yield server
+
+
 @pytest.fixture
 def mapbox_client():
     """Create a MapboxClient instance for testing."""
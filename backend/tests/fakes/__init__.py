@@ -0,0 +1,5 @@
+"""Local stand-ins for external services used in tests and load tests."""
+
+from .mapbox_server import FaultConfig, MapboxCorpus, MapboxStubServer, create_app
+
+__all__ = ["FaultConfig", "MapboxCorpus", "MapboxStubServer", "create_app"]
@@ -0,0 +1,375 @@
+"""
+Record/replay stand-in for the Mapbox Geocoding v6 API.
+
+Serves forward (`GET .../forward`) and batch (`POST .../batch`) geocoding
+from a recorded corpus, with configurable latency, error rate and 429
+injection. Point `MapboxClient(base_url=server.forward_url)` at it to run
+the real service path offline.
+
+Run standalone for load tests:
+
+    cd backend
+    python -m tests.fakes.mapbox_server --port 8081 --latency-ms 80 --rate-limit-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import requests
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+FORWARD_PATH = "/search/geocode/v6/forward"
+BATCH_PATH = "/search/geocode/v6/batch"
+DEFAULT_CSV_PATH = Path(__file__).parent.parent.parent.parent / "data" / "addresses.csv"
+ATTRIBUTION = "NOTICE: © 2025 Mapbox and its suppliers. All rights reserved."
+
+
+def _normalize_query(query: str) -> str:
+    """Corpus lookup key: case and whitespace insensitive."""
+    return " ".join(query.strip().lower().split())
+
+
+def make_feature(full_address: str) -> dict:
+    """Build a v6 feature with the full schema Mapbox returns for an address."""
+    name, _, place_formatted = full_address.partition(", ")
+    digest = hashlib.sha1(full_address.encode("utf-8")).hexdigest()
+    # Deterministic fake coordinates derived from the address
+    longitude = int(digest[:8], 16) / 0xFFFFFFFF * 360 - 180
+    latitude = int(digest[8:16], 16) / 0xFFFFFFFF * 180 - 90
+    return {
+        "type": "Feature",
+        "id": f"dXJuOm1ieGFkcjo{digest[:24]}",
+        "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+        "properties": {
+            "mapbox_id": f"dXJuOm1ieGFkcjo{digest[:24]}",
+            "feature_type": "address",
+            "full_address": full_address,
+            "name": name,
+            "name_preferred": name,
+            "place_formatted": place_formatted or None,
+            "coordinates": {
+                "longitude": longitude,
+                "latitude": latitude,
+                "accuracy": "rooftop",
+            },
+            "context": {
+                "address": {"name": name},
+                "place": {"name": place_formatted.split(", ")[0] if place_formatted else name},
+            },
+            "match_code": {"confidence": "high"},
+        },
+    }
+
+
+class MapboxCorpus:
+    """Recorded query -> features mapping served by the stub."""
+
+    def __init__(self, entries: Optional[dict[str, List[dict]]] = None):
+        self._entries: dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+        for query, features in (entries or {}).items():
+            self.add(query, features)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> List[tuple[str, List[dict]]]:
+        """Snapshot of recorded (query, features) pairs."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def get(self, query: str) -> Optional[List[dict]]:
+        """Return recorded features for a query, or None if never recorded."""
+        return self._entries.get(_normalize_query(query))
+
+    def add(self, query: str, features: List[dict]) -> None:
+        """Record the features returned for a query."""
+        with self._lock:
+            self._entries[_normalize_query(query)] = features
+
+    @classmethod
+    def from_addresses_csv(cls, path: Path = DEFAULT_CSV_PATH) -> "MapboxCorpus":
+        """Seed a corpus from the `address` -> `matched_address` pairs in a CSV."""
+        corpus = cls()
+        with open(path, "r", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                if not row["address"]:
+                    continue
+                matched = row["matched_address"]
+                corpus.add(row["address"], [make_feature(matched)] if matched else [])
+        return corpus
+
+    @classmethod
+    def load(cls, path: Path) -> "MapboxCorpus":
+        """Load a corpus saved with `save`."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def save(self, path: Path) -> None:
+        """Persist the corpus as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.items()), f, ensure_ascii=False, indent=1)
+
+
+@dataclass
+class FaultConfig:
+    """Latency and failure injection for the stub server."""
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_distribution: str = "fixed"  # fixed | uniform | normal | lognormal
+    error_rate: float = 0.0  # Fraction of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # Fraction of requests answered with HTTP 429
+    retry_after_seconds: int = 1
+    seed: Optional[int] = 0
+
+    def __post_init__(self):
+        self._random = random.Random(self.seed)
+
+    def sample_latency(self) -> float:
+        """Draw a latency in seconds from the configured distribution."""
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+        if self.latency_distribution == "uniform":
+            value = self._random.uniform(mean - jitter, mean + jitter)
+        elif self.latency_distribution == "normal":
+            value = self._random.gauss(mean, jitter)
+        elif self.latency_distribution == "lognormal":
+            # Long-tailed like real upstream latency; spread grows with jitter / mean
+            sigma = jitter / mean if mean else 0.0
+            value = mean * self._random.lognormvariate(0.0, sigma)
+        else:
+            value = mean
+        return max(0.0, value) / 1000.0
+
+    def sample_fault(self) -> Optional[int]:
+        """Return an injected HTTP status code, or None to serve normally."""
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+
+@dataclass
+class StubStats:
+    """Request counters exposed on `/__stats`."""
+    forward_requests: int = 0
+    batch_requests: int = 0
+    hits: int = 0
+    misses: int = 0
+    recorded: int = 0
+    injected: dict[int, int] = field(default_factory=dict)
+
+
+def create_app(
+    corpus: Optional[MapboxCorpus] = None,
+    faults: Optional[FaultConfig] = None,
+    record_url: Optional[str] = None,
+    record_token: Optional[str] = None,
+) -> FastAPI:
+    """
+    Build the stub application.
+
+    Args:
+        corpus: Recorded responses to serve. Defaults to the seeded CSV corpus.
+        faults: Latency and failure injection. Defaults to none.
+        record_url: Upstream forward URL. When set, corpus misses are fetched
+            from it and recorded.
+        record_token: Access token for the upstream when recording.
+    """
+    corpus = corpus if corpus is not None else MapboxCorpus.from_addresses_csv()
+    faults = faults or FaultConfig()
+    stats = StubStats()
+
+    app = FastAPI(title="Mapbox Geocoding stub")
+    app.state.corpus = corpus
+    app.state.faults = faults
+    app.state.stats = stats
+
+    def lookup(query: str, limit: int) -> List[dict]:
+        features = corpus.get(query)
+        if features is None and record_url:
+            response = requests.get(
+                record_url,
+                params={"q": query, "limit": 10, "access_token": record_token},
+                timeout=10,
+            )
+            response.raise_for_status()
+            features = response.json().get("features", [])
+            corpus.add(query, features)
+            stats.recorded += 1
+        if features is None:
+            stats.misses += 1
+            return []
+        stats.hits += 1
+        return features[:limit]
+
+    def feature_collection(features: List[dict]) -> dict:
+        return {"type": "FeatureCollection", "features": features, "attribution": ATTRIBUTION}
+
+    async def inject() -> Optional[JSONResponse]:
+        await asyncio.sleep(faults.sample_latency())
+        status = faults.sample_fault()
+        if status is None:
+            return None
+        stats.injected[status] = stats.injected.get(status, 0) + 1
+        if status == 429:
+            return JSONResponse(
+                {"message": "Too Many Requests"},
+                status_code=429,
+                headers={"Retry-After": str(faults.retry_after_seconds)},
+            )
+        return JSONResponse({"message": "Internal Server Error"}, status_code=status)
+
+    @app.get(FORWARD_PATH)
+    async def forward(q: str, limit: int = 1, access_token: str = ""):
+        stats.forward_requests += 1
+        fault = await inject()
+        if fault:
+            return fault
+        return feature_collection(lookup(q, limit))
+
+    @app.post(BATCH_PATH)
+    async def batch(request: Request, access_token: str = ""):
+        stats.batch_requests += 1
+        fault = await inject()
+        if fault:
+            return fault
+        queries = await request.json()
+        return {
+            "batch": [
+                feature_collection(lookup(item.get("q", ""), item.get("limit", 1)))
+                for item in queries
+            ]
+        }
+
+    @app.get("/__stats")
+    def get_stats():
+        return {
+            "forward_requests": stats.forward_requests,
+            "batch_requests": stats.batch_requests,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "recorded": stats.recorded,
+            "injected": stats.injected,
+            "corpus_size": len(corpus),
+        }
+
+    return app
+
+
+class MapboxStubServer:
+    """Runs the stub app with uvicorn on a background thread."""
+
+    def __init__(self, app: Optional[FastAPI] = None, host: str = "127.0.0.1", port: int = 0):
+        self.app = app or create_app()
+        self.host = host
+        self.port = port or self._free_port(host)
+        self._server = uvicorn.Server(
+            uvicorn.Config(self.app, host=self.host, port=self.port, log_level="warning")
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _free_port(host: str) -> int:
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            return sock.getsockname()[1]
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def forward_url(self) -> str:
+        """URL to pass as `MapboxClient(base_url=...)`."""
+        return f"{self.base_url}{FORWARD_PATH}"
+
+    @property
+    def batch_url(self) -> str:
+        return f"{self.base_url}{BATCH_PATH}"
+
+    def start(self) -> "MapboxStubServer":
+        """Start serving and block until the server accepts connections."""
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("Mapbox stub server did not start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and wait for the thread to exit."""
+        self._server.should_exit = True
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def __enter__(self) -> "MapboxStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mapbox Geocoding v6 stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--corpus", type=Path, help="Corpus JSON (default: seed from data/addresses.csv)")
+    parser.add_argument("--record-url", help="Upstream forward URL to record corpus misses from")
+    parser.add_argument("--record-token", help="Upstream access token when recording")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "normal", "lognormal"],
+        default="fixed",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus and args.corpus.exists():
+        corpus = MapboxCorpus.load(args.corpus)
+    else:
+        corpus = MapboxCorpus.from_addresses_csv()
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_distribution=args.latency_distribution,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    app = create_app(corpus, faults, record_url=args.record_url, record_token=args.record_token)
+
+    print(f"Serving {len(corpus)} recorded queries on http://{args.host}:{args.port}{FORWARD_PATH}")
+    try:
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    finally:
+        if args.corpus and args.record_url:
+            corpus.save(args.corpus)
+            print(f"Corpus saved to: {args.corpus}")
+
+
+if __name__ == "__main__":
+    main()
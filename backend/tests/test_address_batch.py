@@ -0,0 +1,116 @@
+"""Tests for POST /addresses/batch."""
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+
+KNOWN = "Germany,Schirgiswalde,2681"
+KNOWN_MATCH = "Untenende 2, 26817 Rhauderfehn, Germany"
+
+
+def make_client(monkeypatch):
+    import api.routes.addresses as addresses_routes
+    from application.services import AsyncAddressService
+    from main import app
+
+    monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(temp_database, stubbed_mapbox, monkeypatch):
+    with make_client(monkeypatch) as client:
+        yield client
+
+
+def stub_stats(stub) -> dict:
+    return requests.get(f"{stub.base_url}/__stats", timeout=10).json()
+
+
+class TestAddressBatch:
+    """Test suite for batch create and update."""
+
+    def test_creates_and_updates_in_one_pass(self, client, stubbed_mapbox, mocker):
+        """Test mixed items use one batch geocode and one write."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        existing = client.post("/addresses", json={"address": "Nowhere 123"}).json()
+        write_batch = mocker.spy(AsyncAddressRepository, "write_batch")
+        before = stub_stats(stubbed_mapbox)
+
+        response = client.post("/addresses/batch", json={"items": [
+            {"address": KNOWN},
+            {"id": existing["id"], "address": KNOWN},
+            {"address": "Nowhere 456"},
+        ]})
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["created"], body["updated"], body["errors"]) == (2, 1, 0)
+        assert [r["status"] for r in body["results"]] == ["created", "updated", "created"]
+        assert [r["index"] for r in body["results"]] == [0, 1, 2]
+        assert body["results"][0]["address"]["matched_address"] == KNOWN_MATCH
+        assert body["results"][1]["address"]["id"] == existing["id"]
+
+        after = stub_stats(stubbed_mapbox)
+        assert after["batch_requests"] - before["batch_requests"] == 1
+        assert after["forward_requests"] == before["forward_requests"]
+        assert write_batch.call_count == 1
+        assert client.get(f"/addresses/{existing['id']}").json()["matched_address"] == KNOWN_MATCH
+
+    def test_per_item_errors(self, client):
+        """Test invalid items fail alone while the rest are written."""
+        existing = client.post("/addresses", json={"address": KNOWN}).json()
+
+        body = client.post("/addresses/batch", json={"items": [
+            {"address": "   "},
+            {"id": 9999, "address": KNOWN},
+            {"id": existing["id"], "address": "Nowhere 1"},
+            {"id": existing["id"], "address": "Nowhere 2"},
+            {"address": KNOWN},
+        ]}).json()
+
+        assert [r["status"] for r in body["results"]] == [
+            "error", "error", "updated", "error", "created",
+        ]
+        assert body["results"][0]["error"] == "Missing address"
+        assert body["results"][1]["error"] == "Address not found"
+        assert "Duplicate id" in body["results"][3]["error"]
+        assert (body["created"], body["updated"], body["errors"]) == (1, 1, 3)
+
+    def test_forward_geocoding_mode(self, client, stubbed_mapbox, monkeypatch):
+        """Test batch geocoding can be swapped for concurrent forward calls."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "mapbox_batch_geocoding", False)
+        before = stub_stats(stubbed_mapbox)
+
+        body = client.post("/addresses/batch", json={"items": [
+            {"address": KNOWN}, {"address": "Nowhere 1"},
+        ]}).json()
+        assert body["results"][0]["address"]["matched_address"] == KNOWN_MATCH
+
+        after = stub_stats(stubbed_mapbox)
+        assert after["forward_requests"] - before["forward_requests"] == 2
+        assert after["batch_requests"] == before["batch_requests"]
+
+    @pytest.mark.parametrize("batch_geocoding", [True, False])
+    def test_geocoding_failure_is_per_item(self, temp_database, monkeypatch, batch_geocoding):
+        """Test an unreachable provider reports errors instead of failing the request."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "mapbox_batch_geocoding", batch_geocoding)
+        monkeypatch.setattr(settings, "mapbox_base_url", "http://127.0.0.1:9/search/geocode/v6/forward")
+        with make_client(monkeypatch) as client:
+            body = client.post("/addresses/batch", json={"items": [{"address": KNOWN}]}).json()
+        assert body["results"][0] == {
+            "index": 0, "status": "error", "address": None, "error": "Geocoding failed",
+        }
+
+    def test_too_many_items(self, client, monkeypatch):
+        """Test oversized batches are rejected up front."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "batch_max_items", 2)
+        items = [{"address": KNOWN}] * 3
+        assert client.post("/addresses/batch", json={"items": items}).status_code == 413
@@ -0,0 +1,69 @@
+"""Tests for the streaming address export."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+ROWS = [
+    ("Paris, France", "Paris, Île-de-France, France", 0.95),
+    ('Rue "Calixte", 77', None, 0.0),
+    ("Königstraße 57", "Königstraße 57, 90762 Fürth, Germany", 0.81),
+]
+
+
+@pytest.fixture
+def client(temp_database, monkeypatch):
+    from config import settings
+    from infrastructure.repositories import AddressRepository
+    from main import app
+
+    monkeypatch.setattr(settings, "export_batch_size", 2)
+    AddressRepository().create_many([(a, m, s, None) for a, m, s in ROWS])
+    return TestClient(app)
+
+
+class TestAddressExport:
+    """Test suite for GET /addresses/export."""
+
+    def test_export_csv(self, client):
+        """Test CSV export round-trips every row with a header."""
+        response = client.get("/addresses/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "addresses.csv" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["address"] for r in rows] == [a for a, _, _ in ROWS]
+        assert [r["matched_address"] for r in rows] == [m or "" for _, m, _ in ROWS]
+        assert [float(r["match_score"]) for r in rows] == [s for _, _, s in ROWS]
+
+    def test_export_ndjson(self, client):
+        """Test NDJSON export emits one object per row in id order."""
+        response = client.get("/addresses/export?format=ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["id"] for r in rows] == [1, 2, 3]
+        assert rows[1] == {"id": 2, "address": ROWS[1][0], "matched_address": None, "match_score": 0.0}
+
+    @pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+    def test_export_columnar(self, client, export_format):
+        """Test Arrow IPC and Parquet exports keep float scores as a column."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        response = client.get(f"/addresses/export?format={export_format}")
+        assert response.status_code == 200
+
+        if export_format == "arrow":
+            table = pa.ipc.open_stream(response.content).read_all()
+        else:
+            table = pq.read_table(io.BytesIO(response.content))
+        assert table.schema.field("match_score").type == pa.float64()
+        assert table.column("match_score").to_pylist() == [s for _, _, s in ROWS]
+
+    def test_export_unknown_format(self, client):
+        """Test that unsupported formats are rejected."""
+        assert client.get("/addresses/export?format=xlsx").status_code == 422
@@ -0,0 +1,133 @@
+"""Tests for the streaming CSV/NDJSON bulk import."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.services import aiter_lines, parse_csv, parse_ndjson
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def _parse(parser, data: bytes, chunk_size: int = 7):
+    async def collect():
+        return [row async for row in parser(aiter_lines(_chunks(data, chunk_size)))]
+    return asyncio.run(collect())
+
+
+class TestImportParsing:
+    """Test suite for incremental parsing."""
+
+    def test_parse_csv_like_dataset(self):
+        """Test CSV with BOM, quoted commas, a multi-line field and a blank address."""
+        data = (
+            '﻿address,matched_address,semantic_similarity\r\n'
+            '"Germany,Schirgiswalde,2681","Untenende 2, Germany",0\r\n'
+            '"Königstraße 57,\n90762 Fuerth",,\r\n'
+            ',"Paris, France",1\r\n'
+        ).encode("utf-8")
+
+        rows = _parse(parse_csv, data)
+        assert [(r.line, r.address, r.error) for r in rows] == [
+            (2, "Germany,Schirgiswalde,2681", None),
+            (3, "Königstraße 57,\n90762 Fuerth", None),
+            (5, None, "Missing address"),
+        ]
+
+    def test_parse_csv_requires_address_column(self):
+        """Test that a header without an address column is rejected."""
+        rows = _parse(parse_csv, b"street,city\nMain St,Paris\n")
+        assert len(rows) == 1
+        assert "address" in rows[0].error
+
+    def test_parse_ndjson(self):
+        """Test NDJSON parsing with invalid lines reported per line."""
+        data = b'{"address": "Paris, France"}\n\nnot json\n{"name": "x"}\n'
+        rows = _parse(parse_ndjson, data)
+        assert [(r.line, r.address, r.error is not None) for r in rows] == [
+            (1, "Paris, France", False),
+            (3, None, True),
+            (4, None, True),
+        ]
+
+
+class TestImportEndpoint:
+    """Test suite for POST /addresses/import."""
+
+    @pytest.fixture
+    def client(self, temp_database, stubbed_mapbox, monkeypatch):
+        import api.routes.addresses as addresses_routes
+        from application.services import AddressService, AsyncAddressService
+        from main import app
+
+        monkeypatch.setattr(addresses_routes, "address_service", AddressService())
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        with TestClient(app) as client:
+            yield client
+
+    def test_import_csv_streams_results_in_order(self, client):
+        """Test that every row gets a result in input order and is persisted."""
+        from infrastructure.repositories import AddressRepository
+
+        body = (
+            "address,matched_address,semantic_similarity\n"
+            '"Germany,Schirgiswalde,2681",,\n'
+            ",,\n"
+            '"Nowhere 123",,\n'
+        )
+        response = client.post(
+            "/addresses/import", content=body.encode(), headers={"Content-Type": "text/csv"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [r.get("line") for r in lines[:-1]] == [2, 3, 4]
+        assert [r.get("status") for r in lines[:-1]] == ["created", "error", "created"]
+        assert lines[0]["address"]["matched_address"] == "Untenende 2, 26817 Rhauderfehn, Germany"
+        assert lines[-1] == {"summary": {"created": 2, "error": 1, "total": 3}}
+
+        stored = AddressRepository().iter_all(columns=["address"])
+        assert [a.address for a in stored] == ["Germany,Schirgiswalde,2681", "Nowhere 123"]
+
+    def test_import_ndjson_in_small_batches(self, client, monkeypatch):
+        """Test NDJSON import across several insert batches."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "import_batch_size", 2)
+        body = "\n".join(json.dumps({"address": f"Street {i}"}) for i in range(5))
+        response = client.post(
+            "/addresses/import?format=ndjson", content=body.encode()
+        )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["line"] for r in lines[:-1]] == [1, 2, 3, 4, 5]
+        assert lines[-1]["summary"]["created"] == 5
+
+    def test_unreachable_provider_reports_row_errors(self, temp_database, monkeypatch):
+        """Test rows whose lookup failed are reported as errors and not stored."""
+        import api.routes.addresses as addresses_routes
+        from application.services import AddressService, AsyncAddressService
+        from config import settings
+        from infrastructure.repositories import AddressRepository
+        from main import app
+
+        monkeypatch.setattr(
+            settings, "mapbox_base_url", "http://127.0.0.1:9/search/geocode/v6/forward"
+        )
+        monkeypatch.setattr(addresses_routes, "address_service", AddressService())
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        with TestClient(app) as client:
+            response = client.post(
+                "/addresses/import?format=ndjson", content=b'{"address": "Paris"}'
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"line": 1, "status": "error", "error": "Geocoding failed"}
+        assert lines[-1] == {"summary": {"created": 0, "error": 1, "total": 1}}
+        assert AddressRepository().count() == 0
@@ -0,0 +1,154 @@
+"""Tests for admission control on geocoding endpoints."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def gate():
+    from api.admission import AdmissionGate
+
+    return AdmissionGate("create", limit=1, queue_size=1, timeout=5.0)
+
+
+class TestAdmissionGate:
+    """Test suite for AdmissionGate."""
+
+    @pytest.mark.anyio
+    async def test_queue_then_reject(self, gate):
+        """Test requests over the limit wait, and over the queue get 429."""
+        await gate.acquire()
+        waiting = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert (gate.active, gate.queued) == (1, 1)
+
+        with pytest.raises(HTTPException) as rejected:
+            await gate.acquire()
+        assert rejected.value.status_code == 429
+        assert rejected.value.headers["Retry-After"] == "5"
+        assert gate.rejected == 1
+
+        gate.release()
+        await waiting
+        assert (gate.active, gate.queued) == (1, 0)
+        gate.release()
+        assert gate.active == 0
+
+    @pytest.mark.anyio
+    async def test_wait_times_out(self, gate):
+        """Test a request waiting longer than the timeout gets 503."""
+        gate.timeout = 0.01
+        await gate.acquire()
+
+        with pytest.raises(HTTPException) as timed_out:
+            await gate.acquire()
+        assert timed_out.value.status_code == 503
+        assert (gate.timed_out, gate.queued) == (1, 0)
+
+    @pytest.mark.anyio
+    async def test_slot_handed_over_as_wait_times_out(self, gate, monkeypatch):
+        """Test a slot handed to a waiter just as it times out goes to the next request."""
+        await gate.acquire()
+
+        async def handed_a_slot_then_timed_out(waiter, timeout):
+            gate.release()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr("api.admission.asyncio.wait_for", handed_a_slot_then_timed_out)
+        with pytest.raises(HTTPException) as timed_out:
+            await gate.acquire()
+        monkeypatch.undo()
+
+        assert timed_out.value.status_code == 503
+        assert (gate.active, gate.queued) == (0, 0)
+        await asyncio.wait_for(gate.acquire(), 1)
+
+    @pytest.mark.anyio
+    async def test_cancelled_waiter_leaves_queue(self, gate):
+        """Test a cancelled waiter is not handed the next slot."""
+        await gate.acquire()
+        waiting = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert gate.queued == 0
+
+        gate.release()
+        assert gate.active == 0
+
+
+class TestAdmissionRoutes:
+    """Test suite for gated endpoints under load."""
+
+    @pytest.mark.anyio
+    async def test_saturated_creates_do_not_block_reads(
+        self, temp_database, memory_cache, monkeypatch
+    ):
+        """Test creates over the limit get 429 while reads and metrics are served."""
+        import api.routes.addresses as addresses_routes
+        from api.admission import AdmissionGate, admission_gates
+        from application.services import AsyncAddressService
+        from infrastructure.repositories import AddressRepository
+        from main import app
+
+        [existing] = AddressRepository().create_many([("Paris", "Paris, France", 0.9, None)])
+        service = AsyncAddressService()
+        unblock = asyncio.Event()
+
+        async def slow_create(address, methods=()):
+            await unblock.wait()
+            return existing
+
+        monkeypatch.setattr(service, "create", slow_create)
+        monkeypatch.setattr(addresses_routes, "async_address_service", service)
+        monkeypatch.setitem(admission_gates, "create", AdmissionGate("create", 1, 0, 5.0))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.post("/addresses", json={"address": "Lyon"}))
+            while admission_gates["create"].active == 0:
+                await asyncio.sleep(0.01)
+
+            rejected = await client.post("/addresses", json={"address": "Nice"})
+            read = await client.get(f"/addresses/{existing.id}")
+            metrics = (await client.get("/metrics")).text
+
+            unblock.set()
+            assert (await first).status_code == 201
+
+        assert rejected.status_code == 429
+        assert rejected.headers["Retry-After"] == "5"
+        assert read.status_code == 200
+        assert 'admission_in_flight{endpoint="create"} 1' in metrics
+        assert 'admission_queue_depth{endpoint="create"} 0' in metrics
+        assert 'admission_rejected_total{endpoint="create"} 1' in metrics
+        assert admission_gates["create"].active == 0
+
+    def test_refresh_limited_by_active_jobs(self, mocker, monkeypatch):
+        """Test a refresh is rejected while the limit of refresh jobs is in progress."""
+        from fastapi.testclient import TestClient
+
+        import api.routes.addresses as addresses_routes
+        from config import settings
+        from main import app
+
+        engine = mocker.Mock()
+        engine.count_active.return_value = 1
+        monkeypatch.setattr(addresses_routes, "job_engine", engine)
+        monkeypatch.setattr(settings, "admission_refresh_limit", 1)
+
+        response = TestClient(app).post("/addresses/refresh", json={"ids": None})
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+        engine.submit.assert_not_called()
+        engine.count_active.assert_called_once_with("refresh")
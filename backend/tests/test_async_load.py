@@ -0,0 +1,222 @@
+"""Load test of POST /addresses: threadpool routes versus the asyncio stack.
+
+The app and the Mapbox stub (with injected upstream latency) each run under
+uvicorn in their own process, as they would in production, so request
+capacity is bounded by how many lookups can wait at once: FastAPI's
+threadpool for sync routes, sockets for async ones.
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List
+
+import aiohttp
+from fastapi import FastAPI
+
+import sys
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from tests.fakes import MapboxCorpus
+
+
+UPSTREAM_LATENCY_MS = 500
+
+
+@dataclass
+class LoadResult:
+    """Result of one load run."""
+    stack: str
+    concurrency: int
+    requests: int
+    errors: int
+    total_time_ms: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+
+
+def sync_app() -> FastAPI:
+    """The previous request path: a sync route on FastAPI's threadpool."""
+    from application.services import AddressService
+    from domain.models import Address, AddressCreate
+    from infrastructure.database import db
+
+    db.create_tables()
+    app = FastAPI()
+    service = AddressService()
+
+    @app.post("/addresses", response_model=Address, status_code=201)
+    def create_address(payload: AddressCreate) -> Address:
+        address = payload.address
+        matched, score, candidates = service.score_candidates(
+            address, service.lookup(address) or []
+        )
+        return service.create_scored([(address, matched, score, candidates)])[0]
+
+    return app
+
+
+async def drive(base_url: str, queries: List[str], concurrency: int) -> tuple[List[float], int, float]:
+    """POST every query with at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(session: aiohttp.ClientSession, query: str) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            async with session.post(f"{base_url}/addresses", json={"address": query}) as response:
+                await response.read()
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += response.status != 201
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(one(session, query) for query in queries))
+        total_ms = (time.perf_counter() - start) * 1000
+    return latencies, errors, total_ms
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve(args: List[str], port: int, env: dict) -> Iterator[str]:
+    """Run a server process and yield its base URL once it accepts connections."""
+    process = subprocess.Popen(
+        [sys.executable, *args], cwd=BACKEND_DIR, env={**os.environ, **env},
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                    break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"Server did not start: {args}")
+                time.sleep(0.05)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@contextmanager
+def slow_upstream() -> Iterator[str]:
+    """Serve the CSV corpus with fixed upstream latency; yields the forward URL."""
+    from tests.fakes.mapbox_server import FORWARD_PATH
+
+    port = free_port()
+    args = ["-W", "ignore::RuntimeWarning", "-m", "tests.fakes.mapbox_server", "--port", str(port),
+            "--latency-ms", str(UPSTREAM_LATENCY_MS)]
+    with serve(args, port, {}) as base_url:
+        yield f"{base_url}{FORWARD_PATH}"
+
+
+def run_load(
+    stack: str, app: str, queries: List[str], concurrency: int, env: dict
+) -> LoadResult:
+    """Serve the `app` import string with uvicorn and measure it under concurrent load."""
+    port = free_port()
+    args = ["-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"]
+    if stack == "threads":
+        args.append("--factory")
+    else:
+        subprocess.run(
+            [sys.executable, "cli.py", "migrate"], cwd=BACKEND_DIR,
+            env={**os.environ, **env}, check=True, capture_output=True,
+        )
+    with serve(args, port, env) as base_url:
+        latencies, errors, total_ms = asyncio.run(drive(base_url, queries, concurrency))
+
+    ordered = sorted(latencies)
+    return LoadResult(
+        stack=stack,
+        concurrency=concurrency,
+        requests=len(queries),
+        errors=errors,
+        total_time_ms=total_ms,
+        throughput_rps=len(queries) / (total_ms / 1000),
+        p50_ms=statistics.median(ordered),
+        p95_ms=ordered[int(len(ordered) * 0.95) - 1],
+    )
+
+
+def print_results_table(results: List[LoadResult]) -> None:
+    """Print load results as a formatted table."""
+    print("\n" + "=" * 88)
+    print(f"POST /addresses LOAD TEST (upstream latency {UPSTREAM_LATENCY_MS} ms)")
+    print("=" * 88)
+    print(
+        f"\n{'Stack':<10} {'Conc':>6} {'N':>6} {'Errors':>7} {'Total(ms)':>11} "
+        f"{'RPS':>9} {'p50(ms)':>9} {'p95(ms)':>9}"
+    )
+    print("-" * 88)
+
+    for r in results:
+        print(
+            f"{r.stack:<10} "
+            f"{r.concurrency:>6} "
+            f"{r.requests:>6} "
+            f"{r.errors:>7} "
+            f"{r.total_time_ms:>11.0f} "
+            f"{r.throughput_rps:>9.1f} "
+            f"{r.p50_ms:>9.0f} "
+            f"{r.p95_ms:>9.0f}"
+        )
+
+    print("=" * 88 + "\n")
+
+
+class TestAsyncLoad:
+    """Load test suite comparing the threadpool and asyncio request paths."""
+
+    def test_print_load_results(self, tmp_path):
+        """Print throughput before and after (always passes, just for output)."""
+        print_results_table(run_benchmark(tmp_path))
+
+
+def run_benchmark(work_dir: Path, requests: int = 200) -> List[LoadResult]:
+    """Load both stacks at the threadpool size and at full request concurrency."""
+    queries = [query for query, _ in MapboxCorpus.from_addresses_csv().items()][:requests]
+    stacks = {"threads": "tests.test_async_load:sync_app", "asyncio": "main:app"}
+
+    results = []
+    with slow_upstream() as forward_url:
+        for concurrency in (40, requests):
+            for stack, app in stacks.items():
+                env = {
+                    "DATABASE_URL": f"sqlite:///{work_dir / f'{stack}-{concurrency}.db'}",
+                    "MAPBOX_BASE_URL": forward_url,
+                    "MAPBOX_ACCESS_TOKEN": "test",
+                    "WARMUP_KEYS_PATH": str(work_dir / f"{stack}-{concurrency}.json"),
+                    # Measure the stack itself, not admission control
+                    "ADMISSION_CREATE_LIMIT": str(requests),
+                }
+                result = run_load(stack, app, queries, concurrency, env)
+                assert result.errors == 0
+                results.append(result)
+    return results
+
+
+# Allow running as standalone script
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        print_results_table(run_benchmark(Path(work_dir)))
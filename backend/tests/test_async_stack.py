@@ -0,0 +1,115 @@
+"""Tests for the asyncio request path: geocoder, repository, service and routes."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class TestAsyncMapboxClient:
+    """Test suite for AsyncMapboxClient against the stub server."""
+
+    @pytest.mark.anyio
+    async def test_candidates_match_sync_client(self, mapbox_stub):
+        """Test the async client decodes the same candidates as the sync one."""
+        from infrastructure.clients import AsyncMapboxClient, MapboxClient
+
+        query = "Germany,Schirgiswalde,2681"
+        client = AsyncMapboxClient(token="test", base_url=mapbox_stub.forward_url)
+        try:
+            candidates = await client.geocode_candidates(query)
+        finally:
+            await client.aclose()
+
+        sync_client = MapboxClient(token="test", base_url=mapbox_stub.forward_url)
+        assert candidates == sync_client.geocode_candidates(query)
+        assert candidates[0] == "Untenende 2, 26817 Rhauderfehn, Germany"
+
+    @pytest.mark.anyio
+    async def test_upstream_error_returns_empty(self):
+        """Test connection failures degrade to no candidates."""
+        from infrastructure.clients import AsyncMapboxClient
+
+        client = AsyncMapboxClient(token="test", base_url="http://127.0.0.1:9/forward")
+        try:
+            assert await client.geocode_candidates("Paris") == []
+        finally:
+            await client.aclose()
+
+
+class TestAsyncAddressRepository:
+    """Test suite for AsyncAddressRepository."""
+
+    @pytest.mark.anyio
+    async def test_create_get_update(self, temp_database):
+        """Test a row round-trips through the async engine."""
+        from infrastructure.repositories import AddressRepository, AsyncAddressRepository
+
+        repository = AsyncAddressRepository()
+        created = await repository.create("Paris", "Paris, France", 0.9, [
+            {"address": "Paris, France", "score": 0.9},
+        ])
+        assert (await repository.get_by_id(created.id)) == created
+        assert await repository.count() == 1
+
+        updated = await repository.update(created.id, "Lyon", "Lyon, France", 0.8)
+        assert updated.address == "Lyon"
+        assert AddressRepository().get_by_id(created.id) == updated
+        assert await repository.update(999, "x", "y", 0.0) is None
+
+    @pytest.mark.anyio
+    async def test_keyset_page(self, temp_database):
+        """Test keyset pages read newest first on both sides of a cursor."""
+        from infrastructure.repositories import AddressRepository, AsyncAddressRepository
+
+        AddressRepository().create_many([(f"Address {i}", None, 0.0, None) for i in range(5)])
+        repository = AsyncAddressRepository()
+        assert [a.id for a in await repository.get_page_by_keyset(2, after_id=4)] == [3, 2]
+        assert [a.id for a in await repository.get_page_by_keyset(2, before_id=2)] == [4, 3]
+
+
+class TestAsyncRoutes:
+    """Test suite for the async address routes."""
+
+    @pytest.fixture
+    def client(self, temp_database, stubbed_mapbox, monkeypatch):
+        import api.routes.addresses as addresses_routes
+        from application.services import AsyncAddressService
+        from main import app
+
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        # One client context keeps one event loop, like a server process
+        with TestClient(app) as client:
+            yield client
+
+    def test_create_update_get(self, client):
+        """Test create and update geocode through the async stack."""
+        response = client.post("/addresses", json={"address": "Germany,Schirgiswalde,2681"})
+        assert response.status_code == 201
+        created = response.json()
+        assert created["matched_address"] == "Untenende 2, 26817 Rhauderfehn, Germany"
+        assert created["match_score"] > 0
+
+        response = client.post(f"/addresses/{created['id']}", json={"address": "Nowhere 123"})
+        assert response.json()["matched_address"] == ""
+        assert client.get(f"/addresses/{created['id']}").json()["address"] == "Nowhere 123"
+
+    def test_scoring_runs_on_scoring_executor(self, client, mocker):
+        """Test similarity scoring is kept off the event loop thread."""
+        from application.services import async_address_service
+
+        threads = []
+        original = async_address_service.score_candidates_by_method
+
+        def record_thread(*args):
+            threads.append(threading.current_thread().name)
+            return original(*args)
+
+        mocker.patch.object(async_address_service, "score_candidates_by_method", record_thread)
+        client.post("/addresses", json={"address": "Germany,Schirgiswalde,2681"})
+        assert threads and threads[0].startswith("scoring")
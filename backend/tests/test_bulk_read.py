@@ -0,0 +1,86 @@
+"""Tests for bulk reads by id and the cache multi-get/multi-set."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client(temp_database, monkeypatch):
+    import api.routes.addresses as addresses_routes
+    from application.services import AsyncAddressService
+    from infrastructure.repositories import AddressRepository
+    from main import app
+
+    AddressRepository().create_many([(f"Address {i}", None, 0.0, None) for i in range(1, 6)])
+    monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+    with TestClient(app) as client:
+        yield client
+
+
+class TestCacheMany:
+    """Test suite for CacheClient.get_many/set_many."""
+
+    def test_memory_round_trip(self, memory_cache):
+        """Test multi-set values come back from a multi-get, misses left out."""
+        memory_cache.set_many({"a": "1", "b": "2"})
+        assert memory_cache.get_many(["a", "missing", "b"]) == {"a": "1", "b": "2"}
+        assert memory_cache.get_many([]) == {}
+
+    def test_redis_uses_mget_and_one_pipeline(self, memory_cache, mocker):
+        """Test Redis multi-get is one MGET and multi-set one pipeline."""
+        redis = mocker.MagicMock()
+        redis.mget.return_value = [b"1", None]
+        memory_cache._redis = redis
+
+        assert memory_cache.get_many(["a", "b"]) == {"a": "1"}
+        redis.mget.assert_called_once_with(["a", "b"])
+
+        memory_cache.set_many({"a": "1", "b": "2"}, ttl=30)
+        redis.pipeline.assert_called_once_with(transaction=False)
+        pipeline = redis.pipeline.return_value
+        assert pipeline.setex.call_args_list == [
+            mocker.call("a", 30, b"1"), mocker.call("b", 30, b"2"),
+        ]
+        pipeline.execute.assert_called_once()
+
+
+class TestBulkRead:
+    """Test suite for GET /addresses?ids=."""
+
+    def test_returns_requested_order(self, client, memory_cache):
+        """Test items follow the requested order and unknown ids are skipped."""
+        page = client.get("/addresses?ids=3,99,1&ids=5").json()
+        assert [item["id"] for item in page["items"]] == [3, 1, 5]
+        assert page["total"] == 3
+
+    def test_body_is_the_serialized_model(self, client, memory_cache):
+        """Test the assembled body is exactly what PaginatedAddresses would serialize."""
+        from domain.models import PaginatedAddresses
+
+        body = client.get("/addresses?ids=2,1").text
+        assert body == PaginatedAddresses.model_validate_json(body).model_dump_json()
+
+    def test_misses_fill_cache_in_one_query(self, client, memory_cache, mocker):
+        """Test misses are read with one query and later reads hit the cache."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        client.get("/addresses/2")  # Warm one entry through the single-id path
+        get_by_ids = mocker.spy(AsyncAddressRepository, "get_by_ids")
+        get_many = mocker.spy(memory_cache, "aget_many")
+        set_many = mocker.spy(memory_cache, "aset_many")
+
+        client.get("/addresses?ids=1,2,3")
+        assert get_by_ids.call_args.args[1] == [1, 3]
+        assert get_many.call_count == 1 and set_many.call_count == 1
+
+        client.get("/addresses?ids=1,2,3")
+        assert get_by_ids.call_count == 1
+
+    def test_invalid_ids(self, client, monkeypatch):
+        """Test malformed, empty and oversized id lists are client errors."""
+        from config import settings
+
+        assert client.get("/addresses?ids=1,x").status_code == 400
+        assert client.get("/addresses?ids=,").status_code == 400
+        monkeypatch.setattr(settings, "batch_max_items", 2)
+        assert client.get("/addresses?ids=1,2,3").status_code == 400
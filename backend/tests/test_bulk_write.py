@@ -0,0 +1,225 @@
+"""Tests and benchmark for chunked bulk inserts and updates of addresses.
+
+The previous `refresh_all` selected every row by id and updated the ORM
+objects in one transaction; the previous `create_many` flushed ORM
+objects. Both now run one executemany statement per chunk, committed
+chunk by chunk.
+
+The benchmark writes 100k rows and only runs with RUN_BENCHMARKS=1.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event, select
+
+from domain.models import Provenance, input_hash
+from infrastructure.entities import AddressEntity
+from infrastructure.repositories import AddressRepository
+
+# Rows written by the benchmark's bulk paths
+BENCHMARK_ROWS = 100_000
+# The legacy paths are measured on a sample and extrapolated, as they take minutes
+LEGACY_SAMPLE = 5_000
+
+
+def geocoded_provenance() -> Provenance:
+    from application.services.address_service import scoring_provenance
+
+    return scoring_provenance(geocoded=True)
+
+
+def rows(count: int, start: int = 0) -> List[tuple]:
+    return [
+        (
+            f"Street {i}, Paris",
+            f"Street {i}, 75001 Paris, France",
+            0.5,
+            [{"address": f"Street {i}, 75001 Paris, France", "score": 0.5}],
+        )
+        for i in range(start, start + count)
+    ]
+
+
+@contextmanager
+def statements(db) -> Iterator[List[tuple[str, bool]]]:
+    """Record (SQL verb, executemany) of every statement, and commits as ("COMMIT", False)."""
+    seen = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        seen.append((statement.split()[0].upper(), executemany))
+
+    def on_commit(conn):
+        seen.append(("COMMIT", False))
+
+    event.listen(db.engine, "before_cursor_execute", on_execute)
+    event.listen(db.engine, "commit", on_commit)
+    try:
+        yield seen
+    finally:
+        event.remove(db.engine, "before_cursor_execute", on_execute)
+        event.remove(db.engine, "commit", on_commit)
+
+
+def legacy_create_many(db, rows_to_insert: List[tuple]) -> None:
+    """The previous create_many: ORM objects added and flushed in one transaction."""
+    with db.session() as session:
+        entities = [
+            AddressEntity(address=a, matched_address=m, match_score=s, candidates=c)
+            for a, m, s, c in rows_to_insert
+        ]
+        for entity in entities:
+            entity.stamp(None)
+        session.add_all(entities)
+        session.flush()
+        [entity.to_domain() for entity in entities]
+
+
+def legacy_refresh_all(db, updates: List[tuple], provenance: Provenance) -> None:
+    """The previous refresh_all: one SELECT per row, all in one transaction."""
+    with db.session() as session:
+        for address_id, _, matched_address, match_score, candidates in updates:
+            entity = session.scalars(
+                select(AddressEntity).where(AddressEntity.id == address_id)
+            ).one_or_none()
+            if entity:
+                entity.matched_address = matched_address
+                entity.match_score = match_score
+                entity.candidates = candidates
+                entity.stamp(provenance)
+                entity.version += 1
+
+
+class TestRefreshAll:
+    """Test suite for AddressRepository.refresh_all."""
+
+    def test_writes_match_data_and_bumps_version(self, temp_database):
+        """Test rows get the new match, provenance and version; unknown ids are skipped."""
+        repository = AddressRepository()
+        created = repository.create_many(rows(2))
+        provenance = geocoded_provenance()
+
+        candidates = [{"address": "New match", "score": 0.9}]
+        repository.refresh_all([
+            (created[0].id, created[0].address, "New match", 0.9, candidates),
+            (999999, "Missing", "Nothing", 0.1, None),
+        ], provenance=provenance)
+
+        updated = repository.get_by_id(created[0].id)
+        untouched = repository.get_by_id(created[1].id)
+        assert (updated.matched_address, updated.match_score) == ("New match", 0.9)
+        assert updated.version == 2
+        assert [c.address for c in updated.candidates] == ["New match"]
+        assert (updated.score_method, updated.geocoded_at) == (
+            provenance.score_method, provenance.geocoded_at.replace(tzinfo=None),
+        )
+        assert untouched.version == 1
+        assert repository.get_by_id(999999) is None
+
+        with temp_database.session() as session:
+            entity = session.get(AddressEntity, created[0].id)
+            assert entity.input_hash == input_hash(created[0].address)
+            assert entity.geocoder_version == provenance.geocoder_version
+
+    def test_rescore_keeps_geocoding_provenance(self, temp_database):
+        """Test an update without geocoding leaves geocoded_at and the input hash as they were."""
+        repository = AddressRepository()
+        [address] = repository.create_many(rows(1), provenance=geocoded_provenance())
+        repository.refresh_all([(address.id, address.address, "Rescored", 0.7, None)])
+
+        rescored = repository.get_by_id(address.id)
+        assert rescored.geocoded_at == address.geocoded_at
+        assert (rescored.score_method, rescored.version) == (None, 2)
+
+    def test_one_executemany_and_commit_per_chunk(self, temp_database):
+        """Test rows are updated by primary key in chunks, without reading them first."""
+        repository = AddressRepository()
+        created = repository.create_many(rows(5))
+
+        with statements(temp_database) as seen:
+            repository.refresh_all(
+                [(a.id, a.address, "New", 0.9, None) for a in created], chunk_size=2
+            )
+
+        assert seen == [("UPDATE", True), ("COMMIT", False)] * 2 + [
+            ("UPDATE", False), ("COMMIT", False),  # A single-row chunk runs as execute
+        ]
+        assert {repository.get_by_id(a.id).version for a in created} == {2}
+
+
+class TestCreateMany:
+    """Test suite for AddressRepository.create_many."""
+
+    def test_returns_created_addresses_in_order(self, temp_database):
+        """Test ids, defaults and provenance come back for every row, in input order."""
+        provenance = geocoded_provenance()
+        created = AddressRepository().create_many(rows(5), provenance=provenance, chunk_size=2)
+
+        assert [a.address for a in created] == [row[0] for row in rows(5)]
+        assert [a.id for a in created] == sorted(a.id for a in created)
+        assert {a.version for a in created} == {1}
+        assert created[0].candidates[0].address == rows(1)[0][1]
+        assert created[0].score_method == provenance.score_method
+        assert AddressRepository().get_by_id(created[-1].id) == created[-1]
+
+    def test_one_commit_per_chunk(self, temp_database):
+        """Test each chunk is committed on its own, with no statement but inserts."""
+        with statements(temp_database) as seen:
+            AddressRepository().create_many(rows(5), chunk_size=2)
+
+        # With RETURNING in input order, SQLite is sent one row per INSERT
+        assert {verb for verb, _ in seen} == {"INSERT", "COMMIT"}
+        assert seen.count(("COMMIT", False)) == 3
+        assert seen[-1] == ("COMMIT", False)
+
+    def test_empty(self, temp_database):
+        """Test nothing is written for no rows."""
+        with statements(temp_database) as seen:
+            assert AddressRepository().create_many([]) == []
+            AddressRepository().refresh_all([])
+        assert seen == []
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="Set RUN_BENCHMARKS=1 to run")
+class TestBulkWriteBenchmark:
+    """Benchmark bulk inserts and updates at 100k rows against the previous paths."""
+
+    def test_print_bulk_write_results(self, temp_database):
+        """Print seconds and rows per second for each write path."""
+        repository = AddressRepository()
+        provenance = geocoded_provenance()
+        rows_count = BENCHMARK_ROWS
+        results = []
+
+        def run(label: str, count: int, work, measured: int) -> None:
+            started = time.perf_counter()
+            work()
+            elapsed = time.perf_counter() - started
+            results.append((label, count, elapsed * count / measured, measured != count))
+
+        created = []
+        run("create_many (bulk)", rows_count,
+            lambda: created.extend(repository.create_many(rows(rows_count))), rows_count)
+        run("create_many (before)", rows_count,
+            lambda: legacy_create_many(temp_database, rows(LEGACY_SAMPLE, start=rows_count)),
+            LEGACY_SAMPLE)
+
+        updates = [(a.id, a.address, "Refreshed", 0.9, None) for a in created]
+        run("refresh_all (bulk)", rows_count,
+            lambda: repository.refresh_all(updates, provenance=provenance), rows_count)
+        run("refresh_all (before)", rows_count,
+            lambda: legacy_refresh_all(temp_database, updates[:LEGACY_SAMPLE], provenance),
+            LEGACY_SAMPLE)
+
+        print(f"\n{'Path':<22} {'Rows':>8} {'Seconds':>9} {'Rows/s':>9}")
+        for label, count, seconds, estimated in results:
+            note = f"  (from {LEGACY_SAMPLE} rows)" if estimated else ""
+            print(f"{label:<22} {count:>8} {seconds:>9.2f} {count / seconds:>9.0f}{note}")
+
+        assert repository.count() == rows_count + LEGACY_SAMPLE
+        assert repository.get_by_id(created[-1].id).version == 2
+        seconds = {label: value for label, _, value, _ in results}
+        assert seconds["refresh_all (bulk)"] < seconds["refresh_all (before)"]
@@ -0,0 +1,165 @@
+"""Tests and benchmark for the Redis encoding of cached text."""
+
+import csv
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+
+from infrastructure.cache import CacheCodec, UnknownCacheFormat
+from infrastructure.cache.codecs import COMPRESSORS, MARKER
+
+PAGE_SIZE = 50
+
+
+def load_payloads(limit: int = 200) -> Dict[str, List[str]]:
+    """Address bodies, list pages and counts as cached, built from data/addresses.csv."""
+    from application.services.pagination import build_page
+    from domain.models import Address
+
+    data = Path(__file__).parent.parent.parent / "data" / "addresses.csv"
+    with open(data, newline="", encoding="utf-8-sig") as file:
+        rows = list(csv.DictReader(file))[:limit]
+    matches = [row["matched_address"] for row in rows]
+
+    addresses = [
+        Address(
+            id=i + 1,
+            address=row["address"],
+            matched_address=row["matched_address"],
+            match_score=float(row["semantic_similarity"] or 0),
+            candidates=[
+                {"address": match, "score": round(0.95 - j / 10, 4)}
+                for j, match in enumerate(matches[i:i + 5])
+            ],
+            score_method="jaro_winkler",
+            score_version="1",
+            geocoded_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        for i, row in enumerate(rows)
+    ]
+    pages = [
+        build_page(addresses[start:start + PAGE_SIZE + 1], PAGE_SIZE, 1, None, None, limit)
+        for start in range(0, limit, PAGE_SIZE)
+    ]
+    return {
+        "address": [address.model_dump_json() for address in addresses],
+        "page": [page.model_dump_json() for page in pages],
+        "count": [str(i * 7919) for i in range(limit)],
+    }
+
+
+def per_value_us(values: List, work: Callable, runs: int = 3) -> float:
+    """Fastest mean time of `work` per value over `runs`, in microseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        for value in values:
+            work(value)
+        best = min(best, time.perf_counter() - started)
+    return best / len(values) * 1e6
+
+
+class TestCacheCodec:
+    """Test suite for CacheCodec."""
+
+    @pytest.mark.parametrize("compression", sorted(COMPRESSORS))
+    def test_round_trip(self, compression):
+        """Test every installed compressor round-trips text and marks it in the header."""
+        codec = CacheCodec(compression, threshold=0)
+        value = '{"address": "Königstraße 57", "score": 0.5}'
+
+        encoded = codec.encode(value)
+        assert encoded[:2] == bytes((MARKER, codec.compressor.id))
+        assert CacheCodec().decode(encoded) == value
+
+    def test_compresses_only_above_threshold(self):
+        """Test small values are stored as plain UTF-8, large ones compressed."""
+        codec = CacheCodec("zlib", threshold=100)
+        assert codec.encode("Pâris") == "Pâris".encode()
+        assert codec.encode("x" * 1000)[:2] == bytes((MARKER, COMPRESSORS["zlib"].id))
+        assert len(codec.encode("x" * 1000)) < 100
+
+    def test_reads_plain_text(self):
+        """Test values written without a header, before or below the threshold, decode."""
+        assert CacheCodec("zlib", threshold=0).decode('{"a": 1}'.encode()) == '{"a": 1}'
+
+    def test_unknown_format(self):
+        """Test a compressor this process lacks raises UnknownCacheFormat."""
+        with pytest.raises(UnknownCacheFormat):
+            CacheCodec().decode(bytes((MARKER, 99)) + b"data")
+
+    def test_missing_library_falls_back(self):
+        """Test a configured compressor that is not installed stores plain text."""
+        assert CacheCodec("brotli", threshold=0).encode("text") == b"text"
+
+
+class TestCacheClientEncoding:
+    """Test suite for values travelling through the codec to and from Redis."""
+
+    def test_writes_encoded_and_reads_mixed_formats(self, memory_cache, mocker, monkeypatch):
+        """Test Redis gets encoded bytes and entries of any format are read back as text."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "cache_compression", "zlib")
+        monkeypatch.setattr(settings, "cache_compression_threshold", 10)
+        monkeypatch.setattr(memory_cache, "_codec", None)
+        redis = mocker.MagicMock()
+        memory_cache._redis = redis
+
+        body = '{"items": [' + ", ".join(['{"id": 1}'] * 20) + "]}"
+        memory_cache.set_many({"page": body, "count": "42"}, ttl=30)
+        pipeline = redis.pipeline.return_value
+        stored = {call.args[0]: call.args[2] for call in pipeline.setex.call_args_list}
+        assert stored["count"] == b"42"
+        assert stored["page"][:2] == bytes((MARKER, COMPRESSORS["zlib"].id))
+        assert len(stored["page"]) < len(body)
+
+        memory_cache._memory_cache.clear()
+        redis.mget.return_value = [stored["page"], b"legacy text", bytes((MARKER, 99)) + b"x"]
+        assert memory_cache.get_many(["page", "legacy", "newer"]) == {
+            "page": body, "legacy": "legacy text",
+        }
+        assert memory_cache._memory_cache.get("page") == body  # L1 keeps text
+
+    def test_unknown_format_is_a_miss(self, memory_cache, mocker):
+        """Test a value written with a compressor this process lacks reads as missing."""
+        redis = mocker.MagicMock()
+        redis.get.return_value = bytes((MARKER, 99)) + b"data"
+        memory_cache._redis = redis
+        misses = memory_cache.stats()["l2"].misses
+
+        assert memory_cache.get("newer") is None
+        assert memory_cache.stats()["l2"].misses == misses + 1
+
+
+class TestCodecBenchmark:
+    """Benchmark encode/decode time and stored bytes per compressor."""
+
+    def test_print_codec_results(self):
+        """Print time and size per compressor for address bodies, list pages and counts."""
+        payloads = load_payloads()
+        formats: Dict[str, CacheCodec] = {"text (before)": CacheCodec("none")}
+        for compression in sorted(COMPRESSORS):
+            formats[compression] = CacheCodec(compression, threshold=0)
+            formats[f"{compression} >= 1 KiB"] = CacheCodec(compression, threshold=1024)
+
+        print(f"\n{'Payload':<8} {'Format':<15} {'Encode(us)':>11} {'Decode(us)':>11} {'Bytes':>7}")
+        for name, values in payloads.items():
+            for label, codec in formats.items():
+                encoded = [codec.encode(value) for value in values]
+                assert [codec.decode(value) for value in encoded] == values
+                size = sum(len(value) for value in encoded) / len(values)
+                print(
+                    f"{name:<8} {label:<15} {per_value_us(values, codec.encode):>11.1f} "
+                    f"{per_value_us(encoded, codec.decode):>11.1f} {size:>7.0f}"
+                )
+
+        # Below the threshold nothing is added to the text; above it, pages shrink
+        codec = CacheCodec("zlib", threshold=1024)
+        for value in payloads["address"] + payloads["count"]:
+            if len(value.encode()) < 1024:
+                assert codec.encode(value) == value.encode()
+        assert all(len(codec.encode(page)) < len(page.encode()) for page in payloads["page"])
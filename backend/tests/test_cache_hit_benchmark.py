@@ -0,0 +1,194 @@
+"""Benchmark and tests of cache-hit reads: stored response bodies versus re-validated models.
+
+Both apps serve GET /addresses/{id} from a warm in-memory cache. The
+previous path parsed the cached dict, validated it into an `Address` and
+let FastAPI validate and encode it again through `response_model`; the
+current path returns the cached body as is.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import List
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+CANDIDATES = 5
+
+
+@dataclass
+class HitResult:
+    """Result of one cache-hit run."""
+    path: str
+    requests: int
+    total_time_ms: float
+    throughput_rps: float
+
+
+def legacy_app() -> FastAPI:
+    """The previous read path: cached dict -> Address -> response_model."""
+    from domain.models import Address
+    from infrastructure.cache import cache_client
+    from infrastructure.repositories import AddressRepository
+
+    app = FastAPI()
+    repository = AddressRepository()
+
+    @app.get("/addresses/{address_id}", response_model=Address)
+    def get_address(address_id: int) -> Address:
+        cache_key = f"legacy:{address_id}"
+        cached = cache_client.get(cache_key)
+        if cached:
+            return Address.model_validate(json.loads(cached))
+        address = repository.get_by_id(address_id)
+        if address:
+            cache_client.set(cache_key, address.model_dump_json())
+        return address
+
+    return app
+
+
+def seed(count: int = 50) -> List[int]:
+    """Insert addresses carrying a full candidate list each."""
+    from infrastructure.repositories import AddressRepository
+
+    candidates = [
+        {"address": f"Street {i}, 10115 Berlin, Germany", "score": 0.9 - i / 10}
+        for i in range(CANDIDATES)
+    ]
+    created = AddressRepository().create_many([
+        (f"Address {i}", candidates[0]["address"], 0.9, candidates) for i in range(count)
+    ])
+    return [address.id for address in created]
+
+
+async def measure(app: FastAPI, path: str, ids: List[int], requests: int) -> HitResult:
+    """Issue `requests` sequential GETs in-process, after one warming pass."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for address_id in ids:
+            assert (await client.get(f"/addresses/{address_id}")).status_code == 200
+
+        start = time.perf_counter()
+        for i in range(requests):
+            response = await client.get(f"/addresses/{ids[i % len(ids)]}")
+            assert response.status_code == 200
+        elapsed = time.perf_counter() - start
+
+    return HitResult(
+        path=path,
+        requests=requests,
+        total_time_ms=elapsed * 1000,
+        throughput_rps=requests / elapsed,
+    )
+
+
+def run_benchmark(requests: int = 2000) -> List[HitResult]:
+    """Compare both read paths on the same rows and a warm cache."""
+    import api.routes.addresses as addresses_routes
+    from application.services import AsyncAddressService
+    from main import app
+
+    ids = seed()
+
+    async def run() -> List[HitResult]:
+        original = addresses_routes.async_address_service
+        addresses_routes.async_address_service = AsyncAddressService()
+        try:
+            return [
+                await measure(legacy_app(), "validated", ids, requests),
+                await measure(app, "stored body", ids, requests),
+            ]
+        finally:
+            await addresses_routes.async_address_service.aclose()
+            addresses_routes.async_address_service = original
+
+    return asyncio.run(run())
+
+
+def print_results_table(results: List[HitResult]) -> None:
+    """Print benchmark results as a formatted table."""
+    print("\n" + "=" * 64)
+    print(f"GET /addresses/{{id}} CACHE HITS ({CANDIDATES} candidates per address)")
+    print("=" * 64)
+    print(f"{'Path':<14} {'Requests':>10} {'Total (ms)':>12} {'Req/s':>10} {'Speedup':>10}")
+    print("-" * 64)
+    baseline = results[0].throughput_rps
+    for result in results:
+        print(
+            f"{result.path:<14} {result.requests:>10} {result.total_time_ms:>12.1f} "
+            f"{result.throughput_rps:>10.0f} {result.throughput_rps / baseline:>9.2f}x"
+        )
+    print("=" * 64 + "\n")
+
+
+class TestStoredBodies:
+    """Test suite for serving cached address bodies verbatim."""
+
+    @pytest.fixture
+    def client(self, temp_database, memory_cache, monkeypatch):
+        import api.routes.addresses as addresses_routes
+        from application.services import AsyncAddressService
+        from main import app
+
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        with TestClient(app) as client:
+            yield client
+
+    def test_hit_skips_validation(self, client, memory_cache, mocker):
+        """Test a cache hit returns the stored body without building a model."""
+        from domain.models import Address
+
+        address_id = seed(1)[0]
+        first = client.get(f"/addresses/{address_id}")
+        assert memory_cache.get(f"address:{address_id}") == first.text
+
+        validate = mocker.spy(Address, "model_validate")
+        validate_json = mocker.spy(Address, "model_validate_json")
+        second = client.get(f"/addresses/{address_id}")
+        assert second.content == first.content
+        assert second.headers["content-type"] == "application/json"
+        assert second.headers["etag"] == first.headers["etag"]
+        assert validate.call_count == validate_json.call_count == 0
+
+    def test_body_matches_model(self, client):
+        """Test stored bodies and list pages keep the Address schema."""
+        from domain.models import Address
+
+        address_id = seed(1)[0]
+        client.get(f"/addresses/{address_id}")
+        cached = Address.model_validate_json(client.get(f"/addresses/{address_id}").content)
+        assert len(cached.candidates) == CANDIDATES
+
+        page = client.get("/addresses").json()
+        assert Address.model_validate(page["items"][0]) == cached
+        assert client.get(f"/addresses?ids={address_id}").json()["items"] == page["items"]
+
+    def test_missing_address(self, client):
+        """Test unknown ids are a 404."""
+        assert client.get("/addresses/999").status_code == 404
+
+
+class TestCacheHitBenchmark:
+    """Cache-hit throughput of both read paths."""
+
+    def test_print_hit_results(self, temp_database, memory_cache):
+        """Run the benchmark and print results (always passes)."""
+        print_results_table(run_benchmark())
+
+
+# Allow running as standalone script; uses DATABASE_URL and the configured cache
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from infrastructure.database import db
+
+    db.create_tables()
+    print_results_table(run_benchmark())
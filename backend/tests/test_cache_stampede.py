@@ -0,0 +1,207 @@
+"""Tests for stampede protection: collapsed misses, early refresh and stale-while-revalidate."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from infrastructure.cache import stampede
+from infrastructure.cache.stampede import Freshness
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class SlowSource:
+    """A compute function that takes a while and counts its calls."""
+
+    def __init__(self, value: str = "computed", delay: float = 0.1):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+    async def acall(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.value
+
+
+def store(cache, key: str, value: str, expires_in: float, delta: float = 0.01) -> None:
+    """Cache `value` as if computed earlier, expiring `expires_in` seconds from now."""
+    cache.set_many({
+        key: value,
+        f"{key}:freshness": Freshness(time.time() + expires_in, delta).encode(),
+    }, ttl=60)
+
+
+class TestFreshness:
+    """Test suite for XFetch early expiration."""
+
+    def test_expired_is_due(self):
+        """Test an expired value is always due, even with early refresh disabled."""
+        assert Freshness(time.time() - 1, 0.1).refresh_due(time.time(), beta=0)
+
+    def test_early_refresh_probability(self, monkeypatch):
+        """Test refresh becomes likely only when expiry is near, relative to compute time."""
+        now = time.time()
+        near, far = Freshness(now + 0.05, 0.1), Freshness(now + 60, 0.1)
+        monkeypatch.setattr(stampede.random, "random", lambda: 0.5)  # -log(0.5) ~ 0.69
+
+        assert near.refresh_due(now, beta=1.0)
+        assert not far.refresh_due(now, beta=1.0)
+        assert not near.refresh_due(now, beta=0)
+
+    def test_decode(self):
+        """Test malformed or missing freshness reads as none."""
+        assert Freshness.decode(Freshness(1.5, 0.25).encode()) == Freshness(1.5, 0.25)
+        assert Freshness.decode(None) is None
+        assert Freshness.decode("garbage") is None
+
+
+class TestGetOrCompute:
+    """Test suite for CacheClient.get_or_compute."""
+
+    def test_concurrent_misses_compute_once(self, memory_cache):
+        """Test threads missing the same key at once share one computation."""
+        source = SlowSource()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(memory_cache.get_or_compute("k", source)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert source.calls == 1
+        assert results == ["computed"] * 8
+        assert memory_cache.get_or_compute("k", source) == "computed"
+        assert source.calls == 1
+
+    def test_none_is_not_cached(self, memory_cache):
+        """Test a missing value is computed again next time."""
+        calls = []
+        assert memory_cache.get_or_compute("k", lambda: calls.append(1)) is None
+        assert memory_cache.get_or_compute("k", lambda: calls.append(1)) is None
+        assert len(calls) == 2
+
+    def test_early_refresh_by_one_caller(self, memory_cache, monkeypatch):
+        """Test a caller picked for early refresh recomputes before expiry."""
+        from config import settings
+
+        store(memory_cache, "k", "old", expires_in=0.01, delta=1.0)
+        monkeypatch.setattr(settings, "cache_early_refresh_beta", 1.0)
+        source = SlowSource("new", delay=0)
+
+        assert memory_cache.get_or_compute("k", source) == "new"
+        assert memory_cache.get("k") == "new"
+
+    def test_early_refresh_leased_elsewhere_serves_value(self, memory_cache):
+        """Test callers not holding the lease keep getting the current value."""
+        store(memory_cache, "k", "old", expires_in=0.01, delta=1.0)
+        assert memory_cache._acquire_lease("k")
+        source = SlowSource("new", delay=0)
+
+        assert memory_cache.get_or_compute("k", source) == "old"
+        assert source.calls == 0
+
+    def test_expired_without_stale_window_recomputes(self, memory_cache, monkeypatch):
+        """Test an expired value is not served when stale-while-revalidate is off."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "cache_stale_ttl", 0)
+        store(memory_cache, "k", "old", expires_in=-1)
+        assert memory_cache.get_or_compute("k", SlowSource("new", delay=0)) == "new"
+
+    def test_stale_while_revalidate(self, memory_cache, monkeypatch):
+        """Test an expired value is served while one background refresh replaces it."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "cache_stale_ttl", 30)
+        store(memory_cache, "k", "old", expires_in=-1)
+        source = SlowSource("new", delay=0.05)
+
+        assert memory_cache.get_or_compute("k", source) == "old"
+        assert memory_cache.get_or_compute("k", source) == "old"
+        deadline = time.monotonic() + 5
+        while memory_cache.get("k") != "new":
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert source.calls == 1
+
+    def test_waits_for_another_process(self, memory_cache, monkeypatch):
+        """Test a miss whose lease is held elsewhere waits for that value instead of computing."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "cache_lease_poll_interval", 0.01)
+        assert memory_cache._acquire_lease("k")  # Held by "another process"
+        threading.Timer(0.1, lambda: memory_cache.set("k", "theirs")).start()
+        source = SlowSource(delay=0)
+
+        assert memory_cache.get_or_compute("k", source) == "theirs"
+        assert source.calls == 0
+
+
+class TestAsyncGetOrCompute:
+    """Test suite for CacheClient.aget_or_compute."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_misses_compute_once(self, memory_cache):
+        """Test coroutines missing the same key at once share one computation."""
+        source = SlowSource()
+        results = await asyncio.gather(
+            *(memory_cache.aget_or_compute("k", source.acall) for _ in range(20))
+        )
+        assert results == ["computed"] * 20
+        assert source.calls == 1
+
+    @pytest.mark.anyio
+    async def test_failure_lets_waiters_compute(self, memory_cache):
+        """Test waiters compute themselves when the first caller fails."""
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            await asyncio.sleep(0.05)
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return "computed"
+
+        results = await asyncio.gather(
+            memory_cache.aget_or_compute("k", flaky),
+            memory_cache.aget_or_compute("k", flaky),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == "computed"
+
+    @pytest.mark.anyio
+    async def test_expired_address_queries_once(self, temp_database, memory_cache, monkeypatch, mocker):
+        """Test a burst of reads of an expired address reaches the database once."""
+        import api.routes.addresses as addresses_routes
+        from application.services import AsyncAddressService
+        from infrastructure.repositories import AddressRepository, AsyncAddressRepository
+        from main import app
+
+        [address] = AddressRepository().create_many([("Paris", "Paris, France", 0.9, None)])
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        get_by_id = mocker.spy(AsyncAddressRepository, "get_by_id")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(client.get(f"/addresses/{address.id}") for _ in range(20))
+            )
+
+        assert {response.status_code for response in responses} == {200}
+        assert get_by_id.call_count == 1
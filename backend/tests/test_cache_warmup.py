@@ -0,0 +1,244 @@
+"""Tests for hot key tracking and the cache warm-up at startup and after refresh jobs."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.services import CacheWarmer, HotKeys
+from application.services.address_service import AddressService
+from infrastructure.repositories import AddressRepository, AsyncAddressRepository
+
+PAGE = dict(page=1, per_page=5, after=None, before=None, with_total=True)
+
+
+@pytest.fixture
+def addresses(temp_database):
+    """Ids of six stored addresses."""
+    repository = AddressRepository()
+    return [
+        address.id for address in repository.create_many(
+            [(f"Street {i}", f"Street {i}, Paris", 0.9, None) for i in range(6)]
+        )
+    ]
+
+
+@pytest.fixture
+def warmer(hot_keys, memory_cache):
+    """A cache warmer over the shared hot keys and a fresh in-memory cache."""
+    return CacheWarmer(hot_keys)
+
+
+def address_key(address_id: int) -> str:
+    return f"{AddressService.CACHE_KEY_PREFIX}{address_id}"
+
+
+class TestHotKeys:
+    """Test suite for HotKeys."""
+
+    def test_most_read_first(self):
+        """Test addresses and pages are ranked by reads."""
+        keys = HotKeys()
+        keys.record_addresses([1, 2, 2, 3, 3, 3])
+        keys.record_page(page=2, per_page=5)
+        keys.record_page(page=1, per_page=5)
+        keys.record_page(per_page=5, page=1)
+
+        assert keys.top_addresses(2) == [3, 2]
+        assert keys.top_pages(5) == [{"page": 1, "per_page": 5}, {"page": 2, "per_page": 5}]
+
+    def test_tracked_keys_are_bounded(self):
+        """Test the less read half is dropped past the limit, keeping the hottest."""
+        keys = HotKeys(max_tracked=10)
+        for _ in range(5):
+            keys.record_address(0)
+        keys.record_addresses(range(1, 100))
+
+        assert len(keys.top_addresses(1000)) <= 10
+        assert keys.top_addresses(1) == [0]
+
+    def test_snapshot_merges_with_weight(self):
+        """Test a saved snapshot is read back with scaled counts."""
+        keys = HotKeys()
+        keys.record_addresses([7, 7, 7, 7, 8])
+        keys.record_page(**PAGE)
+
+        restored = HotKeys()
+        restored.record_addresses([8, 8, 8])
+        restored.merge(json.loads(json.dumps(keys.snapshot(10, 10))), weight=0.5)
+
+        assert restored.top_addresses(2) == [8, 7]  # 3.5 reads against 2
+        assert restored.top_pages(1) == [PAGE]
+
+    def test_malformed_snapshot(self):
+        """Test a snapshot that is not a list of pairs raises ValueError."""
+        with pytest.raises(ValueError):
+            HotKeys().merge({"addresses": [["not an id", 1]]})
+
+
+class TestCacheWarmer:
+    """Test suite for CacheWarmer."""
+
+    def test_caches_hot_addresses_in_chunks(
+        self, addresses, warmer, memory_cache, monkeypatch, mocker
+    ):
+        """Test hot addresses are read with one query and written with one pipeline per chunk."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "warmup_batch_size", 2)
+        warmer.hot_keys.record_addresses(addresses[:4])
+        get_by_ids = mocker.spy(AddressRepository, "get_by_ids")
+        set_many = mocker.spy(memory_cache, "set_many")
+
+        assert warmer.warm()
+        assert get_by_ids.call_count == set_many.call_count == 2
+        assert warmer.stats.addresses == 4
+        assert set(memory_cache.get_many([address_key(i) for i in addresses])) == {
+            address_key(i) for i in addresses[:4]
+        }
+
+    def test_skips_cached_addresses(self, addresses, warmer, mocker):
+        """Test a second warm-up makes no query for addresses still cached."""
+        warmer.hot_keys.record_addresses(addresses)
+        warmer.warm()
+        get_by_ids = mocker.spy(AddressRepository, "get_by_ids")
+
+        warmer.warm()
+        assert get_by_ids.call_count == 0
+        assert warmer.stats.addresses == 0
+
+    def test_warmed_page_is_served_by_requests(self, addresses, warmer, mocker):
+        """Test a warmed list page is the body requests read, under the same key."""
+        from application.services import AsyncAddressService
+
+        warmer.hot_keys.record_page(**PAGE)
+        warmer.warm()
+        get_page = mocker.spy(AsyncAddressRepository, "get_page")
+
+        body = asyncio.run(AsyncAddressService().get_all_json(**PAGE))
+        assert get_page.call_count == 0
+        assert warmer.stats.pages == 1
+        assert json.loads(body)["total"] == len(addresses)
+
+    def test_concurrency_cap(self, addresses, warmer, monkeypatch):
+        """Test no more than warmup_concurrency chunks load at once."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "warmup_batch_size", 1)
+        monkeypatch.setattr(settings, "warmup_concurrency", 2)
+        warmer.hot_keys.record_addresses(addresses)
+        loading, peak, lock = [0], [0], threading.Lock()
+        original = AddressRepository.get_by_ids
+
+        def slow_get_by_ids(repository, ids):
+            with lock:
+                loading[0] += 1
+                peak[0] = max(peak[0], loading[0])
+            time.sleep(0.02)
+            with lock:
+                loading[0] -= 1
+            return original(repository, ids)
+
+        monkeypatch.setattr(AddressRepository, "get_by_ids", slow_get_by_ids)
+        warmer.warm()
+        assert peak[0] == 2
+        assert warmer.stats.addresses == len(addresses)
+
+    def test_failure_is_counted_not_raised(self, addresses, warmer, monkeypatch):
+        """Test a failing warm-up leaves the caller running and reports the error."""
+        def unavailable(*args):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(AddressRepository, "get_by_ids", unavailable)
+        warmer.hot_keys.record_addresses(addresses)
+
+        assert warmer.warm()
+        assert (warmer.stats.runs, warmer.stats.failures) == (1, 1)
+        assert "database unavailable" in warmer.stats.error
+
+    def test_one_warm_up_at_a_time(self, warmer):
+        """Test a warm-up requested while one runs is skipped."""
+        warmer._running.acquire()
+        try:
+            assert not warmer.warm()
+        finally:
+            warmer._running.release()
+        assert warmer.stats.runs == 0
+
+    def test_saved_keys_survive_a_restart(self, warmer):
+        """Test the next process loads the hot keys this one saved."""
+        warmer.hot_keys.record_addresses([5, 5, 9])
+        warmer.hot_keys.record_page(**PAGE)
+        assert warmer.save()
+
+        restarted = CacheWarmer(HotKeys())
+        restarted.load()
+        assert restarted.hot_keys.top_addresses(10) == [5, 9]
+        assert restarted.hot_keys.top_pages(10) == [PAGE]
+
+    def test_unreadable_keys_start_cold(self, tmp_path):
+        """Test a corrupt hot key file is reported and otherwise ignored."""
+        path = tmp_path / "corrupt.json"
+        path.write_text("{not json")
+
+        restarted = CacheWarmer(HotKeys(), path=str(path))
+        restarted.load()
+        assert restarted.hot_keys.top_addresses(10) == []
+        assert restarted.stats.error
+
+
+class TestWarmupTriggers:
+    """Test suite for what records hot keys and when the cache is warmed."""
+
+    def test_reads_are_recorded(self, addresses, memory_cache, hot_keys, monkeypatch):
+        """Test addresses and pages served to clients are recorded."""
+        import api.routes.addresses as addresses_routes
+        from application.services import AsyncAddressService
+        from main import app
+
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        client = TestClient(app)
+        client.get(f"/addresses/{addresses[0]}")
+        client.get(f"/addresses/{addresses[0]}")
+        client.get(f"/addresses?ids={addresses[1]},{addresses[0]}")
+        client.get("/addresses?page=1&per_page=5")
+        client.get("/addresses/999999")
+
+        assert hot_keys.top_addresses(10) == [addresses[0], addresses[1]]
+        assert hot_keys.top_pages(10) == [PAGE]
+
+    def test_startup_warms_from_saved_keys(self, addresses, memory_cache, monkeypatch):
+        """Test the app caches the saved hot keys on startup and saves them on shutdown."""
+        from application.services import cache_warmer
+        from config import settings
+        from main import app
+
+        with open(settings.warmup_keys_path, "w") as file:
+            json.dump({"addresses": [[addresses[2], 4]], "pages": []}, file)
+        monkeypatch.setattr(cache_warmer, "stats", type(cache_warmer.stats)())
+
+        with TestClient(app):
+            deadline = time.monotonic() + 10
+            while cache_warmer.stats.runs == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            assert memory_cache.get(address_key(addresses[2])) is not None
+
+        with open(settings.warmup_keys_path) as file:
+            assert json.load(file)["addresses"] == [[addresses[2], 2.0]]
+
+    def test_refresh_job_warms_after(self, temp_database, mocker):
+        """Test the refresh job handler warms the cache once it is done."""
+        from application.jobs.handlers import refresh_handler
+        from application.services import cache_warmer
+
+        mocker.patch.object(AddressService, "refresh_chunk", side_effect=[(3, 3, 3), (0, 0, None)])
+        warm = mocker.patch.object(cache_warmer, "warm")
+        context = mocker.MagicMock(params={}, checkpoint=None)
+
+        refresh_handler(context)
+        warm.assert_called_once_with()
+        context.advance.assert_called_once_with(3, 3)
@@ -0,0 +1,117 @@
+"""Tests for ETags, conditional GETs and row versions."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture
+def client(temp_database, memory_cache, stubbed_mapbox, monkeypatch):
+    import api.routes.addresses as addresses_routes
+    from application.services import AsyncAddressService
+    from infrastructure.repositories import AddressRepository
+    from main import app
+
+    AddressRepository().create_many([(f"Address {i}", None, 0.0, None) for i in range(1, 4)])
+    monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+    with TestClient(app) as client:
+        yield client
+
+
+class TestEtagMatching:
+    """Test suite for If-None-Match parsing."""
+
+    @pytest.mark.parametrize("header, expected", [
+        (None, False),
+        ('"1.2"', True),
+        ('W/"1.2"', True),
+        ('"1.1", "1.2"', True),
+        ("*", True),
+        ('"1.1"', False),
+    ])
+    def test_etag_matches(self, header, expected):
+        """Test strong and weak tags, lists and the wildcard."""
+        from api.responses import etag_matches
+
+        assert etag_matches(header, '"1.2"') is expected
+
+
+class TestConditionalItem:
+    """Test suite for GET /addresses/{id} validators."""
+
+    def test_not_modified_without_database(self, client, mocker):
+        """Test a matching ETag is answered from the cache with 304."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        response = client.get("/addresses/1")
+        assert response.headers["ETag"] == '"1.1"'
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        get_by_id = mocker.spy(AsyncAddressRepository, "get_by_id")
+        response = client.get("/addresses/1", headers={"If-None-Match": '"1.1"'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == '"1.1"'
+        get_by_id.assert_not_called()
+
+    def test_update_bumps_version(self, client):
+        """Test an update changes the ETag so old validators get the new body."""
+        client.get("/addresses/1")
+        updated = client.post("/addresses/1", json={"address": "Nowhere 1"}).json()
+        assert updated["version"] == 2
+
+        response = client.get("/addresses/1", headers={"If-None-Match": '"1.1"'})
+        assert response.status_code == 200
+        assert response.headers["ETag"] == '"1.2"'
+
+
+class TestConditionalList:
+    """Test suite for GET /addresses validators."""
+
+    def test_list_not_modified_until_write(self, client, mocker):
+        """Test list pages revalidate by table revision without a query."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        etag = client.get("/addresses").headers["ETag"]
+        get_page = mocker.spy(AsyncAddressRepository, "get_page")
+        assert client.get("/addresses", headers={"If-None-Match": etag}).status_code == 304
+        get_page.assert_not_called()
+
+        client.post("/addresses", json={"address": "Nowhere 4"})
+        response = client.get("/addresses", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_refresh_bumps_versions_and_revision(self, client):
+        """Test the refresh path changes row versions and the list ETag."""
+        from application.services import AddressService
+
+        etag = client.get("/addresses").headers["ETag"]
+        AddressService().refresh_chunk(None, 10)
+
+        assert client.get("/addresses", headers={"If-None-Match": etag}).status_code == 200
+        assert client.get("/addresses/2").json()["version"] == 2
+
+
+class TestVersionColumnMigration:
+    """Test suite for adding the version column to existing tables."""
+
+    def test_existing_rows_get_version_one(self, tmp_path):
+        """Test create_tables backfills the NOT NULL version column."""
+        from infrastructure.database import Database
+
+        url = f"sqlite:///{tmp_path / 'old.db'}"
+        engine = create_engine(url)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE addresses (id INTEGER PRIMARY KEY, address VARCHAR NOT NULL, "
+                "matched_address VARCHAR, match_score FLOAT)"
+            ))
+            connection.execute(text("INSERT INTO addresses (address) VALUES ('Paris')"))
+        engine.dispose()
+
+        database = Database(url)
+        database.create_tables()
+        with database.engine.connect() as connection:
+            assert connection.execute(text("SELECT version FROM addresses")).scalar() == 1
+        database.engine.dispose()
@@ -0,0 +1,154 @@
+"""Tests for incremental refresh: staleness policy, dry runs and forced refreshes."""
+
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+
+KNOWN = "Germany,Schirgiswalde,2681"
+KNOWN_MATCH = "Untenende 2, 26817 Rhauderfehn, Germany"
+
+
+@pytest.fixture
+def service(temp_database, stubbed_mapbox, memory_cache):
+    from application.services import AddressService
+
+    return AddressService()
+
+
+@pytest.fixture
+def geocoded(service, api_client):
+    """Three addresses created through the API just now, so none is stale."""
+    from domain.models import Address
+
+    return [
+        Address.model_validate(api_client.post("/addresses", json={"address": address}).json())
+        for address in (KNOWN, "Nowhere 1", "Nowhere 2")
+    ]
+
+
+def stored(address_id: int):
+    from infrastructure.repositories import AddressRepository
+
+    return AddressRepository().get_by_id(address_id)
+
+
+@pytest.fixture
+def forward(mocker):
+    """Spy on Mapbox forward geocoding requests."""
+    from infrastructure.clients import MapboxClient
+
+    return mocker.spy(MapboxClient, "_forward")
+
+
+def set_columns(address_id: int, **values) -> None:
+    """Change stored columns behind the services' back."""
+    from infrastructure.database import db
+    from infrastructure.entities import AddressEntity
+
+    with db.session() as session:
+        session.execute(update(AddressEntity).where(AddressEntity.id == address_id).values(**values))
+
+
+class TestRefreshPolicy:
+    """Test suite for which rows a refresh touches."""
+
+    def test_fresh_rows_are_skipped(self, service, geocoded, forward, refresh_job):
+        """Test a refresh right after geocoding makes no lookups."""
+        assert service.plan_refresh().model_dump() == {"total": 3, "stale": 0, "reasons": {}}
+        job = refresh_job()
+        assert (job.total, job.processed) == (0, 0)
+        assert forward.call_count == 0
+
+    def test_stale_rows_by_reason(self, service, geocoded, forward, refresh_job, monkeypatch):
+        """Test each policy rule selects its row and only those are geocoded."""
+        from application.services.refresh_policy import utcnow
+        from config import settings
+
+        monkeypatch.setattr(settings, "refresh_max_age_days", 30)
+        set_columns(geocoded[0].id, address="Germany, Schirgiswalde, 2681")
+        set_columns(geocoded[1].id, geocoded_at=utcnow() - timedelta(days=31))
+        set_columns(geocoded[2].id, geocoded_at=None)
+
+        plan = service.plan_refresh()
+        assert plan.stale == 3
+        assert plan.reasons == {"input_changed": 1, "expired": 1, "never_geocoded": 1}
+
+        refresh_job()
+        assert forward.call_count == 3
+        assert service.plan_refresh().stale == 0
+
+    def test_low_score_and_geocoder_version(self, service, geocoded, monkeypatch):
+        """Test low scores and a bumped geocoder version make rows stale."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "refresh_min_score", 0.01)
+        assert service.plan_refresh().reasons == {"low_score": 2}
+
+        monkeypatch.setattr(settings, "geocoder_version", "mapbox-v7")
+        assert service.plan_refresh().reasons == {"geocoder_changed": 3}
+
+    def test_method_change_rescores_without_lookup(
+        self, service, geocoded, forward, refresh_job, monkeypatch
+    ):
+        """Test rows only scored by another method are rescored from stored candidates."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "default_similarity_method", "levenshtein")
+        assert service.plan_refresh().reasons == {"method_changed": 3}
+
+        refresh_job()
+        assert forward.call_count == 0
+        refreshed = stored(geocoded[0].id)
+        assert refreshed.score_method == "levenshtein"
+        assert refreshed.matched_address == KNOWN_MATCH
+
+    def test_failed_lookup_keeps_row_stale(self, service, geocoded, refresh_job, monkeypatch):
+        """Test a failed lookup keeps the previous match and is retried next time."""
+        from config import settings
+
+        set_columns(geocoded[0].id, geocoded_at=None)
+        monkeypatch.setattr(settings, "mapbox_base_url", "http://127.0.0.1:9/forward")
+        refresh_job()
+
+        unchanged = stored(geocoded[0].id)
+        assert unchanged.matched_address == KNOWN_MATCH
+        assert unchanged.version == geocoded[0].version
+        assert service.plan_refresh().reasons == {"never_geocoded": 1}
+
+    def test_force_refreshes_everything(self, service, geocoded, forward, refresh_job):
+        """Test `force` ignores the policy."""
+        assert service.plan_refresh(force=True).reasons == {"forced": 3}
+        refresh_job(force=True)
+        assert forward.call_count == 3
+
+    def test_selected_ids_are_forced(self, service, geocoded, forward, refresh_job):
+        """Test rows asked for by id are refreshed though fresh, and only those are counted."""
+        ids = [geocoded[0].id, geocoded[2].id]
+        assert service.plan_refresh(ids).reasons == {"forced": 2}
+
+        job = refresh_job(ids=ids)
+        assert (job.total, job.processed) == (2, 2)
+        assert forward.call_count == 2
+
+
+class TestRefreshRoutes:
+    """Test suite for the dry-run endpoint."""
+
+    def test_dry_run_changes_nothing(self, service, geocoded, forward):
+        """Test the dry run reports counts without geocoding or writing."""
+        from main import app
+
+        set_columns(geocoded[1].id, geocoded_at=None)
+        with TestClient(app) as client:
+            response = client.post("/addresses/refresh/dry-run", json={"ids": None})
+            forced = client.post(
+                "/addresses/refresh/dry-run", json={"ids": [geocoded[0].id], "force": True}
+            )
+
+        assert response.json() == {"total": 3, "stale": 1, "reasons": {"never_geocoded": 1}}
+        assert forced.json() == {"total": 1, "stale": 1, "reasons": {"forced": 1}}
+        assert forward.call_count == 0
+        assert stored(geocoded[1].id).version == geocoded[1].version
@@ -0,0 +1,182 @@
+"""Tests for the background refresh job engine."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.models import JobStatus
+
+
+SEEDED = [
+    ("Germany,Schirgiswalde,2681", "Untenende 2, 26817 Rhauderfehn, Germany"),
+    ("Katschberghöhe 38 , A-9863 RENNWEG AM KATSCHB. , AT", "Atalaia do Norte, Amazonas, Brazil"),
+    ("Nowhere 123", ""),
+]
+
+
+@pytest.fixture
+def seeded_addresses(temp_database):
+    """Insert addresses with stale match data."""
+    from infrastructure.repositories import AddressRepository
+
+    repository = AddressRepository()
+    return repository.create_many([(address, "stale", 0.0, None) for address, _ in SEEDED])
+
+
+@pytest.fixture
+def engine(temp_database, stubbed_mapbox):
+    """Job engine with its own in-process queue."""
+    from application.jobs import JobEngine, REFRESH_JOB
+    from application.jobs.handlers import refresh_handler
+    from infrastructure.queue import InProcessQueue
+
+    engine = JobEngine(queue=InProcessQueue(workers=1))
+    engine.register(REFRESH_JOB, refresh_handler)
+    yield engine
+    engine.shutdown()
+
+
+class TestRefreshJob:
+    """Test suite for chunked, resumable refresh jobs."""
+
+    def test_refresh_job_updates_all_rows(self, engine, seeded_addresses):
+        """Test that a refresh job geocodes every row and reports progress."""
+        from infrastructure.repositories import AddressRepository
+
+        job = engine.submit("refresh", {"ids": None, "chunk_size": 2})
+        job = engine.wait(job.id, timeout=10)
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.total == 3
+        assert job.processed == 3
+        assert job.checkpoint == seeded_addresses[-1].id
+        assert job.progress == 1.0
+
+        refreshed = AddressRepository().iter_all(columns=["matched_address"])
+        assert [a.matched_address for a in refreshed] == [m for _, m in SEEDED]
+
+    def test_refresh_job_selected_ids(self, engine, seeded_addresses):
+        """Test that only the selected ids are refreshed."""
+        from infrastructure.repositories import AddressRepository
+
+        job = engine.submit("refresh", {"ids": [seeded_addresses[1].id]})
+        job = engine.wait(job.id, timeout=10)
+
+        assert job.processed == 1
+        matched = [a.matched_address for a in AddressRepository().iter_all()]
+        assert matched == ["stale", SEEDED[1][1], "stale"]
+
+    def test_failed_job_resumes_from_checkpoint(self, engine, seeded_addresses, mocker):
+        """Test that a failure keeps committed chunks and resume finishes the rest."""
+        from application.services.address_service import AddressService
+
+        original = AddressService.refresh_chunk
+        calls = []
+
+        def flaky(self, after_id, limit, ids=None, force=False, methods=()):
+            calls.append(after_id)
+            if len(calls) == 2:
+                raise RuntimeError("upstream outage")
+            return original(self, after_id, limit, ids, force=force, methods=methods)
+
+        mocker.patch.object(AddressService, "refresh_chunk", flaky)
+
+        job = engine.submit("refresh", {"ids": None, "chunk_size": 1})
+        job = engine.wait(job.id, timeout=10)
+        assert job.status == JobStatus.FAILED
+        assert job.processed == 1
+        assert job.checkpoint == seeded_addresses[0].id
+
+        engine.resume(job.id)
+        job = engine.wait(job.id, timeout=10)
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.processed == 3
+        assert calls[2] == seeded_addresses[0].id
+
+    def test_cancel_stops_after_current_chunk(self, engine, seeded_addresses, mocker):
+        """Test that cancellation is honoured at the next checkpoint."""
+        from application.services.address_service import AddressService
+
+        original = AddressService.refresh_chunk
+        holder = {}
+
+        def cancel_during_first_chunk(self, after_id, limit, ids=None, force=False, methods=()):
+            result = original(self, after_id, limit, ids, force=force, methods=methods)
+            engine.cancel(holder["job_id"])
+            return result
+
+        mocker.patch.object(AddressService, "refresh_chunk", cancel_during_first_chunk)
+
+        engine._ensure_started()
+        job = engine._repository.create("refresh", {"ids": None, "chunk_size": 1})
+        holder["job_id"] = job.id
+        engine.run(job.id)
+
+        job = engine.get(job.id)
+        assert job.status == JobStatus.CANCELLED
+        assert job.processed == 1
+
+    def test_job_delivered_twice_runs_once(self, engine, seeded_addresses, mocker):
+        """Test that only the first worker to claim a job runs its handler."""
+        handler = mocker.Mock()
+        engine.register("refresh", handler)
+        job = engine._repository.create("refresh", {"ids": None})
+
+        engine.run(job.id)
+        engine.run(job.id)
+
+        assert handler.call_count == 1
+        assert engine.get(job.id).status == JobStatus.SUCCEEDED
+
+    def test_resume_leaves_queued_and_live_jobs(self, engine, seeded_addresses, mocker):
+        """Test that resume only re-queues stopped jobs and running ones without a heartbeat."""
+        from config import settings
+
+        enqueue = mocker.patch.object(engine, "_ensure_started")
+        repository = engine._repository
+
+        queued = repository.create("refresh", {"ids": None})
+        assert engine.resume(queued.id).status == JobStatus.QUEUED
+
+        running = repository.create("refresh", {"ids": None})
+        repository.claim(running.id)
+        assert engine.resume(running.id).status == JobStatus.RUNNING
+        enqueue.assert_not_called()
+
+        mocker.patch.object(settings, "job_stale_after", 0)
+        assert engine.resume(running.id).status == JobStatus.QUEUED
+        enqueue.return_value.enqueue.assert_called_once_with(running.id)
+
+
+class TestJobRoutes:
+    """Test suite for the job HTTP API."""
+
+    @pytest.fixture
+    def client(self, engine, monkeypatch):
+        import api.routes.addresses as addresses_routes
+        import api.routes.jobs as jobs_routes
+        from main import app
+
+        monkeypatch.setattr(addresses_routes, "job_engine", engine)
+        monkeypatch.setattr(jobs_routes, "job_engine", engine)
+        return TestClient(app)
+
+    def test_refresh_returns_job_and_streams_progress(self, client, seeded_addresses):
+        """Test that refresh returns 202 with a job and SSE reports completion."""
+        response = client.post("/addresses/refresh", json={"ids": None})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        with client.stream("GET", f"/jobs/{job_id}/events") as events:
+            lines = [line for line in events.iter_lines() if line.startswith("data: ")]
+
+        final = json.loads(lines[-1][len("data: "):])
+        assert final["status"] == "succeeded"
+        assert final["processed"] == 3
+        assert client.get(f"/jobs/{job_id}").json()["progress"] == 1.0
+
+    def test_unknown_job_returns_404(self, client):
+        """Test that unknown job ids return 404."""
+        assert client.get("/jobs/missing").status_code == 404
+        assert client.post("/jobs/missing/cancel").status_code == 404
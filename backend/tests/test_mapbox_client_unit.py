@@ -1,5 +1,7 @@
 """Unit tests for Mapbox Geocoding API client with mocked responses."""
 
+import json
+
 import pytest
 import requests
 
@@ -21,6 +23,7 @@ class TestMapboxClientUnit:
         """Test handling of empty API response."""
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"features": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status = mocker.Mock()
         mocker.patch("infrastructure.clients.mapbox.client.requests.get", return_value=mock_response)
 
@@ -41,6 +44,7 @@ class TestMapboxClientUnit:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status = mocker.Mock()
         mocker.patch("infrastructure.clients.mapbox.client.requests.get", return_value=mock_response)
 
@@ -60,8 +64,75 @@ class TestMapboxClientUnit:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_response.raise_for_status = mocker.Mock()
         mocker.patch("infrastructure.clients.mapbox.client.requests.get", return_value=mock_response)
 
         result = mapbox_client.geocode_best_match("Test Address")
-        assert result == "Test Location, Test City, Country"
\ No newline at end of file
+        assert result == "Test Location, Test City, Country"
+
+    def test_geocode_candidates_keeps_relevance_order(self, mapbox_client, mocker):
+        """Test that all distinct candidates are returned in Mapbox order."""
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            "features": [
+                {"properties": {"full_address": "Paris, France"}},
+                {"properties": {"name": "Paris", "place_formatted": "Texas, United States"}},
+                {"properties": {"full_address": "Paris, France"}},
+                {"properties": {}},
+            ]
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_response.raise_for_status = mocker.Mock()
+        mock_get = mocker.patch(
+            "infrastructure.clients.mapbox.client.requests.get", return_value=mock_response
+        )
+
+        result = mapbox_client.geocode_candidates("Paris", limit=5)
+        assert result == ["Paris, France", "Paris, Texas, United States"]
+        assert mock_get.call_args.kwargs["params"]["limit"] == 5
+
+    def test_geocode_candidates_api_error(self, mapbox_client, mocker):
+        """Test that API errors yield no candidates."""
+        mocker.patch(
+            "infrastructure.clients.mapbox.client.requests.get",
+            side_effect=requests.RequestException("Network error"),
+        )
+
+        assert mapbox_client.geocode_candidates("Test Address") == []
+
+    @pytest.mark.parametrize("debug_decoding", [False, True])
+    def test_decode_modes_agree(self, mocker, debug_decoding):
+        """Test that the lean decoder and pydantic debug mode return the same result."""
+        from infrastructure.clients import MapboxClient
+
+        mock_response = mocker.Mock()
+        mock_response.content = json.dumps({
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [2.35, 48.85]},
+                    "properties": {"name": "Paris", "place_formatted": "France", "context": {}},
+                },
+                {"properties": {"full_address": "Paris, Texas, United States"}},
+            ],
+        }).encode()
+        mock_response.raise_for_status = mocker.Mock()
+        mocker.patch("infrastructure.clients.mapbox.client.requests.get", return_value=mock_response)
+
+        client = MapboxClient(token="test", debug_decoding=debug_decoding)
+        assert client.geocode_best_match("Paris") == "Paris, France"
+        assert client.geocode_candidates("Paris") == ["Paris, France", "Paris, Texas, United States"]
+
+    @pytest.mark.parametrize("content", [b"not json", b'{"features": {}}', b'{"features": [{}]}'])
+    def test_geocode_malformed_response(self, mapbox_client, mocker, content):
+        """Test that malformed payloads are handled gracefully and count as failed lookups."""
+        mock_response = mocker.Mock()
+        mock_response.content = content
+        mock_response.raise_for_status = mocker.Mock()
+        mocker.patch("infrastructure.clients.mapbox.client.requests.get", return_value=mock_response)
+
+        assert mapbox_client.geocode_best_match("Test Address") is None
+        assert mapbox_client.geocode_candidates("Test Address") == []
+        assert mapbox_client.lookup_candidates("Test Address") is None
@@ -0,0 +1,149 @@
+"""Micro-benchmark of Mapbox response decoding on recorded payloads."""
+
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.clients.mapbox import (
+    MapboxBatchResponse,
+    MapboxResponse,
+    decode_batch,
+    decode_candidates,
+)
+from tests.fakes import MapboxCorpus
+from tests.fakes.mapbox_server import ATTRIBUTION
+
+
+CANDIDATES_PER_QUERY = 5
+
+
+@dataclass
+class DecodeResult:
+    """Result of benchmarking one decoder on one payload kind."""
+    decoder: str
+    payload_kind: str
+    total_time_ms: float
+    avg_time_us: float
+    peak_alloc_kb: float
+    iterations: int
+
+
+def load_payloads() -> tuple[List[bytes], bytes]:
+    """Build forward and batch payloads from the recorded corpus."""
+    corpus = MapboxCorpus.from_addresses_csv()
+    features = [feature for _, entry in corpus.items() for feature in entry]
+
+    collections = []
+    for i in range(len(features)):
+        window = [features[(i + k) % len(features)] for k in range(CANDIDATES_PER_QUERY)]
+        collections.append(
+            {"type": "FeatureCollection", "features": window, "attribution": ATTRIBUTION}
+        )
+
+    forward = [json.dumps(c).encode("utf-8") for c in collections]
+    batch = json.dumps({"batch": collections}).encode("utf-8")
+    return forward, batch
+
+
+def pydantic_forward(payload: bytes) -> List[str]:
+    return MapboxResponse.model_validate(json.loads(payload)).get_candidates()
+
+
+def pydantic_batch(payload: bytes) -> List[List[str]]:
+    return MapboxBatchResponse.model_validate(json.loads(payload)).get_candidates()
+
+
+def measure(decoder: str, kind: str, fn: Callable, payloads: List[bytes]) -> DecodeResult:
+    """Time all payloads, then measure peak allocation for a single pass."""
+    start = time.perf_counter()
+    for payload in payloads:
+        fn(payload)
+    total_ms = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    fn(payloads[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return DecodeResult(
+        decoder=decoder,
+        payload_kind=kind,
+        total_time_ms=total_ms,
+        avg_time_us=total_ms * 1000 / len(payloads),
+        peak_alloc_kb=peak / 1024,
+        iterations=len(payloads),
+    )
+
+
+def run_benchmark(forward: List[bytes], batch: bytes, batch_repeat: int = 10) -> List[DecodeResult]:
+    """Benchmark the pydantic and lean decoders."""
+    batches = [batch] * batch_repeat
+    return [
+        measure("pydantic", "forward", pydantic_forward, forward),
+        measure("lean", "forward", decode_candidates, forward),
+        measure("pydantic", "batch", pydantic_batch, batches),
+        measure("lean", "batch", decode_batch, batches),
+    ]
+
+
+def print_results_table(results: List[DecodeResult]) -> None:
+    """Print benchmark results as a formatted table."""
+    print("\n" + "=" * 80)
+    print("MAPBOX DECODE BENCHMARK RESULTS")
+    print("=" * 80)
+    print(f"\n{'Decoder':<12} {'Payload':<10} {'Total(ms)':>12} {'Avg(us)':>12} {'Peak(KB)':>12} {'N':>8}")
+    print("-" * 80)
+
+    for r in results:
+        print(
+            f"{r.decoder:<12} "
+            f"{r.payload_kind:<10} "
+            f"{r.total_time_ms:>12.2f} "
+            f"{r.avg_time_us:>12.1f} "
+            f"{r.peak_alloc_kb:>12.1f} "
+            f"{r.iterations:>8}"
+        )
+
+    print("=" * 80 + "\n")
+
+
+class TestMapboxDecodeBenchmark:
+    """Benchmark test suite for Mapbox response decoding."""
+
+    @pytest.fixture(scope="class")
+    def payloads(self) -> tuple[List[bytes], bytes]:
+        return load_payloads()
+
+    def test_decoders_agree_on_forward(self, payloads):
+        """Verify the lean decoder matches pydantic on every recorded payload."""
+        forward, _ = payloads
+        for payload in forward:
+            assert decode_candidates(payload) == pydantic_forward(payload)
+
+    def test_decoders_agree_on_batch(self, payloads):
+        """Verify the lean decoder matches pydantic on the batch payload."""
+        _, batch = payloads
+        assert decode_batch(batch) == pydantic_batch(batch)
+
+    def test_print_benchmark_results(self, payloads):
+        """Print benchmark results (always passes, just for output)."""
+        forward, batch = payloads
+        print_results_table(run_benchmark(forward, batch, batch_repeat=2))
+
+
+# Allow running as standalone script
+if __name__ == "__main__":
+    forward_payloads, batch_payload = load_payloads()
+    print(
+        f"Loaded {len(forward_payloads)} forward payloads, "
+        f"batch payload of {len(batch_payload) / 1024:.0f} KB"
+    )
+    print_results_table(run_benchmark(forward_payloads, batch_payload))
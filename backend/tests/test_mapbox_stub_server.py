@@ -0,0 +1,65 @@
+"""Tests for the record/replay Mapbox stub server."""
+
+import requests
+
+from infrastructure.clients import MapboxClient
+from tests.fakes import FaultConfig, MapboxCorpus, MapboxStubServer, create_app
+from tests.fakes.mapbox_server import make_feature
+
+
+class TestMapboxStubServer:
+    """Test suite for serving the real client from the stub."""
+
+    def test_client_replays_seeded_corpus(self, mapbox_stub):
+        """Test that MapboxClient resolves CSV addresses through base_url."""
+        client = MapboxClient(token="test", base_url=mapbox_stub.forward_url)
+        result = client.geocode_best_match("Germany,Schirgiswalde,2681")
+        assert result == "Untenende 2, 26817 Rhauderfehn, Germany"
+
+    def test_unknown_query_returns_no_features(self, mapbox_stub):
+        """Test that queries outside the corpus return an empty collection."""
+        client = MapboxClient(token="test", base_url=mapbox_stub.forward_url)
+        assert client.geocode_candidates("Nonexistent Place XYZ123") == []
+
+    def test_batch_endpoint(self, mapbox_stub):
+        """Test the v6 batch schema."""
+        response = requests.post(
+            mapbox_stub.batch_url,
+            params={"access_token": "test"},
+            json=[{"q": "Germany,Schirgiswalde,2681"}, {"q": "Nowhere 123"}],
+            timeout=10,
+        )
+        response.raise_for_status()
+        batch = response.json()["batch"]
+        assert len(batch) == 2
+        assert batch[0]["features"][0]["properties"]["full_address"] == (
+            "Untenende 2, 26817 Rhauderfehn, Germany"
+        )
+        assert batch[1]["features"] == []
+
+    def test_rate_limit_injection(self):
+        """Test that injected 429s carry Retry-After and the client degrades to None."""
+        corpus = MapboxCorpus({"paris": [make_feature("Paris, France")]})
+        app = create_app(corpus, FaultConfig(rate_limit_rate=1.0, retry_after_seconds=3))
+
+        with MapboxStubServer(app) as server:
+            response = requests.get(server.forward_url, params={"q": "paris"}, timeout=10)
+            assert response.status_code == 429
+            assert response.headers["Retry-After"] == "3"
+
+            client = MapboxClient(token="test", base_url=server.forward_url)
+            assert client.geocode_best_match("paris") is None
+            assert requests.get(f"{server.base_url}/__stats", timeout=10).json()["injected"] == {
+                "429": 2
+            }
+
+    def test_fault_config_is_deterministic(self):
+        """Test that the same seed yields the same latency and fault sequence."""
+        def draw():
+            faults = FaultConfig(
+                latency_ms=50, latency_jitter_ms=20,
+                latency_distribution="lognormal", error_rate=0.3, seed=42,
+            )
+            return [(faults.sample_latency(), faults.sample_fault()) for _ in range(20)]
+
+        assert draw() == draw()
@@ -0,0 +1,164 @@
+"""Tests for the bounded in-memory cache and cache statistics."""
+
+import threading
+
+import pytest
+
+from infrastructure.cache import client as cache_module
+from infrastructure.cache.client import InMemoryCache, entry_size
+
+
+class FakeClock:
+    """Stands in for the `time` module with a settable monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+class TestInMemoryCache:
+    """Test suite for InMemoryCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry read longest ago is evicted past max_entries."""
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", "1", 60)
+        cache.set("b", "2", 60)
+        cache.get("a")
+        cache.set("c", "3", 60)
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": "1", "c": "3"}
+        assert cache.stats().evictions == 1
+
+    def test_stays_within_max_bytes(self):
+        """Test memory accounting evicts to stay within the byte budget."""
+        value = "x" * 1000
+        budget = 10 * entry_size("key-00", value)
+        cache = InMemoryCache(max_bytes=budget)
+        for i in range(100):
+            cache.set(f"key-{i:02}", value, 60)
+
+        stats = cache.stats()
+        assert (stats.entries, stats.evictions) == (10, 90)
+        assert stats.bytes <= budget
+        assert cache.get("key-99") == value
+
+    def test_oversized_value_is_not_stored(self):
+        """Test a value larger than the whole budget is skipped, not stored."""
+        cache = InMemoryCache(max_bytes=1024)
+        cache.set("small", "1", 60)
+        cache.set("large", "x" * 2048, 60)
+
+        assert cache.get("large") is None
+        assert cache.get("small") == "1"
+
+    def test_expired_entries_are_dropped_without_reads(self, clock):
+        """Test expired entries are freed by any later operation, not only a read of their key."""
+        cache = InMemoryCache()
+        cache.set_many({f"old-{i}": "v" for i in range(50)}, 10)
+        clock.now += 11
+        cache.set("new", "v", 10)
+
+        stats = cache.stats()
+        assert (stats.entries, stats.expirations) == (1, 50)
+        assert stats.bytes == entry_size("new", "v")
+
+    def test_overwrite_resets_ttl(self, clock):
+        """Test an overwritten key keeps its new TTL, not the stale heap item."""
+        cache = InMemoryCache()
+        cache.set("key", "old", 10)
+        clock.now += 5
+        cache.set("key", "new", 10)
+        clock.now += 6
+
+        assert cache.get("key") == "new"
+        clock.now += 5
+        assert cache.get("key") is None
+
+    def test_expiry_heap_is_compacted(self):
+        """Test repeated overwrites do not grow the expiry heap without bound."""
+        cache = InMemoryCache()
+        for i in range(10_000):
+            cache.set("key", str(i), 60)
+        assert len(cache._expiry) < 100
+
+    def test_hit_and_miss_counters(self):
+        """Test reads are counted as hits or misses."""
+        cache = InMemoryCache()
+        cache.set("a", "1", 60)
+        cache.get("a")
+        cache.get_many(["a", "b"])
+        cache.delete("a")
+        cache.get("a")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (2, 2, 0, 0)
+
+    def test_concurrent_access(self):
+        """Test threads writing and reading at once keep the accounting consistent."""
+        cache = InMemoryCache(max_entries=100)
+
+        def work(worker: int):
+            for i in range(2000):
+                cache.set(f"{worker}-{i % 300}", "v" * (i % 50), 60)
+                cache.get(f"{worker}-{(i * 7) % 300}")
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats.entries == 100
+        assert stats.bytes == sum(size for _, _, size in cache._store.values())
+
+
+class TestCacheClientStats:
+    """Test suite for CacheClient.stats and the cache metrics."""
+
+    def test_memory_stats_in_metrics(self, memory_cache):
+        """Test /metrics exports the in-memory cache counters."""
+        from fastapi.testclient import TestClient
+
+        from main import app
+
+        memory_cache.set("a", "1")
+        memory_cache.get("a")
+        memory_cache.get("b")
+        metrics = TestClient(app).get("/metrics").text
+
+        assert 'cache_hits_total{tier="l1",backend="memory"} 1' in metrics
+        assert 'cache_misses_total{tier="l1",backend="memory"} 1' in metrics
+        assert 'cache_entries{tier="l1",backend="memory"} 1' in metrics
+        assert 'cache_hit_ratio{tier="l1",backend="memory"} 0.5' in metrics
+
+    def test_redis_stats(self, mocker, monkeypatch):
+        """Test Redis sizes are read from INFO and reads are counted per tier."""
+        from infrastructure.cache import CacheClient
+
+        redis = mocker.Mock()
+        redis.info.return_value = {"evicted_keys": 1, "expired_keys": 3, "used_memory": 4096}
+        redis.dbsize.return_value = 7
+        redis.mget.return_value = [b"1", None]
+        client = CacheClient()
+        monkeypatch.setattr(client, "_redis", redis)
+        monkeypatch.setattr(client, "_memory_cache", InMemoryCache())
+
+        client.get_many(["a", "b"])
+        client.get("a")
+
+        tiers = client.stats()
+        assert (tiers["l1"].hits, tiers["l1"].misses) == (1, 2)
+        l2 = tiers["l2"]
+        assert (l2.backend, l2.hits, l2.misses, l2.hit_ratio, l2.entries) == ("redis", 1, 1, 0.5, 7)
+        assert (l2.evictions, l2.expirations, l2.bytes) == (1, 3, 4096)
@@ -0,0 +1,188 @@
+"""Tests for scoring several similarity methods in one pass and the score table."""
+
+import csv
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+from domain.similarity import SimilarityMethod, rank_candidates, rank_candidates_by_method
+
+
+KNOWN = "Germany,Schirgiswalde,2681"
+KNOWN_MATCH = "Untenende 2, 26817 Rhauderfehn, Germany"
+CANDIDATES = [
+    "Lyon, Auvergne-Rhône-Alpes, France",
+    "Paris, Île-de-France, France",
+    "Paris, Texas, United States",
+    "",
+]
+# Every method that scores locally; Gemini calls an LLM
+LOCAL_METHODS = [method for method in SimilarityMethod if method != SimilarityMethod.GEMINI]
+
+
+@pytest.fixture
+def client(stubbed_mapbox, api_client):
+    return api_client
+
+
+def create(client, address: str, methods=()) -> dict:
+    return client.post("/addresses", json={"address": address, "methods": list(methods)}).json()
+
+
+def scores(client, address_id: int) -> Dict[str, dict]:
+    response = client.get(f"/addresses/{address_id}/scores")
+    return {score["method"]: score for score in response.json()}
+
+
+def best_of(runs: int, works: Dict[str, Callable[[], object]]) -> Dict[str, float]:
+    """
+    Fastest of `runs` timings of each of `works`, in seconds.
+
+    Rounds time every work in turn, so a slow spell of the machine hits
+    all of them rather than skewing one.
+    """
+    best = dict.fromkeys(works, float("inf"))
+    for _ in range(runs):
+        for name, work in works.items():
+            started = time.perf_counter()
+            work()
+            best[name] = min(best[name], time.perf_counter() - started)
+    return best
+
+
+def print_results_table(single: Dict[str, float], one_pass: float) -> None:
+    """Print per-method timings next to one pass over all of them."""
+    print()
+    print(f"{'Scoring':<22} {'ms':>8}")
+    for method, seconds in single.items():
+        print(f"{method:<22} {seconds * 1000:>8.1f}")
+    print(f"{'sum of methods':<22} {sum(single.values()) * 1000:>8.1f}")
+    print(f"{'one pass, all methods':<22} {one_pass * 1000:>8.1f}")
+
+
+class TestOnePassScoring:
+    """Test suite for rank_candidates_by_method."""
+
+    def test_matches_single_method_ranking(self):
+        """Test each method ranks as it does on its own."""
+        ranked = rank_candidates_by_method("Paris, France", CANDIDATES, LOCAL_METHODS)
+
+        assert list(ranked) == LOCAL_METHODS
+        for method in LOCAL_METHODS:
+            assert ranked[method] == rank_candidates("Paris, France", CANDIDATES, method)
+
+    def test_strings_are_normalized_once(self, mocker):
+        """Test normalization is shared by all methods."""
+        from domain.similarity import prepared
+
+        normalize = mocker.spy(prepared, "normalize_text")
+        rank_candidates_by_method("Paris, France", CANDIDATES, LOCAL_METHODS)
+        assert normalize.call_count == 1 + len(CANDIDATES)
+
+    def test_empty_input(self):
+        """Test missing input yields an empty ranking per method."""
+        methods = [SimilarityMethod.BASELINE, SimilarityMethod.BASELINE]
+        assert rank_candidates_by_method("", CANDIDATES, methods) == {
+            SimilarityMethod.BASELINE: []
+        }
+
+
+class TestScoreTable:
+    """Test suite for storing per-method scores."""
+
+    def test_create_stores_configured_and_requested_methods(self, client):
+        """Test create scores the requested methods with the configured one."""
+        address = create(client, KNOWN, ["levenshtein", "token_based"])
+
+        stored = scores(client, address["id"])
+        assert set(stored) == {"jaro_winkler", "levenshtein", "token_based"}
+        assert stored["jaro_winkler"]["match_score"] == address["match_score"]
+        assert stored["levenshtein"]["matched_address"] == KNOWN_MATCH
+        assert stored["levenshtein"]["method_version"] == "1"
+
+    def test_create_without_methods_stores_nothing(self, client):
+        """Test the score table is only written when methods are requested."""
+        address = create(client, KNOWN)
+        assert scores(client, address["id"]) == {}
+
+    def test_scores_of_missing_address(self, client):
+        """Test scores of an unknown address are a 404 like the address itself."""
+        response = client.get("/addresses/424242/scores")
+        assert (response.status_code, response.json()["detail"]) == (404, "Address not found")
+
+    def test_update_replaces_scores(self, client):
+        """Test rescoring a method replaces its row and keeps the others."""
+        address = create(client, KNOWN, ["levenshtein", "token_based"])
+        client.post(
+            f"/addresses/{address['id']}",
+            json={"address": "Nowhere 123", "methods": ["levenshtein"]},
+        )
+
+        stored = scores(client, address["id"])
+        assert set(stored) == {"jaro_winkler", "levenshtein", "token_based"}
+        assert stored["levenshtein"]["matched_address"] == ""
+        assert stored["token_based"]["matched_address"] == KNOWN_MATCH
+
+    def test_refresh_scores_fresh_rows_without_lookup(self, client, refresh_job, mocker):
+        """Test a refresh with methods scores stored candidates and leaves rows as they are."""
+        from infrastructure.clients import MapboxClient
+        from infrastructure.repositories import AddressRepository
+
+        address = create(client, KNOWN)
+        forward = mocker.spy(MapboxClient, "_forward")
+        refresh_job(methods=["phonetic"])
+
+        assert forward.call_count == 0
+        assert list(scores(client, address["id"])) == ["jaro_winkler", "phonetic"]
+        assert AddressRepository().get_by_id(address["id"]).version == address["version"]
+
+    def test_routes(self, client):
+        """Test methods are accepted on create and scores are served per address."""
+        created = create(client, KNOWN, ["fuzzy"])
+        stored = client.get(f"/addresses/{created['id']}/scores").json()
+        rejected = client.post("/addresses", json={"address": KNOWN, "methods": ["nope"]})
+
+        assert [score["method"] for score in stored] == ["fuzzy", "jaro_winkler"]
+        assert stored[1]["match_score"] == created["match_score"]
+        assert rejected.status_code == 422
+
+
+class TestOnePassBenchmark:
+    """
+    Benchmark one pass over all methods against each method alone.
+
+    One pass costs about the sum of the methods: normalization and
+    features are shared, but the difflib matching that dominates the
+    baseline and token-based methods runs on different strings per method.
+    """
+
+    def test_print_one_pass_results(self):
+        """Print per-method timings next to one pass, which ranks as the methods do alone."""
+        data = Path(__file__).parent.parent.parent / "data" / "addresses.csv"
+        with open(data, newline="", encoding="utf-8-sig") as file:
+            rows = list(csv.DictReader(file))[:300]
+        matches = [row["matched_address"] for row in rows]
+        pairs = [(row["address"], matches[i:i + 5]) for i, row in enumerate(rows)]
+
+        timings = best_of(5, {
+            **{
+                method.value: lambda method=method: [
+                    rank_candidates(address, candidates, method) for address, candidates in pairs
+                ]
+                for method in LOCAL_METHODS
+            },
+            "one pass": lambda: [
+                rank_candidates_by_method(address, candidates, LOCAL_METHODS)
+                for address, candidates in pairs
+            ],
+        })
+        one_pass = timings.pop("one pass")
+        print_results_table(timings, one_pass)
+
+        address, candidates = pairs[0]
+        ranked = rank_candidates_by_method(address, candidates, LOCAL_METHODS)
+        assert ranked == {
+            method: rank_candidates(address, candidates, method) for method in LOCAL_METHODS
+        }
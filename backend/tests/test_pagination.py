@@ -0,0 +1,152 @@
+"""Tests for keyset pagination and the cached pages and total count of GET /addresses."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def client(temp_database, memory_cache):
+    from infrastructure.repositories import AddressRepository
+    from main import app
+
+    AddressRepository().create_many([(f"Address {i}", None, 0.0, None) for i in range(1, 8)])
+    return TestClient(app)
+
+
+def ids(page: dict) -> list:
+    return [item["id"] for item in page["items"]]
+
+
+class TestCursors:
+    """Test suite for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes back to its id."""
+        from application.services import decode_cursor, encode_cursor
+
+        assert decode_cursor(encode_cursor(12345)) == 12345
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJ4IjoxfQ", "eyJpZCI6ImEifQ"])
+    def test_invalid(self, token):
+        """Test malformed or foreign tokens raise InvalidCursor."""
+        from application.services import InvalidCursor, decode_cursor
+
+        with pytest.raises(InvalidCursor):
+            decode_cursor(token)
+
+
+class TestKeysetPagination:
+    """Test suite for cursor pages of GET /addresses."""
+
+    def test_offset_page_has_cursors(self, client):
+        """Test offset pages keep their shape and also hand out cursors."""
+        page = client.get("/addresses?page=2&per_page=3").json()
+        assert ids(page) == [4, 3, 2]
+        assert (page["total"], page["page"], page["pages"]) == (7, 2, 3)
+        assert page["next_cursor"] and page["prev_cursor"]
+
+    def test_walk_forward_and_back(self, client):
+        """Test following next then prev cursors visits the same pages."""
+        first = client.get("/addresses?per_page=3").json()
+        assert ids(first) == [7, 6, 5]
+        assert first["prev_cursor"] is None
+
+        second = client.get(f"/addresses?per_page=3&after={first['next_cursor']}").json()
+        assert ids(second) == [4, 3, 2]
+        assert second["page"] is None
+
+        last = client.get(f"/addresses?per_page=3&after={second['next_cursor']}").json()
+        assert ids(last) == [1]
+        assert last["next_cursor"] is None
+
+        back = client.get(f"/addresses?per_page=3&before={last['prev_cursor']}").json()
+        assert ids(back) == [4, 3, 2]
+        back = client.get(f"/addresses?per_page=3&before={back['prev_cursor']}").json()
+        assert ids(back) == [7, 6, 5]
+        assert back["prev_cursor"] is None
+
+    def test_invalid_cursor_is_400(self, client):
+        """Test a malformed cursor is a client error."""
+        assert client.get("/addresses?after=garbage").status_code == 400
+        assert client.get("/addresses?after=eyJpZCI6MX0&before=eyJpZCI6MX0").status_code == 400
+
+    def test_without_total(self, client, mocker):
+        """Test with_total=false skips the count entirely."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        count = mocker.spy(AsyncAddressRepository, "count")
+        page = client.get("/addresses?with_total=false").json()
+        assert page["total"] is None and page["pages"] is None
+        count.assert_not_called()
+
+
+class TestCachedTotal:
+    """Test suite for the cached total count."""
+
+    def test_total_is_cached(self, client, mocker):
+        """Test repeated pages count the table only once."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        count = mocker.spy(AsyncAddressRepository, "count")
+        client.get("/addresses")
+        client.get("/addresses?page=2")
+        assert count.call_count == 1
+
+    def test_insert_invalidates_total(self, client):
+        """Test creating addresses refreshes the total."""
+        from application.services import AddressService
+
+        assert client.get("/addresses").json()["total"] == 7
+        AddressService().create_scored([("Address 8", None, 0.0, None)])
+        assert client.get("/addresses").json()["total"] == 8
+
+
+class TestCachedPages:
+    """Test suite for list pages cached under the table revision."""
+
+    def test_repeated_page_is_served_from_cache(self, client, mocker):
+        """Test the same page is queried once until a write."""
+        from infrastructure.repositories import AsyncAddressRepository
+
+        get_page = mocker.spy(AsyncAddressRepository, "get_page")
+        get_page_by_keyset = mocker.spy(AsyncAddressRepository, "get_page_by_keyset")
+        first = client.get("/addresses").json()
+        cursor = first["next_cursor"]
+
+        assert client.get("/addresses").json() == first
+        client.get(f"/addresses?after={cursor}")
+        client.get(f"/addresses?after={cursor}")
+        client.get("/addresses?per_page=3")
+        assert get_page.call_count == 2
+        assert get_page_by_keyset.call_count == 1
+
+    def test_writes_invalidate_pages(self, client, stubbed_mapbox, monkeypatch):
+        """Test create, update and refresh each make the next read see the change."""
+        import api.routes.addresses as addresses_routes
+        from application.services import AddressService, AsyncAddressService
+
+        monkeypatch.setattr(addresses_routes, "async_address_service", AsyncAddressService())
+        assert client.get("/addresses").json()["items"][0]["address"] == "Address 7"
+
+        AddressService().create_scored([("Address 8", None, 0.0, None)])
+        page = client.get("/addresses").json()
+        assert (page["items"][0]["address"], page["total"]) == ("Address 8", 8)
+
+        client.post("/addresses/8", json={"address": "Nowhere 8"})
+        assert client.get("/addresses").json()["items"][0]["address"] == "Nowhere 8"
+
+        AddressService().refresh_chunk(None, 10)  # Re-geocodes the never-matched rows
+        assert client.get("/addresses").json()["items"][1]["version"] == 2
+
+    def test_invalidation_touches_no_page_keys(self, client, memory_cache, mocker):
+        """Test a bump orphans cached pages instead of deleting them one by one."""
+        from application.services import bump_revision
+
+        client.get("/addresses")
+        client.get("/addresses?page=2")
+        entries = memory_cache.stats()["l1"].entries
+        delete = mocker.spy(memory_cache, "delete")
+
+        bump_revision()
+        assert delete.call_count == 0
+        assert memory_cache.stats()["l1"].entries == entries
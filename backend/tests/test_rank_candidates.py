@@ -0,0 +1,54 @@
+"""Tests for batched candidate scoring and re-ranking."""
+
+import pytest
+
+from domain.similarity import SimilarityMethod, get_similarity_method, rank_candidates
+
+
+CANDIDATES = [
+    "Lyon, Auvergne-Rhône-Alpes, France",
+    "Paris, Île-de-France, France",
+    "Paris, Texas, United States",
+    "",
+]
+
+
+class TestRankCandidates:
+    """Test suite for rank_candidates and calculate_many."""
+
+    @pytest.mark.parametrize("method", [
+        SimilarityMethod.JARO_WINKLER,
+        SimilarityMethod.FUZZY,
+        SimilarityMethod.TOKEN_BASED,
+    ])
+    def test_calculate_many_matches_calculate(self, method):
+        """Test that batched scores equal pairwise scores."""
+        instance = get_similarity_method(method)
+        batched = instance.calculate_many("Paris, France", CANDIDATES)
+        pairwise = [instance.calculate("Paris, France", c) for c in CANDIDATES]
+        assert batched == pytest.approx(pairwise)
+
+    def test_score_cutoff_zeroes_low_scores(self):
+        """Test that candidates below the cutoff score 0.0."""
+        instance = get_similarity_method(SimilarityMethod.JARO_WINKLER)
+        scores = instance.calculate_many("Paris, France", CANDIDATES, score_cutoff=0.8)
+        assert all(score == 0.0 or score >= 0.8 for score in scores)
+        assert scores[-1] == 0.0
+
+    def test_rank_candidates_best_first(self):
+        """Test that the closest candidate is ranked first."""
+        ranked = rank_candidates("Paris, France", CANDIDATES)
+        assert ranked[0][0] == "Paris, Île-de-France, France"
+        assert [score for _, score in ranked] == sorted(
+            (score for _, score in ranked), reverse=True
+        )
+
+    def test_rank_candidates_ties_keep_provider_order(self):
+        """Test that tied scores keep the incoming relevance order."""
+        ranked = rank_candidates("Paris", ["Berlin", "Madrid"], score_cutoff=1.0)
+        assert ranked == [("Berlin", 0.0), ("Madrid", 0.0)]
+
+    def test_rank_candidates_empty(self):
+        """Test that missing input yields no ranking."""
+        assert rank_candidates("", CANDIDATES) == []
+        assert rank_candidates("Paris", []) == []
@@ -0,0 +1,123 @@
+"""Tests for score provenance and rescore jobs from stored candidates."""
+
+import pytest
+
+from domain.models import JobStatus
+from domain.similarity import SimilarityMethod
+
+
+ADDRESS = "Untenende 2, 26817 Rhauderfehn"
+CANDIDATES = [
+    {"address": "Atalaia do Norte, Amazonas, Brazil", "score": 0.0},
+    {"address": "Untenende 2, 26817 Rhauderfehn, Germany", "score": 0.0},
+]
+
+
+@pytest.fixture
+def engine(temp_database, memory_cache, monkeypatch):
+    """Job engine with its own in-process queue and a two-process scoring pool."""
+    from application.jobs import JobEngine, RESCORE_JOB
+    from application.jobs.handlers import rescore_handler
+    from config import settings
+    from infrastructure.queue import InProcessQueue
+
+    monkeypatch.setattr(settings, "rescore_workers", 2)
+    engine = JobEngine(queue=InProcessQueue(workers=1))
+    engine.register(RESCORE_JOB, rescore_handler)
+    yield engine
+    engine.shutdown()
+
+
+@pytest.fixture
+def unscored(temp_database):
+    """Rows with stored candidates but no score provenance, one never geocoded, one unmatched."""
+    from infrastructure.repositories import AddressRepository
+
+    repository = AddressRepository()
+    rows = repository.create_many([(ADDRESS, "stale", 0.0, CANDIDATES)] * 3)
+    [never_geocoded] = repository.create_many([("Nowhere 123", None, 0.0, None)])
+    repository.create_many([("Nowhere 456", "", 0.0, [])])
+    return rows, never_geocoded
+
+
+class TestProvenance:
+    """Test suite for recording which method produced a score."""
+
+    def test_create_records_configured_method(self, stubbed_mapbox, api_client, monkeypatch):
+        """Test new scores carry the configured method and its version."""
+        from config import settings
+
+        monkeypatch.setattr(settings, "default_similarity_method", "levenshtein")
+        address = api_client.post(
+            "/addresses", json={"address": "Germany,Schirgiswalde,2681"}
+        ).json()
+        assert (address["score_method"], address["score_version"]) == ("levenshtein", "1")
+
+    def test_method_version_from_class(self, monkeypatch):
+        """Test bumping a method's version changes the recorded provenance."""
+        from application.services.address_service import scoring_provenance
+        from domain.similarity import JaroWinklerSimilarity
+
+        monkeypatch.setattr(JaroWinklerSimilarity, "version", "2")
+        provenance = scoring_provenance(SimilarityMethod.JARO_WINKLER)
+        assert (provenance.score_method, provenance.score_version) == ("jaro_winkler", "2")
+
+
+class TestRescoreJob:
+    """Test suite for rescoring from stored candidates."""
+
+    def test_rescores_without_geocoding(self, engine, unscored, mocker):
+        """Test scores are recomputed from stored candidates with no API calls."""
+        from infrastructure.clients import MapboxClient
+        from infrastructure.repositories import AddressRepository
+
+        geocode = mocker.spy(MapboxClient, "_forward")
+        job = engine.submit("rescore", {"method": "levenshtein", "chunk_size": 2})
+        job = engine.wait(job.id, timeout=30)
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert (job.total, job.processed) == (3, 3)
+        assert geocode.call_count == 0
+
+        rows, never_geocoded = unscored
+        for address in AddressRepository().get_by_ids([row.id for row in rows]):
+            assert address.matched_address == CANDIDATES[1]["address"]
+            assert address.match_score > 0.5
+            assert [c.address for c in address.candidates] == [c["address"] for c in CANDIDATES]
+            assert (address.score_method, address.score_version) == ("levenshtein", "1")
+        assert AddressRepository().get_by_id(never_geocoded.id).matched_address is None
+
+    def test_skips_matching_provenance(self, engine, unscored, mocker):
+        """Test a second run to the same method touches nothing, another method everything."""
+        from application.services import AddressService
+
+        first = engine.wait(engine.submit("rescore", {"method": "levenshtein"}).id, timeout=30)
+        assert first.processed == 3
+
+        rescore_chunk = mocker.spy(AddressService, "rescore_chunk")
+        again = engine.wait(engine.submit("rescore", {"method": "levenshtein"}).id, timeout=30)
+        assert (again.total, again.processed) == (0, 0)
+        assert rescore_chunk.call_count == 1
+
+        switched = engine.wait(engine.submit("rescore", {"method": "jaro_winkler"}).id, timeout=30)
+        assert switched.processed == 3
+
+    def test_skips_rows_without_candidates(self, engine, unscored):
+        """Test rows whose lookup found no candidates are not counted or rescored."""
+        from application.services import AddressService
+
+        service = AddressService()
+        assert service.count_to_rescore(SimilarityMethod.LEVENSHTEIN) == 3
+
+        job = engine.wait(engine.submit("rescore", {"method": "levenshtein"}).id, timeout=30)
+        assert (job.total, job.processed) == (3, 3)
+
+    def test_invalidates_cached_rows(self, engine, unscored, api_client):
+        """Test rescored rows are not served stale from the cache."""
+        row_id = unscored[0][0].id
+        assert api_client.get(f"/addresses/{row_id}").json()["matched_address"] == "stale"
+
+        engine.wait(engine.submit("rescore", {"method": "levenshtein"}).id, timeout=30)
+        assert api_client.get(f"/addresses/{row_id}").json()["matched_address"] == (
+            CANDIDATES[1]["address"]
+        )
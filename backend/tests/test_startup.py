@@ -0,0 +1,148 @@
+"""Tests for lazy startup: import cost, migrations off boot, and GET /ready."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Imported before timing: their cost is outside the app's control
+FRAMEWORKS = "import fastapi, fastapi.middleware.cors, sqlalchemy.orm, pydantic_settings"
+
+# Imported on first use only; none of them may load with the app
+HEAVY_MODULES = (
+    "aiohttp", "sqlalchemy.ext.asyncio", "redis", "google.genai", "rapidfuzz", "pyarrow",
+)
+
+IMPORT_SCRIPT = f"""
+import json, sys, time
+{FRAMEWORKS}
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def import_main(tmp_path: Path) -> dict:
+    """Import main in a fresh interpreter with unreachable dependencies."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'boot.db'}",
+        "REDIS_URL": "redis://127.0.0.1:9/0",
+        "MAPBOX_ACCESS_TOKEN": "test",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def wait_until_ready(client: TestClient, timeout: float = 30.0):
+    """Poll GET /ready until nothing is pending."""
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get("/ready")
+        statuses = {c["status"] for c in response.json()["components"]}
+        if "pending" not in statuses or time.monotonic() > deadline:
+            return response
+        time.sleep(0.05)
+
+
+class TestImport:
+    """Test suite for the cost of importing the app."""
+
+    def test_import_loads_no_heavy_modules(self, tmp_path):
+        """Test importing main leaves heavy dependencies unloaded and touches nothing."""
+        result = import_main(tmp_path)
+        print(f"\nimport main: {result['seconds'] * 1000:.0f} ms on top of the frameworks")
+
+        assert result["loaded"] == []
+        assert not (tmp_path / "boot.db").exists()
+
+    def test_listing_methods_does_not_initialize_gemini(self, mocker):
+        """Test creating the Gemini method defers client setup to its first call."""
+        from domain.similarity.methods.gemini import GeminiSimilarity
+
+        init_client = mocker.spy(GeminiSimilarity, "_init_client")
+        GeminiSimilarity()
+        assert init_client.call_count == 0
+
+
+class TestReadiness:
+    """Test suite for the readiness endpoints."""
+
+    @pytest.fixture
+    def app(self, monkeypatch):
+        from config import settings
+        from main import app
+
+        monkeypatch.setattr(settings, "mapbox_access_token", "test")
+        return app
+
+    def test_ready_after_warm_up(self, app, temp_database, memory_cache):
+        """Test /ready answers 503 while warming up and 200 once done."""
+        with TestClient(app) as client:
+            assert client.get("/health").json() == {"status": "ok"}
+            response = wait_until_ready(client)
+
+        assert response.status_code == 200
+        components = {c["name"]: c for c in response.json()["components"]}
+        assert set(components) == {"database", "cache", "geocoder", "scoring"}
+        assert components["cache"]["detail"] == "memory"
+        assert components["scoring"]["detail"] == "jaro_winkler"
+
+    def test_missing_schema_not_ready(self, app, tmp_path, memory_cache, monkeypatch):
+        """Test an unmigrated database is reported with the command to migrate it."""
+        import importlib
+
+        from infrastructure.database import Database
+
+        # The package re-exports the tracker under the module's name
+        module = importlib.import_module("application.services.readiness")
+        monkeypatch.setattr(module, "db", Database(f"sqlite:///{tmp_path / 'empty.db'}"))
+        with TestClient(app) as client:
+            response = wait_until_ready(client)
+
+        assert response.status_code == 503
+        database = next(c for c in response.json()["components"] if c["name"] == "database")
+        assert database["status"] == "failed"
+        assert "cli.py migrate" in database["detail"]
+
+    def test_failed_check_is_retried(self, monkeypatch):
+        """Test a failed component turns ready once its dependency recovers."""
+        import asyncio
+
+        from application.services import ReadinessTracker
+
+        token = {"value": ""}
+
+        def check():
+            if not token["value"]:
+                raise RuntimeError("not configured")
+
+        async def scenario():
+            tracker = ReadinessTracker({"geocoder": check})
+            tracker.start()
+            await tracker._task
+            assert not tracker.report().ready
+
+            token["value"] = "set"
+            tracker.retry_failed()
+            await tracker._task
+            return tracker.report()
+
+        report = asyncio.run(scenario())
+        assert report.ready
+        assert report.components[0].detail is None
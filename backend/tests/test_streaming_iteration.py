@@ -0,0 +1,121 @@
+"""Tests for streaming iteration over the addresses table by bulk jobs."""
+
+import tracemalloc
+from typing import List
+
+from sqlalchemy import event
+
+from infrastructure.repositories import AddressRepository
+
+
+def seed(count: int) -> List[int]:
+    """Ids of `count` new addresses, each with a candidate list."""
+    return [
+        address.id for address in AddressRepository().create_many([
+            (f"Street {i}, Paris", f"Street {i}, 75001 Paris, France", 0.5,
+             [{"address": f"Street {i}, 75001 Paris, France", "score": 0.5}])
+            for i in range(count)
+        ])
+    ]
+
+
+def count_selects(db) -> List[str]:
+    """Collect the SELECT statements run from now on."""
+    selects = []
+
+    @event.listens_for(db.engine, "before_cursor_execute")
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    return selects
+
+
+def peak_memory(rows) -> int:
+    """Peak bytes allocated while consuming `rows`."""
+    tracemalloc.start()
+    try:
+        for _ in rows:
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestIterAll:
+    """Test suite for AddressRepository.iter_all."""
+
+    def test_rows_in_id_order(self, temp_database):
+        """Test every row comes back once, in id order, as a tuple of the requested columns."""
+        ids = seed(5)
+        rows = list(AddressRepository().iter_all(batch_size=2, columns=["id", "address"]))
+
+        assert [row.id for row in rows] == ids
+        assert tuple(rows[0]) == (ids[0], "Street 0, Paris")
+
+    def test_one_query_per_batch(self, temp_database):
+        """Test rows are read by keyset, one query per batch, resuming after `after_id`."""
+        ids = seed(6)
+        selects = count_selects(temp_database)
+
+        rows = list(AddressRepository().iter_all(batch_size=2, after_id=ids[0]))
+        assert [row.id for row in rows] == ids[1:]
+        assert len(selects) == 3
+        assert all("LIMIT" in select for select in selects)
+
+    def test_no_connection_held_between_rows(self, temp_database):
+        """Test a paused consumer holds no pooled connection."""
+        seed(3)
+        rows = AddressRepository().iter_all(batch_size=2)
+        next(rows)
+        assert temp_database.engine.pool.checkedout() == 0
+        assert len(list(rows)) == 2
+
+    def test_memory_stays_flat(self, temp_database):
+        """Test peak memory does not grow with the number of rows streamed."""
+        seed(8000)
+        repository = AddressRepository()
+        small = peak_memory(repository.iter_all(batch_size=500, after_id=6000))
+        large = peak_memory(repository.iter_all(batch_size=500))
+
+        assert large < small * 1.5
+
+
+class TestIterByIds:
+    """Test suite for AddressRepository.iter_by_ids."""
+
+    def test_only_known_ids_in_id_order(self, temp_database):
+        """Test requested rows come back once each, in id order; unknown ids are skipped."""
+        ids = seed(5)
+        rows = AddressRepository().iter_by_ids([ids[3], 999999, ids[1], ids[3]], columns=["id"])
+        assert [row.id for row in rows] == [ids[1], ids[3]]
+
+    def test_ids_are_batched(self, temp_database):
+        """Test ids are sent `batch_size` per IN list, skipping those up to `after_id`."""
+        ids = seed(5)
+        selects = count_selects(temp_database)
+
+        rows = list(AddressRepository().iter_by_ids(ids, batch_size=2, after_id=ids[0]))
+        assert [row.id for row in rows] == ids[1:]
+        assert len(selects) == 2
+
+    def test_more_ids_than_bound_parameters(self, temp_database):
+        """Test an id list longer than SQLite allows in one statement is read in batches."""
+        ids = seed(3)
+        states = AddressRepository().iter_refresh_states(ids=list(range(1, 40_000)))
+        assert [state.id for state in states] == ids
+
+
+class TestBulkJobsStream:
+    """Test suite for bulk jobs reading rows through the streaming iterators."""
+
+    def test_refresh_plan_streams(self, temp_database, mocker):
+        """Test a dry-run refresh scans the table in batches, not with one query."""
+        from application.services import AddressService
+
+        seed(5)
+        mocker.patch.object(AddressService, "PLAN_CHUNK_SIZE", 2)
+        selects = count_selects(temp_database)
+
+        assert AddressService().plan_refresh().total == 5
+        assert len(selects) == 3
@@ -0,0 +1,279 @@
+"""Tests for the in-process L1 in front of Redis and cross-process invalidation."""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+
+import pytest
+
+
+class FakeRedisServer:
+    """Keys and pub/sub channels shared by every FakeRedis connected to it."""
+
+    def __init__(self):
+        self.store: Dict[str, bytes] = {}
+        self.subscribers: Dict[str, List[queue.Queue]] = {}
+        self.lock = threading.Lock()
+
+
+class FakePubSub:
+    """The subset of redis-py's PubSub used by CacheInvalidator."""
+
+    def __init__(self, server: FakeRedisServer):
+        self._server = server
+        self._inbox: queue.Queue = queue.Queue()
+        self._channels: List[str] = []
+
+    def subscribe(self, channel: str) -> None:
+        with self._server.lock:
+            self._server.subscribers.setdefault(channel, []).append(self._inbox)
+        self._channels.append(channel)
+
+    def get_message(self, timeout: float):
+        try:
+            return {"type": "message", "data": self._inbox.get(timeout=timeout)}
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        with self._server.lock:
+            for channel in self._channels:
+                self._server.subscribers[channel].remove(self._inbox)
+
+
+class FakePipeline:
+    """Buffers commands and runs them on execute."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands: List[Callable[[], None]] = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, name)
+        return lambda *args: self._commands.append(lambda: command(*args))
+
+    def execute(self) -> None:
+        for command in self._commands:
+            command()
+
+
+class FakeRedis:
+    """The subset of the redis-py client used by CacheClient; counts round trips."""
+
+    def __init__(self, server: FakeRedisServer):
+        self._server = server
+        self.reads = 0
+
+    def get(self, key: str):
+        self.reads += 1
+        return self._server.store.get(key)
+
+    def mget(self, keys: List[str]):
+        self.reads += 1
+        return [self._server.store.get(key) for key in keys]
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self._server.store[key] = value
+
+    def set(self, key: str, value: str, nx: bool = False, px: int = 0) -> bool:
+        with self._server.lock:
+            if nx and key in self._server.store:
+                return False
+            self._server.store[key] = value.encode()
+            return True
+
+    def delete(self, key: str) -> None:
+        self._server.store.pop(key, None)
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._server.lock:
+            inboxes = list(self._server.subscribers.get(channel, []))
+        for inbox in inboxes:
+            inbox.put(message.encode())
+
+    def info(self) -> dict:
+        return {"used_memory": sum(len(value) for value in self._server.store.values())}
+
+    def dbsize(self) -> int:
+        return len(self._server.store)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        return FakePubSub(self._server)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Wait until `condition` holds, failing after `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Two cache clients, as in two worker processes, sharing one Redis."""
+    from config import settings
+    from infrastructure.cache import CacheClient
+    from infrastructure.cache.invalidation import CacheInvalidator
+
+    monkeypatch.setattr(settings, "cache_invalidation_channel", "test:invalidate")
+    monkeypatch.setattr(CacheInvalidator, "RECONNECT_DELAY", 0.05)
+    server = FakeRedisServer()
+    clients = []
+    for _ in range(2):
+        client = CacheClient()
+        client._use_redis(FakeRedis(server))
+        clients.append(client)
+    # Both listeners must be subscribed before anything is published
+    wait_for(lambda: len(server.subscribers.get("test:invalidate", [])) == 2)
+    yield clients
+    for client in clients:
+        client._invalidator.stop()
+
+
+class TestTieredCache:
+    """Test suite for CacheClient with Redis behind an in-process L1."""
+
+    def test_hot_reads_skip_redis(self, workers):
+        """Test a repeated read is served by L1 without a round trip."""
+        first, _ = workers
+        first.set("address:1", "body")
+        first.get("address:1")
+        first.get_many(["address:1"])
+
+        assert first._redis.reads == 0
+        assert first.stats()["l1"].hits == 2
+
+    def test_write_invalidates_other_workers(self, workers):
+        """Test a write by one worker drops the key from every other worker's L1."""
+        first, second = workers
+        first.set("address:1", "old")
+        assert second.get("address:1") == "old"
+        assert second._memory_cache.get("address:1") == "old"
+
+        first.set("address:1", "new")
+        wait_for(lambda: second._memory_cache.get("address:1") is None)
+        assert second.get("address:1") == "new"
+        assert first._memory_cache.get("address:1") == "new"
+
+    def test_delete_invalidates_other_workers(self, workers):
+        """Test a delete by one worker drops the key from every other worker's L1."""
+        first, second = workers
+        first.set_many({"a": "1", "b": "2"})
+        assert second.get_many(["a", "b"]) == {"a": "1", "b": "2"}
+
+        first.delete("a")
+        wait_for(lambda: second._memory_cache.get("a") is None)
+        assert second.get_many(["a", "b"]) == {"b": "2"}
+
+    def test_invalidation_during_read_skips_l1(self, workers, monkeypatch):
+        """Test a value read while an invalidation arrives is not kept in L1."""
+        _, second = workers
+        second._redis._server.store["key"] = b"maybe stale"
+        original_get = second._redis.get
+
+        def get_racing_a_write(key):
+            value = original_get(key)
+            second._invalidate_l1([key])
+            return value
+
+        monkeypatch.setattr(second._redis, "get", get_racing_a_write)
+        assert second.get("key") == "maybe stale"
+        assert second._memory_cache.get("key") is None
+
+    def test_l1_entries_expire_after_l1_ttl(self, workers, monkeypatch):
+        """Test L1 keeps entries no longer than cache_l1_ttl, whatever their TTL."""
+        from config import settings
+        from infrastructure.cache import client as cache_module
+
+        first, _ = workers
+        monkeypatch.setattr(settings, "cache_l1_ttl", 5)
+        now = time.monotonic()
+        first.set("key", "value", ttl=3600)
+
+        later = type("Clock", (), {"monotonic": staticmethod(lambda: now + 6)})
+        monkeypatch.setattr(cache_module, "time", later)
+        assert first._memory_cache.get("key") is None
+
+    def test_resubscribe_clears_l1(self, workers):
+        """Test L1 is emptied when invalidations may have been missed."""
+        first, _ = workers
+        first.set("key", "value")
+        first._invalidator._on_reset()
+        assert first._memory_cache.get("key") is None
+        assert first.get("key") == "value"
+
+    def test_per_tier_hit_ratio(self, workers):
+        """Test reads are attributed to the tier that answered them."""
+        first, second = workers
+        first.set("key", "value")
+        second.get("key")
+        second.get("key")
+        second.get("missing")
+
+        tiers = second.stats()
+        assert (tiers["l1"].hits, tiers["l1"].misses) == (1, 2)
+        assert (tiers["l2"].hits, tiers["l2"].misses) == (1, 1)
+        assert tiers["l2"].hit_ratio == 0.5
+
+    def test_async_round_trips_leave_the_loop_free(self, workers, monkeypatch):
+        """Test the async methods wait for Redis off the event loop and keep L1 in step."""
+        first, second = workers
+        original_get = second._redis.get
+
+        def slow_get(key):
+            time.sleep(0.2)
+            return original_get(key)
+
+        monkeypatch.setattr(second._redis, "get", slow_get)
+
+        async def read_while_ticking():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            await first.aset_many({"key": "value", "other": "1"})
+            ticker = asyncio.create_task(tick())
+            value = await second.aget("key")
+            ticker.cancel()
+            await first.adelete("other")
+            return value, ticks
+
+        value, ticks = asyncio.run(read_while_ticking())
+        assert value == "value"
+        assert ticks >= 5
+        assert second._memory_cache.get("key") == "value"
+        wait_for(lambda: second.get_many(["other"]) == {})
+
+    def test_async_get_or_compute_leaves_the_loop_free(self, workers, monkeypatch):
+        """Test the lookup, lease and store of aget_or_compute reach Redis from worker threads."""
+        _, worker = workers
+        threads = []
+        for name in ("get", "mget", "set", "setex", "delete"):
+            def on_thread(*args, command=getattr(worker._redis, name), **kwargs):
+                threads.append(threading.get_ident())
+                return command(*args, **kwargs)
+
+            monkeypatch.setattr(worker._redis, name, on_thread)
+
+        async def compute():
+            return "computed"
+
+        async def miss_then_hit():
+            computed = await worker.aget_or_compute("key", compute)
+            worker._memory_cache.clear()  # The second read goes to Redis
+            return computed, await worker.aget_or_compute("key", compute)
+
+        assert asyncio.run(miss_then_hit()) == ("computed", "computed")
+        assert len(threads) >= 5
+        assert threading.get_ident() not in threads
+        assert "key:lease" not in worker._redis._server.store
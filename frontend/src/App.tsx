@@ -1,8 +1,9 @@
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import React, { useState } from "react";
-import { fetchAddresses, refreshAddresses } from "./api";
+import { fetchAddresses, fetchAddressesByIds, refreshAddresses } from "./api";
 import { AddressModal } from "./components/AddressModal";
 import { AddressTable } from "./components/AddressTable";
+import type { PaginatedAddresses } from "./types";
 
 const App: React.FC = () => {
   const [selectedIds, setSelectedIds] = useState<number[]>([]);
@@ -55,10 +56,26 @@ const App: React.FC = () => {
     });
   };
 
+  // Re-fetch only the refreshed rows and swap them into the loaded page
   const handleRefreshSelected = async () => {
+    const ids = selectedIds;
     refreshAddressesMutation
-      .mutateAsync({ ids: selectedIds })
-      .then(() => refreshPage());
+      .mutateAsync({ ids })
+      .then(() => fetchAddressesByIds(ids))
+      .then((refreshed) => {
+        const byId = new Map(refreshed.map((address) => [address.id, address]));
+        queryClient.setQueryData<PaginatedAddresses>(
+          ["addresses", "list"],
+          (page) =>
+            page && {
+              ...page,
+              items: page.items.map((address) => byId.get(address.id) ?? address),
+            }
+        );
+        ids.forEach((id) =>
+          queryClient.invalidateQueries({ queryKey: ["addresses", "detail", id] })
+        );
+      });
   };
 
   const handleRefreshAll = async () => {
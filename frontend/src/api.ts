@@ -1,4 +1,4 @@
-import type { Address, PaginatedAddresses } from "./types";
+import type { Address, Job, PaginatedAddresses } from "./types";
 
 const API_BASE =
   import.meta.env.VITE_API_BASE_URL?.replace(/\/$/, "") ?? "http://localhost:8000";
@@ -36,6 +36,15 @@ export async function fetchAddress(id: number): Promise<Address> {
   return res.json();
 }
 
+export async function fetchAddressesByIds(ids: number[]): Promise<Address[]> {
+  const res = await fetch(`${API_BASE}/addresses?ids=${ids.join(",")}`);
+  if (!res.ok) {
+    throw new Error("Failed to fetch addresses");
+  }
+  const page: PaginatedAddresses = await res.json();
+  return page.items;
+}
+
 export async function createAddress(input: {
   address: string;
 }): Promise<Address> {
@@ -52,9 +61,19 @@ export async function createAddress(input: {
   return res.json();
 }
 
+export async function fetchJob(id: string): Promise<Job> {
+  const res = await fetch(`${API_BASE}/jobs/${id}`);
+  if (!res.ok) {
+    throw new Error("Failed to fetch job");
+  }
+  return res.json();
+}
+
+const JOB_POLL_INTERVAL_MS = 1000;
+
 export async function refreshAddresses(input: {
   ids: number[] | null;
-}): Promise<Address[]> {
+}): Promise<Job> {
   const res = await fetch(`${API_BASE}/addresses/refresh`, {
     method: "POST",
     headers: {
@@ -65,5 +84,15 @@ export async function refreshAddresses(input: {
   if (!res.ok) {
     throw new Error("Failed to refresh addresses");
   }
-  return res.json();
+
+  // Refresh runs as a background job; resolve once it has finished
+  let job: Job = await res.json();
+  while (job.status === "queued" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    job = await fetchJob(job.id);
+  }
+  if (job.status !== "succeeded") {
+    throw new Error(`Refresh ${job.status}: ${job.error ?? ""}`);
+  }
+  return job;
 }
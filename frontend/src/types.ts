@@ -3,12 +3,30 @@ export interface Address {
   address: string;
   matched_address: string;
   match_score: number;
+  version: number;
+  score_method: string | null;
+  score_version: string | null;
+  geocoded_at: string | null;
 }
 
 export interface PaginatedAddresses {
   items: Address[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   per_page: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null;
+  prev_cursor: string | null;
+}
+
+export type JobStatus = "queued" | "running" | "succeeded" | "failed" | "cancelled";
+
+export interface Job {
+  id: string;
+  kind: string;
+  status: JobStatus;
+  total: number | null;
+  processed: number;
+  progress: number;
+  error: string | null;
 }